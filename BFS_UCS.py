@@ -3,25 +3,56 @@ from enum import Enum
 from collections import defaultdict, deque 
 from typing import Dict, List, Set, Optional, Tuple 
 import heapq 
+from CSR_Graph import CSRGraph, set_edge_weight
+from Contraction_Hierarchy import ContractionHierarchy
+from Path_Cache import ShortestPathCache
+from Priority_Queues import QueueType, make_queue
+from Search_Stats import SearchStats
+from Search_Workspace import SearchWorkspace
+from Vectorized_BFS import vectorized_bfs
  
 class SearchType(Enum): 
     BFS = "bfs" 
     UCS = "ucs" 
+    BIBFS = "bibfs"
+    BIUCS = "biucs"
+    BFS_VECTOR = "bfs_vector"
  
 class Graph: 
     def __init__(self, num_nodes: int): 
         self.num_nodes = num_nodes 
         self.graph = defaultdict(list) 
+        self.version = 0
+        self.reverse_graph = defaultdict(list)
      
     def add_edge(self, u: int, v: int, weight: float): 
         self.graph[u].append((v, weight)) 
+        self.version += 1
+        self.reverse_graph[v].append((u, weight))
+
+    def update_edge(self, u: int, v: int, weight: float):
+        """Set the weight of every u -> v edge, adding one if there is none"""
+        set_edge_weight(self.graph[u], v, weight)
+        set_edge_weight(self.reverse_graph[v], u, weight)
+        self.version += 1
      
     def validate_node(self, node: int) -> bool: 
         return 0 <= node < self.num_nodes 
+
+    def to_csr(self) -> CSRGraph:
+        """Pack the adjacency lists into flat CSR arrays; the result works with every search here"""
+        return CSRGraph.from_graph(self)
  
 class SearchAlgorithms: 
-    def __init__(self): 
+    def __init__(self, path_cache: Optional[ShortestPathCache] = None,
+                 hierarchy: Optional[ContractionHierarchy] = None, stats: Optional[SearchStats] = None,
+                 workspace: Optional[SearchWorkspace] = None):
         self.path: Dict[int, Tuple[int, float]] = {}   
+        self.path_cache = path_cache
+        self.hierarchy = hierarchy
+        self.queue = None
+        self.stats = stats
+        self.workspace = workspace
      
     def reconstruct_path(self, start: int, target: int) -> Tuple[List[int], float]: 
         """Reconstruct path from start to target using stored parent pointers""" 
@@ -43,9 +74,23 @@ class SearchAlgorithms:
          
         path.reverse() 
         return path if path[0] == start else None, total_weight 
+
+    def _finish(self, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """reconstruct_path, timed as its own phase when stats are on"""
+        if self.stats is None:
+            return self.reconstruct_path(start, target)
+        self.stats.lap("search")
+        result = self.reconstruct_path(start, target)
+        self.stats.lap("reconstruct")
+        return result
  
     def bfs(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]: 
         """Breadth-First Search implementation""" 
+        stats = self.stats
+        if stats is not None:
+            stats.reset()
+        if self.workspace is not None:
+            return self._bfs_in_workspace(graph, start, target)
         self.path = {start: (None, 0.0)} 
         queue = deque([start]) 
         visited = {start} 
@@ -54,19 +99,88 @@ class SearchAlgorithms:
             current = queue.popleft() 
              
             if current == target: 
-                return self.reconstruct_path(start, target) 
+                return self._finish(start, target)
              
+            if stats is not None:
+                stats.expand(current, len(queue) + 1)
             for neighbor, weight in graph.graph[current]: 
                 if neighbor not in visited: 
                     visited.add(neighbor) 
                     queue.append(neighbor) 
                     self.path[neighbor] = (current, weight) 
+                    if stats is not None:
+                        stats.relax(neighbor, current, weight)
          
+        if stats is not None:
+            stats.lap("search")
         return None, 0.0 
+
+    def _bfs_in_workspace(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """bfs on the workspace's stamped arrays; self.path becomes a view of them"""
+        workspace = self.workspace
+        stats = self.stats
+        epoch = workspace.begin(graph.num_nodes)
+        seen, parent, weights = workspace.seen, workspace.parent, workspace.weight
+        self.path = workspace.parents
+        seen[start], parent[start], weights[start] = epoch, -1, 0.0
+        # a list read from a moving head instead of a deque, so it can be kept between queries
+        queue = workspace.queue
+        queue.append(start)
+        head = 0
+
+        while head < len(queue):
+            current = queue[head]
+            head += 1
+
+            if current == target:
+                return self._finish(start, target)
+
+            if stats is not None:
+                stats.expand(current, len(queue) - head + 1)
+            for neighbor, weight in graph.graph[current]:
+                if seen[neighbor] != epoch:
+                    seen[neighbor] = epoch
+                    parent[neighbor] = current
+                    weights[neighbor] = weight
+                    queue.append(neighbor)
+                    if stats is not None:
+                        stats.relax(neighbor, current, weight)
+
+        if stats is not None:
+            stats.lap("search")
+        return None, 0.0
  
-    def ucs(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]: 
-        """Uniform Cost Search implementation""" 
+    def ucs(self, graph: Graph, start: int, target: int,
+            queue_type: Optional[QueueType] = None) -> Tuple[Optional[List[int]], float]:
+        """Uniform Cost Search implementation; answered from path_cache when one is set.
+
+        A contraction hierarchy answers instead while it still matches graph (same object,
+        no edges added since it was built). queue_type picks a Priority_Queues queue (kept
+        afterwards in self.queue for its size and stale-pop counts); None runs the inline
+        heapq loop below. Stats count only what this method expands itself, so a hierarchy or
+        cache answer shows up as time with nothing expanded. A workspace replaces the inline
+        loop's dicts and set; queue_type queues keep their own.
+        """
+        stats = self.stats
+        if stats is not None:
+            stats.reset()
+        if self.hierarchy is not None and self.hierarchy.matches(graph):
+            self.path = {start: (None, 0.0)}
+            for u, v, weight in self.hierarchy.query_edges(start, target) or ():
+                self.path[v] = (u, weight)
+            return self._finish(start, target)
+        if self.path_cache is not None:
+            result = self.path_cache.query(graph, start, target)
+            self.path = self.path_cache.parents(graph, start)
+            if stats is not None:
+                stats.lap("cache")
+            return result
+        if queue_type is not None:
+            return self._ucs_with_queue(graph, start, target, make_queue(queue_type))
+        if self.workspace is not None:
+            return self._ucs_in_workspace(graph, start, target)
         self.path = {start: (None, 0.0)} 
+        costs = {start: 0.0}
         priority_queue = [(0, start)]   
         visited = set() 
          
@@ -74,30 +188,223 @@ class SearchAlgorithms:
             total_cost, current = heapq.heappop(priority_queue) 
              
             if current in visited: 
+                if stats is not None:
+                    stats.stale_pops += 1
                 continue 
                  
             visited.add(current) 
              
             if current == target: 
-                return self.reconstruct_path(start, target) 
+                return self._finish(start, target)
              
+            if stats is not None:
+                stats.expand(current, len(priority_queue) + 1)
             for neighbor, weight in graph.graph[current]: 
                 if neighbor not in visited: 
                     new_cost = total_cost + weight 
-                    if neighbor not in self.path or new_cost < self.path[neighbor][1]: 
+                    if neighbor not in costs or new_cost < costs[neighbor]:
+                        costs[neighbor] = new_cost
                         self.path[neighbor] = (current, weight) 
                         heapq.heappush(priority_queue, (new_cost, neighbor)) 
+                        if stats is not None:
+                            stats.relax(neighbor, current, weight)
          
+        if stats is not None:
+            stats.lap("search")
         return None, 0.0 
      
-    def search(self, search_type: SearchType, graph: Graph, start: int, target: int) -> 
-Tuple[Optional[List[int]], float]: 
+    def _ucs_in_workspace(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """The inline ucs loop on the workspace's stamped arrays and reused heap list"""
+        workspace = self.workspace
+        stats = self.stats
+        epoch = workspace.begin(graph.num_nodes)
+        seen, done, parent, weights, costs = (workspace.seen, workspace.done, workspace.parent,
+                                              workspace.weight, workspace.cost)
+        self.path = workspace.parents
+        seen[start], parent[start], weights[start], costs[start] = epoch, -1, 0.0, 0.0
+        priority_queue = workspace.heap
+        priority_queue.append((0, start))
+
+        while priority_queue:
+            total_cost, current = heapq.heappop(priority_queue)
+
+            if done[current] == epoch:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+
+            done[current] = epoch
+
+            if current == target:
+                return self._finish(start, target)
+
+            if stats is not None:
+                stats.expand(current, len(priority_queue) + 1)
+            for neighbor, weight in graph.graph[current]:
+                if done[neighbor] != epoch:
+                    new_cost = total_cost + weight
+                    if seen[neighbor] != epoch or new_cost < costs[neighbor]:
+                        seen[neighbor] = epoch
+                        costs[neighbor] = new_cost
+                        parent[neighbor] = current
+                        weights[neighbor] = weight
+                        heapq.heappush(priority_queue, (new_cost, neighbor))
+                        if stats is not None:
+                            stats.relax(neighbor, current, weight)
+
+        if stats is not None:
+            stats.lap("search")
+        return None, 0.0
+
+    def _ucs_with_queue(self, graph: Graph, start: int, target: int, queue) -> Tuple[Optional[List[int]], float]:
+        """ucs over a queue that handles decrease-key itself, so every pop is a live node"""
+        stats = self.stats
+        self.path = {start: (None, 0.0)}
+        self.queue = queue
+        costs = {start: 0.0}
+        visited = set()
+        queue.push(start, 0)
+
+        while queue:
+            total_cost, current = queue.pop()
+            visited.add(current)
+
+            if current == target:
+                return self._finish(start, target)
+
+            if stats is not None:
+                stats.expand(current, len(queue) + 1)
+            for neighbor, weight in graph.graph[current]:
+                if neighbor not in visited:
+                    new_cost = total_cost + weight
+                    if neighbor not in costs or new_cost < costs[neighbor]:
+                        costs[neighbor] = new_cost
+                        self.path[neighbor] = (current, weight)
+                        queue.push(neighbor, new_cost)
+                        if stats is not None:
+                            stats.relax(neighbor, current, weight)
+
+        if stats is not None:
+            stats.lap("search")
+        return None, 0.0
+
+    def _join_paths(self, start: int, meet: int, successors: Dict[int, Tuple[int, float]]) -> Tuple[List[int], float]:
+        """Forward parent pointers up to meet, then backward successor pointers on to the target"""
+        path, total_weight = self.reconstruct_path(start, meet)
+        current = meet
+        while successors[current][0] is not None:
+            current, weight = successors[current]
+            path.append(current)
+            total_weight += weight
+        return path, total_weight
+
+    def _reverse_index(self, graph: Graph):
+        reverse_graph = getattr(graph, "reverse_graph", None)
+        if reverse_graph is None:
+            raise ValueError("Bidirectional search needs a graph with a reverse adjacency index")
+        return reverse_graph
+
+    def bidirectional_bfs(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """Breadth-First Search from both ends, one whole level at a time on the smaller frontier.
+
+        A level that touches the other side is finished before stopping, so the returned path
+        has the fewest edges, same as bfs.
+        """
+        reverse_graph = self._reverse_index(graph)
+        self.path = {start: (None, 0.0)}
+        if start == target:
+            return self.reconstruct_path(start, target)
+        successors = {target: (None, 0.0)}
+        forward, backward = [start], [target]
+        forward_depth = {start: 0}
+        backward_depth = {target: 0}
+
+        while forward and backward:
+            if len(forward) <= len(backward):
+                frontier, adjacency, parents, depth, other_depth = forward, graph.graph, self.path, forward_depth, backward_depth
+            else:
+                frontier, adjacency, parents, depth, other_depth = backward, reverse_graph, successors, backward_depth, forward_depth
+            next_frontier = []
+            best_hops, meet = None, None
+            for current in frontier:
+                for neighbor, weight in adjacency[current]:
+                    if neighbor not in depth:
+                        depth[neighbor] = depth[current] + 1
+                        parents[neighbor] = (current, weight)
+                        next_frontier.append(neighbor)
+                    if neighbor in other_depth:
+                        hops = depth[neighbor] + other_depth[neighbor]
+                        if best_hops is None or hops < best_hops:
+                            best_hops, meet = hops, neighbor
+            if meet is not None:
+                return self._join_paths(start, meet, successors)
+            if frontier is forward:
+                forward = next_frontier
+            else:
+                backward = next_frontier
+
+        return None, 0.0
+
+    def bidirectional_ucs(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """Uniform Cost Search from both ends, always advancing the side with the cheaper queue head.
+
+        Stops once the two queue heads together cost at least the best meeting found so far,
+        at which point no unexplored path can beat it.
+        """
+        reverse_graph = self._reverse_index(graph)
+        self.path = {start: (None, 0.0)}
+        successors = {target: (None, 0.0)}
+        forward_costs = {start: 0.0}
+        backward_costs = {target: 0.0}
+        forward_queue = [(0.0, start)]
+        backward_queue = [(0.0, target)]
+        forward_done, backward_done = set(), set()
+        best_cost = 0.0 if start == target else float('inf')
+        meet = start if start == target else None
+
+        while forward_queue and backward_queue:
+            if forward_queue[0][0] + backward_queue[0][0] >= best_cost:
+                break
+            if forward_queue[0][0] <= backward_queue[0][0]:
+                queue, adjacency, parents, costs, done, other_costs = forward_queue, graph.graph, self.path, forward_costs, forward_done, backward_costs
+            else:
+                queue, adjacency, parents, costs, done, other_costs = backward_queue, reverse_graph, successors, backward_costs, backward_done, forward_costs
+
+            total_cost, current = heapq.heappop(queue)
+            if current in done:
+                continue
+            done.add(current)
+
+            for neighbor, weight in adjacency[current]:
+                if neighbor in done:
+                    continue
+                new_cost = total_cost + weight
+                if neighbor not in costs or new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = (current, weight)
+                    heapq.heappush(queue, (new_cost, neighbor))
+                if neighbor in other_costs and costs[neighbor] + other_costs[neighbor] < best_cost:
+                    best_cost = costs[neighbor] + other_costs[neighbor]
+                    meet = neighbor
+
+        if meet is None:
+            return None, 0.0
+        return self._join_paths(start, meet, successors)
+
+    def search(self, search_type: SearchType, graph: Graph, start: int, target: int,
+               queue_type: Optional[QueueType] = None) -> Tuple[Optional[List[int]], float]:
         """Switch-case style method to select and execute the appropriate search algorithm""" 
         match search_type: 
             case SearchType.BFS: 
                 return self.bfs(graph, start, target) 
             case SearchType.UCS: 
-                return self.ucs(graph, start, target) 
+                return self.ucs(graph, start, target, queue_type)
+            case SearchType.BIBFS:
+                return self.bidirectional_bfs(graph, start, target)
+            case SearchType.BIUCS:
+                return self.bidirectional_ucs(graph, start, target)
+            case SearchType.BFS_VECTOR:
+                return vectorized_bfs(graph, start, target)
             case _: 
                 raise ValueError("Invalid search type") 
  
@@ -117,10 +424,8 @@ def main():
      
     g = Graph(num_nodes) 
      
-    start_node = get_valid_input(f"Enter the start node (0-{num_nodes-1}): ", 0, num_nodes
-1) 
-    target_node = get_valid_input(f"Enter the target node (0-{num_nodes-1}): ", 0, 
-num_nodes-1) 
+    start_node = get_valid_input(f"Enter the start node (0-{num_nodes-1}): ", 0, num_nodes-1) 
+    target_node = get_valid_input(f"Enter the target node (0-{num_nodes-1}): ", 0, num_nodes-1) 
      
     num_edges = get_valid_input("Enter the number of edges: ", 0, num_nodes * (num_nodes - 1)) 
      
@@ -149,11 +454,13 @@ num_nodes-1)
     print("\nSelect search algorithm:") 
     print("1. BFS") 
     print("2. UCS") 
+    print("3. Bidirectional BFS")
+    print("4. Bidirectional UCS")
      
-    algo_choice = get_valid_input("Enter your choice (1-2): ", 1, 2) 
+    algo_choice = get_valid_input("Enter your choice (1-4): ", 1, 4)
      
     searcher = SearchAlgorithms() 
-    search_type = SearchType(["bfs", "ucs"][algo_choice - 1]) 
+    search_type = SearchType(["bfs", "ucs", "bibfs", "biucs"][algo_choice - 1])
      
     try: 
         path, total_weight = searcher.search(search_type, g, start_node, target_node) 
@@ -0,0 +1,96 @@
+#Parallel batch queries over shared-memory graphs
+import importlib
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from CSR_Graph import CSRGraph, NODE_TYPECODE, OFFSET_TYPECODE, WEIGHT_TYPECODE
+
+# set in each worker by _attach_worker
+_worker_graph: Optional[CSRGraph] = None
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+
+class SharedGraph:
+    """Copies a graph's CSR arrays into shared memory blocks that worker processes map by name"""
+
+    def __init__(self, graph):
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_graph(graph)
+        self.num_nodes = graph.num_nodes
+        self.blocks: List[shared_memory.SharedMemory] = []
+        self.layout: List[Optional[Tuple[str, str, int]]] = []
+        for typecode, data in ((OFFSET_TYPECODE, graph.offsets), (NODE_TYPECODE, graph.targets),
+                               (WEIGHT_TYPECODE, graph.weights), (WEIGHT_TYPECODE, graph.heuristics)):
+            if data is None:
+                self.layout.append(None)
+                continue
+            data = array(typecode, data)
+            block = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+            block.buf[:len(data) * data.itemsize] = data.tobytes()
+            self.blocks.append(block)
+            self.layout.append((block.name, typecode, len(data)))
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _attach_worker(num_nodes: int, layout):
+    global _worker_graph
+    sections = []
+    for entry in layout:
+        if entry is None:
+            sections.append(None)
+            continue
+        name, typecode, length = entry
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        sections.append(block.buf[:length * array(typecode).itemsize].cast(typecode))
+    _worker_graph = CSRGraph(num_nodes, *sections)
+
+
+def _run_query(module_name: str, type_value: str, start: int, target: int, kwargs: dict):
+    module = importlib.import_module(module_name)
+    search_type = module.SearchType(type_value)
+    return start, target, module.SearchAlgorithms().search(search_type, _worker_graph, start, target, **kwargs)
+
+
+def _run_chunk(module_name: str, type_value: str, pairs: List[Tuple[int, int]], kwargs: dict):
+    return [_run_query(module_name, type_value, start, target, kwargs) for start, target in pairs]
+
+
+def search_many(search_type, graph, pairs: Iterable[Tuple[int, int]], processes: Optional[int] = None,
+                chunk_size: int = 16, **kwargs) -> Iterator[Tuple[int, int, Tuple[Optional[List[int]], float]]]:
+    """Answer many (start, target) queries across a process pool, yielding results as they finish.
+
+    search_type is a SearchType member from BFS_UCS, DFS_DLS_DFID or GBFS_Astar; the matching
+    SearchAlgorithms.search runs in the workers with any extra kwargs (depth_limit, max_depth).
+    The graph is placed in shared memory once and every worker attaches to it, so tasks only
+    carry node ids. Yields (start, target, (path, total_weight)) in completion order.
+    """
+    module_name = type(search_type).__module__
+    pairs = list(pairs)
+    processes = processes or os.cpu_count() or 1
+    with SharedGraph(graph) as shared:
+        executor = ProcessPoolExecutor(max_workers=processes, initializer=_attach_worker,
+                                       initargs=(shared.num_nodes, shared.layout))
+        try:
+            futures = [executor.submit(_run_chunk, module_name, search_type.value,
+                                       pairs[i:i + chunk_size], kwargs)
+                       for i in range(0, len(pairs), chunk_size)]
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            # a caller that stops iterating early should not wait for the remaining queries
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,207 @@
+#CSR Graph
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+NODE_TYPECODE = "i"
+OFFSET_TYPECODE = "q"
+WEIGHT_TYPECODE = "d"
+
+
+def _zeros(typecode: str, length: int) -> array:
+    return array(typecode, bytes(array(typecode).itemsize * length))
+
+
+def set_edge_weight(edges: List[Tuple[int, float]], node: int, weight: float):
+    """Set the weight of every (node, _) pair in an adjacency list, appending one if there is none"""
+    found = False
+    for i, (neighbor, _) in enumerate(edges):
+        if neighbor == node:
+            edges[i] = (node, weight)
+            found = True
+    if not found:
+        edges.append((node, weight))
+
+
+class CSRAdjacency:
+    """Read-only view that makes graph.graph[u] yield (v, weight) pairs like the defaultdict graphs"""
+
+    def __init__(self, csr: "CSRGraph"):
+        self.csr = csr
+
+    def __getitem__(self, u: int) -> Iterator[Tuple[int, float]]:
+        csr = self.csr
+        if not 0 <= u < csr.num_nodes:
+            return iter(())
+        lo = csr.offsets[u]
+        hi = csr.offsets[u + 1]
+        return zip(csr.targets[lo:hi], csr.weights[lo:hi])
+
+    def __contains__(self, u: int) -> bool:
+        return 0 <= u < self.csr.num_nodes
+
+    def __len__(self) -> int:
+        return self.csr.num_nodes
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.csr.num_nodes))
+
+
+class CSRGraph:
+    """Compressed sparse row graph: flat offset, target and weight arrays instead of per-edge tuples.
+
+    offsets[u]:offsets[u + 1] is the slice of targets/weights holding the out-edges of u,
+    in the same order they were added. Any object supporting len(), indexing and slicing
+    works as a backing store (array, memoryview over an mmap, NumPy array).
+    """
+
+    def __init__(self, num_nodes: int, offsets, targets, weights, heuristics=None):
+        if len(offsets) != num_nodes + 1:
+            raise ValueError("offsets must have num_nodes + 1 entries")
+        if len(targets) != len(weights) or offsets[num_nodes] != len(targets):
+            raise ValueError("targets and weights must both hold offsets[-1] entries")
+        self.num_nodes = num_nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.heuristics = heuristics
+        self.graph = CSRAdjacency(self)
+        self.version = 0
+        self.edge_ids = None
+        self._reverse: Optional["CSRGraph"] = None
+
+    @classmethod
+    def from_graph(cls, graph) -> "CSRGraph":
+        """Convert any of the defaultdict based Graph classes into CSR form"""
+        builder = CSRGraphBuilder(graph.num_nodes)
+        for u in sorted(graph.graph):
+            for v, weight in graph.graph[u]:
+                builder.add_edge(u, v, weight)
+        for node, value in getattr(graph, "heuristics", {}).items():
+            builder.set_heuristic(node, value)
+        return builder.build()
+
+    @property
+    def reverse_graph(self) -> CSRAdjacency:
+        """reverse_graph[v] yields (u, weight) for every edge u -> v, like Graph.reverse_graph"""
+        return self.reverse().graph
+
+    def reverse(self) -> "CSRGraph":
+        """Transposed graph, built once and cached.
+
+        edge_ids[j] on the result is the index in targets/weights of the forward edge that
+        reversed edge j came from, and in-edges of each node keep forward edge order.
+        """
+        if self._reverse is None:
+            n = self.num_nodes
+            m = self.num_edges
+            offsets = _zeros(OFFSET_TYPECODE, n + 1)
+            for v in self.targets:
+                offsets[v + 1] += 1
+            for v in range(n):
+                offsets[v + 1] += offsets[v]
+            sources = _zeros(NODE_TYPECODE, m)
+            weights = _zeros(WEIGHT_TYPECODE, m)
+            edge_ids = _zeros(OFFSET_TYPECODE, m)
+            position = offsets[:-1]
+            for u in range(n):
+                for i in range(self.offsets[u], self.offsets[u + 1]):
+                    v = self.targets[i]
+                    j = position[v]
+                    sources[j] = u
+                    weights[j] = self.weights[i]
+                    edge_ids[j] = i
+                    position[v] = j + 1
+            self._reverse = CSRGraph(n, offsets, sources, weights)
+            self._reverse.edge_ids = edge_ids
+        return self._reverse
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def validate_node(self, node: int) -> bool:
+        return 0 <= node < self.num_nodes
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbors(self, u: int) -> List[Tuple[int, float]]:
+        return list(self.graph[u])
+
+    def set_heuristic(self, node: int, value: float):
+        if self.heuristics is None:
+            self.heuristics = array(WEIGHT_TYPECODE, [float('inf')]) * self.num_nodes
+        self.heuristics[node] = value
+
+    def get_heuristic(self, node: int) -> float:
+        if self.heuristics is None:
+            return float('inf')
+        return self.heuristics[node]
+
+    def nbytes(self) -> int:
+        """Bytes held by the flat arrays (offsets, targets, weights and heuristics)"""
+        total = 0
+        for buffer in (self.offsets, self.targets, self.weights, self.heuristics):
+            if buffer is not None:
+                total += len(buffer) * memoryview(buffer).itemsize
+        return total
+
+
+class CSRGraphBuilder:
+    """Collects edges through add_edge like Graph does, then packs them into a CSRGraph"""
+
+    def __init__(self, num_nodes: int):
+        self.num_nodes = num_nodes
+        self.sources = array(NODE_TYPECODE)
+        self.targets = array(NODE_TYPECODE)
+        self.weights = array(WEIGHT_TYPECODE)
+        self.heuristics: Optional[array] = None
+
+    def add_edge(self, u: int, v: int, weight: float):
+        self.sources.append(u)
+        self.targets.append(v)
+        self.weights.append(weight)
+
+    def add_edges(self, sources: array, targets: array, weights: array):
+        """Append a whole chunk of already validated edges at once"""
+        self.sources.extend(sources)
+        self.targets.extend(targets)
+        self.weights.extend(weights)
+
+    def validate_node(self, node: int) -> bool:
+        return 0 <= node < self.num_nodes
+
+    def set_heuristic(self, node: int, value: float):
+        if self.heuristics is None:
+            self.heuristics = array(WEIGHT_TYPECODE, [float('inf')]) * self.num_nodes
+        self.heuristics[node] = value
+
+    def build(self) -> CSRGraph:
+        """Stable counting sort by source, so neighbor order matches insertion order"""
+        n = self.num_nodes
+        m = len(self.sources)
+        offsets = _zeros(OFFSET_TYPECODE, n + 1)
+        for u in self.sources:
+            if not 0 <= u < n:
+                raise ValueError(f"Nodes must be between 0 and {n-1}")
+            offsets[u + 1] += 1
+        if m and (min(self.targets) < 0 or max(self.targets) >= n):
+            raise ValueError(f"Nodes must be between 0 and {n-1}")
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        if all(self.sources[i] <= self.sources[i + 1] for i in range(m - 1)):
+            targets = array(NODE_TYPECODE, self.targets)
+            weights = array(WEIGHT_TYPECODE, self.weights)
+        else:
+            targets = _zeros(NODE_TYPECODE, m)
+            weights = _zeros(WEIGHT_TYPECODE, m)
+            position = offsets[:-1]
+            for u, v, weight in zip(self.sources, self.targets, self.weights):
+                i = position[u]
+                targets[i] = v
+                weights[i] = weight
+                position[u] = i + 1
+
+        heuristics = array(WEIGHT_TYPECODE, self.heuristics) if self.heuristics is not None else None
+        return CSRGraph(n, offsets, targets, weights, heuristics)
@@ -0,0 +1,337 @@
+#Contraction hierarchy for fast point-to-point UCS queries
+import heapq
+import mmap
+import struct
+import weakref
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from CSR_Graph import CSRGraph
+
+HIERARCHY_MAGIC = b"CHRC"
+HIERARCHY_VERSION = 1
+# magic, version, num_nodes, num_edges, upward edges, downward edges
+_HEADER = struct.Struct("<4sHxxqqqq")
+# middle node of an edge that is an original edge rather than a shortcut
+_ORIGINAL = -1
+
+
+def _as_csr(graph) -> CSRGraph:
+    return graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+
+
+def _edge_count(graph) -> int:
+    if isinstance(graph, CSRGraph):
+        return graph.num_edges
+    return sum(len(edges) for edges in graph.graph.values())
+
+
+def _witness_costs(out_edges: List[Dict], source: int, skip: int, targets: Dict, max_cost: float,
+                   max_settled: int) -> Dict[int, float]:
+    """Dijkstra from source that avoids skip, stopping once every target is settled, past
+    max_cost or after max_settled nodes"""
+    costs = {source: 0.0}
+    queue = [(0.0, source)]
+    settled = 0
+    remaining = len(targets)
+    while queue and settled < max_settled and remaining:
+        total_cost, current = heapq.heappop(queue)
+        if total_cost > costs[current]:
+            continue
+        if total_cost > max_cost:
+            break
+        settled += 1
+        if current in targets:
+            remaining -= 1
+        for neighbor, (weight, _) in out_edges[current].items():
+            if neighbor == skip:
+                continue
+            new_cost = total_cost + weight
+            if new_cost < costs.get(neighbor, float('inf')):
+                costs[neighbor] = new_cost
+                heapq.heappush(queue, (new_cost, neighbor))
+    return costs
+
+
+def _shortcuts(out_edges: List[Dict], in_edges: List[Dict], node: int,
+               max_settled: int) -> List[Tuple[int, int, float]]:
+    """(source, target, weight) shortcuts that contracting node needs to keep distances intact"""
+    outgoing, incoming = out_edges[node], in_edges[node]
+    if not outgoing or not incoming:
+        return []
+    max_out = max(weight for weight, _ in outgoing.values())
+    shortcuts = []
+    for source, (in_weight, _) in incoming.items():
+        costs = _witness_costs(out_edges, source, node, outgoing, in_weight + max_out, max_settled)
+        for target, (out_weight, _) in outgoing.items():
+            # a witness path no longer than the one via node makes the shortcut unnecessary
+            if target != source and costs.get(target, float('inf')) > in_weight + out_weight:
+                shortcuts.append((source, target, in_weight + out_weight))
+    return shortcuts
+
+
+def _pack(edge_lists: List[Dict]) -> Tuple[array, array, array, array]:
+    """CSR offsets, neighbors, weights and middle nodes of per-node {neighbor: (weight, middle)}"""
+    offsets = array('q', [0])
+    neighbors, weights, middles = array('i'), array('d'), array('i')
+    for edges in edge_lists:
+        for neighbor, (weight, middle) in edges.items():
+            neighbors.append(neighbor)
+            weights.append(weight)
+            middles.append(middle)
+        offsets.append(len(neighbors))
+    return offsets, neighbors, weights, middles
+
+
+class ContractionHierarchy:
+    """Shortest-path index that contracts nodes one by one, adding shortcuts to keep distances.
+
+    Every edge ends up stored at its lower-ranked endpoint: up_* holds edges u -> v with v
+    contracted after u, down_* holds edges u -> v with u contracted after v, indexed by v.
+    A query runs Dijkstra upward from both ends and meets at the highest node of the path;
+    shortcuts remember the node they bypass, so the path unpacks back into original edges.
+    """
+
+    def __init__(self, num_nodes: int, num_edges: int, up, down, graph=None):
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middles = up
+        self.down_offsets, self.down_sources, self.down_weights, self.down_middles = down
+        self._graph = None
+        self.version = 0
+        if graph is not None:
+            self.bind(graph)
+
+    @classmethod
+    def build(cls, graph, witness_limit: int = 64) -> "ContractionHierarchy":
+        """Contract nodes in lazily updated edge-difference order.
+
+        witness_limit caps the nodes settled per witness search; a smaller cap builds faster
+        but may add shortcuts that were not strictly needed (queries stay exact either way).
+        """
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        out_edges: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        in_edges: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        for u in range(n):
+            for v, weight in csr.graph[u]:
+                # self loops never lie on a shortest path; of parallel edges only the lightest does
+                if u != v and (v not in out_edges[u] or weight < out_edges[u][v][0]):
+                    out_edges[u][v] = (weight, _ORIGINAL)
+                    in_edges[v][u] = (weight, _ORIGINAL)
+
+        contracted_neighbors = [0] * n
+        level = [0] * n
+
+        def evaluate(node: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+            """Edge difference plus contracted-neighbour count and hierarchy level, which spreads
+            contraction evenly over the graph instead of letting one region grow deep"""
+            shortcuts = _shortcuts(out_edges, in_edges, node, witness_limit)
+            removed = len(out_edges[node]) + len(in_edges[node])
+            return 2 * (len(shortcuts) - removed) + contracted_neighbors[node] + level[node], shortcuts
+
+        priorities = [evaluate(node)[0] for node in range(n)]
+        queue = [(value, node) for node, value in enumerate(priorities)]
+        heapq.heapify(queue)
+        up: List[Dict[int, Tuple[float, int]]] = [{}] * n
+        down: List[Dict[int, Tuple[float, int]]] = [{}] * n
+
+        while queue:
+            value, node = heapq.heappop(queue)
+            if value != priorities[node]:
+                continue
+            # neighbours contracted since this node was queued change its priority, so
+            # re-evaluate it and put it back if it is no longer the cheapest
+            current, shortcuts = evaluate(node)
+            if queue and current > queue[0][0]:
+                priorities[node] = current
+                heapq.heappush(queue, (current, node))
+                continue
+
+            for source, target, weight in shortcuts:
+                existing = out_edges[source].get(target)
+                if existing is None or weight < existing[0]:
+                    out_edges[source][target] = (weight, node)
+                    in_edges[target][source] = (weight, node)
+            priorities[node] = None
+            up[node], down[node] = out_edges[node], in_edges[node]
+            for target in out_edges[node]:
+                del in_edges[target][node]
+            for source in in_edges[node]:
+                del out_edges[source][node]
+            out_edges[node], in_edges[node] = {}, {}
+            for neighbor in set(up[node]) | set(down[node]):
+                contracted_neighbors[neighbor] += 1
+                level[neighbor] = max(level[neighbor], level[node] + 1)
+
+        return cls(n, csr.num_edges, _pack(up), _pack(down), graph)
+
+    @property
+    def num_shortcuts(self) -> int:
+        return (sum(1 for middle in self.up_middles if middle != _ORIGINAL)
+                + sum(1 for middle in self.down_middles if middle != _ORIGINAL))
+
+    def bind(self, graph):
+        """Tie the hierarchy to graph at its current version; see matches"""
+        if graph.num_nodes != self.num_nodes or _edge_count(graph) != self.num_edges:
+            raise ValueError("Contraction hierarchy was built for a different graph")
+        self._graph = weakref.ref(graph)
+        self.version = getattr(graph, "version", 0)
+
+    def matches(self, graph) -> bool:
+        """True while graph is the one the hierarchy is bound to and has not been edited since"""
+        return (self._graph is not None and self._graph() is graph
+                and self.version == getattr(graph, "version", 0))
+
+    def _up_edge(self, node: int, target: int) -> Tuple[int, int, float, int]:
+        for e in range(self.up_offsets[node], self.up_offsets[node + 1]):
+            if self.up_targets[e] == target:
+                return node, target, self.up_weights[e], self.up_middles[e]
+        raise KeyError((node, target))
+
+    def _down_edge(self, node: int, source: int) -> Tuple[int, int, float, int]:
+        for e in range(self.down_offsets[node], self.down_offsets[node + 1]):
+            if self.down_sources[e] == source:
+                return source, node, self.down_weights[e], self.down_middles[e]
+        raise KeyError((source, node))
+
+    def query_edges(self, start: int, target: int) -> Optional[List[Tuple[int, int, float]]]:
+        """Original (u, v, weight) edges of a shortest start -> target path, None if unreachable"""
+        if not (0 <= start < self.num_nodes and 0 <= target < self.num_nodes):
+            return None
+        forward_costs = {start: 0.0}
+        backward_costs = {target: 0.0}
+        forward_parents: Dict[int, Tuple[int, int]] = {}
+        backward_parents: Dict[int, Tuple[int, int]] = {}
+        forward_queue = [(0.0, start)]
+        backward_queue = [(0.0, target)]
+        # each side relaxes its upward edges and checks the opposite set for stalling
+        forward = (forward_queue, forward_costs, forward_parents, backward_costs,
+                   self.up_offsets, self.up_targets, self.up_weights,
+                   self.down_offsets, self.down_sources, self.down_weights)
+        backward = (backward_queue, backward_costs, backward_parents, forward_costs,
+                    self.down_offsets, self.down_sources, self.down_weights,
+                    self.up_offsets, self.up_targets, self.up_weights)
+        best_cost = float('inf')
+        meet = None
+
+        while True:
+            forward_head = forward_queue[0][0] if forward_queue else float('inf')
+            backward_head = backward_queue[0][0] if backward_queue else float('inf')
+            # neither side can still reach a cheaper meeting point
+            if min(forward_head, backward_head) >= best_cost:
+                break
+            (queue, costs, parents, other_costs, offsets, neighbors, weights,
+             stall_offsets, stall_neighbors, stall_weights) = forward if forward_head <= backward_head else backward
+
+            total_cost, current = heapq.heappop(queue)
+            if total_cost > costs[current]:
+                continue
+            if current in other_costs and total_cost + other_costs[current] < best_cost:
+                best_cost = total_cost + other_costs[current]
+                meet = current
+            # stall on demand: a higher node already reached reaches current more cheaply, so
+            # current is not on a shortest up-path and its edges need not be relaxed
+            stalled = False
+            for e in range(stall_offsets[current], stall_offsets[current + 1]):
+                higher_cost = costs.get(stall_neighbors[e])
+                if higher_cost is not None and higher_cost + stall_weights[e] < total_cost:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+            for e in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[e]
+                new_cost = total_cost + weights[e]
+                if new_cost < costs.get(neighbor, float('inf')):
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = (current, e)
+                    heapq.heappush(queue, (new_cost, neighbor))
+
+        if meet is None:
+            return None
+        hierarchy_edges = []
+        current = meet
+        while current != start:
+            parent, e = forward_parents[current]
+            hierarchy_edges.append((parent, current, self.up_weights[e], self.up_middles[e]))
+            current = parent
+        hierarchy_edges.reverse()
+        current = meet
+        while current != target:
+            child, e = backward_parents[current]
+            hierarchy_edges.append((current, child, self.down_weights[e], self.down_middles[e]))
+            current = child
+
+        # a shortcut u -> v via m is u -> m (stored below m) followed by m -> v (stored above m)
+        edges = []
+        stack = hierarchy_edges[::-1]
+        while stack:
+            u, v, weight, middle = stack.pop()
+            if middle == _ORIGINAL:
+                edges.append((u, v, weight))
+            else:
+                stack.append(self._up_edge(middle, v))
+                stack.append(self._down_edge(middle, u))
+
+        # with zero-weight edges the unpacked path can revisit a node; cut out those cycles
+        simple = []
+        position = {start: 0}
+        for edge in edges:
+            v = edge[1]
+            if v in position:
+                for _, removed, _ in simple[position[v]:]:
+                    del position[removed]
+                del simple[position[v]:]
+            else:
+                simple.append(edge)
+                position[v] = len(simple)
+        return simple
+
+    def query(self, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """Same (path, total_weight) shape as SearchAlgorithms.ucs"""
+        edges = self.query_edges(start, target)
+        if edges is None:
+            return None, 0.0
+        path = [start]
+        total_weight = 0.0
+        for _, v, weight in edges:
+            path.append(v)
+            total_weight += weight
+        return path, total_weight
+
+    def save(self, path: str):
+        """Write both edge sets as flat arrays, ready to be mapped back in by load"""
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(HIERARCHY_MAGIC, HIERARCHY_VERSION, self.num_nodes, self.num_edges,
+                                 len(self.up_targets), len(self.down_sources)))
+            # 8-byte items first so every section stays aligned for memoryview.cast
+            for offsets, neighbors, weights, middles in (
+                    (self.up_offsets, self.up_targets, self.up_weights, self.up_middles),
+                    (self.down_offsets, self.down_sources, self.down_weights, self.down_middles)):
+                array('q', offsets).tofile(f)
+                array('d', weights).tofile(f)
+                array('i', neighbors).tofile(f)
+                array('i', middles).tofile(f)
+
+    @classmethod
+    def load(cls, path: str, graph=None) -> "ContractionHierarchy":
+        """Memory-map a hierarchy written by save; pass graph to bind it (and check it matches)"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapped)
+        magic, version, num_nodes, num_edges, num_up, num_down = _HEADER.unpack_from(buffer)
+        if magic != HIERARCHY_MAGIC or version != HIERARCHY_VERSION:
+            raise ValueError(f"{path} is not a contraction hierarchy")
+
+        position = _HEADER.size
+        sections = []
+        for count in (num_up, num_down):
+            parts = {}
+            for name, typecode, length in (("offsets", 'q', num_nodes + 1), ("weights", 'd', count),
+                                           ("neighbors", 'i', count), ("middles", 'i', count)):
+                size = struct.calcsize(typecode) * length
+                parts[name] = buffer[position:position + size].cast(typecode)
+                position += size
+            sections.append((parts["offsets"], parts["neighbors"], parts["weights"], parts["middles"]))
+        return cls(num_nodes, num_edges, sections[0], sections[1], graph)
@@ -1,12 +1,17 @@
 #DFS, DLS & DFID 
 from enum import Enum 
 from collections import defaultdict 
-from typing import Dict, List, Set, Optional, Tuple 
+from typing import Dict, Iterator, List, Set, Optional, Tuple 
+import sys
+from CSR_Graph import CSRGraph
+from Search_Stats import SearchStats
+from Search_Workspace import SearchWorkspace
  
 class SearchType(Enum): 
     DFS = "dfs" 
     DLS = "dls" 
     DFID = "dfid" 
+    DFID_FRONTIER = "dfid_frontier"
  
 class Graph: 
     def __init__(self, num_nodes: int): 
@@ -18,14 +23,142 @@ class Graph:
      
     def validate_node(self, node: int) -> bool: 
         return 0 <= node < self.num_nodes 
+
+    def to_csr(self) -> CSRGraph:
+        """Pack the adjacency lists into flat CSR arrays; the result works with every search here"""
+        return CSRGraph.from_graph(self)
  
 class SearchAlgorithms: 
-    def __init__(self): 
+    def __init__(self, stats: Optional[SearchStats] = None, workspace: Optional[SearchWorkspace] = None):
+        self.stats = stats
+        self.workspace = workspace
         self.visited: Set[int] = set() 
         self.path: List[int] = [] 
         self.path_weight: float = 0.0 
+        self._node_stack: List[int] = []
+        self._iter_stack: List[Optional[Iterator[Tuple[int, float]]]] = []
+        self._weight_stack: List[float] = []
      
-    def dfs(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]: 
+    def _reserve(self, depth: int):
+        """Grow the reusable stacks so they can hold a path of depth + 1 nodes"""
+        size = len(self._node_stack)
+        if depth < size:
+            return
+        extra = max(depth + 1, 2 * size) - size
+        self._node_stack.extend([0] * extra)
+        self._iter_stack.extend([None] * extra)
+        self._weight_stack.extend([0.0] * extra)
+
+    def _iterative_search(self, graph: Graph, start: int, target: int,
+                          depth_limit: Optional[int]) -> Tuple[Optional[List[int]], float]:
+        """Explicit-stack DFS shared by dfs (depth_limit None) and dls.
+
+        Visits nodes in exactly the order of the recursive versions. dfs keeps nodes visited
+        for the whole search; dls only marks the nodes on the current path, like _dls_util.
+        Adds to self.stats without resetting it, so dfid can total its iterations.
+
+        Visited nodes go in a fresh set, or with a workspace in the one set it keeps for
+        every query: begin() empties it and dls leaves it empty after a miss, so the dls runs
+        inside dfid do not allocate a new set each.
+        """
+        if self.workspace is not None:
+            self.workspace.begin(graph.num_nodes)
+            self.visited = self.workspace.visited
+        else:
+            self.visited = set()
+        self.path = []
+        self.path_weight = 0.0
+        if depth_limit is not None and depth_limit < 0:
+            return None, 0.0
+
+        limited = depth_limit is not None
+        limit = depth_limit if limited else sys.maxsize
+        adjacency = graph.graph
+        visited = self.visited
+        visited.add(start)
+        if start == target:
+            self.path = [start]
+            return [start], 0.0
+        if limit == 0:
+            visited.remove(start)
+            return None, 0.0
+
+        stats = self.stats
+        if stats is not None:
+            stats.expand(start, 1)
+        self._reserve(min(limit, 1024))
+        nodes, iters, weights = self._node_stack, self._iter_stack, self._weight_stack
+        capacity = len(nodes)
+        nodes[0] = start
+        weights[0] = 0.0
+        path_weight = 0.0
+        depth = 0
+        it = iter(adjacency[start])
+
+        while True:
+            for neighbor, weight in it:
+                if neighbor in visited:
+                    continue
+                if neighbor == target:
+                    if stats is not None:
+                        stats.relax(neighbor, nodes[depth], weight)
+                    visited.add(neighbor)
+                    nodes[depth + 1] = neighbor
+                    self.path = nodes[:depth + 2]
+                    self.path_weight = path_weight + weight
+                    for i in range(depth):
+                        iters[i] = None
+                    return self.path.copy(), self.path_weight
+                if depth + 1 == limit:
+                    # a leaf at the depth limit is entered and left again without expanding it;
+                    # the weight round trip keeps path_weight bit-identical to _dls_util
+                    path_weight = path_weight + weight - weight
+                    continue
+                break
+            else:
+                if limited:
+                    visited.remove(nodes[depth])
+                if depth == 0:
+                    break
+                path_weight -= weights[depth]
+                depth -= 1
+                it = iters[depth]
+                continue
+
+            iters[depth] = it
+            depth += 1
+            if depth + 1 == capacity:
+                self._reserve(depth + 1)
+                nodes, iters, weights = self._node_stack, self._iter_stack, self._weight_stack
+                capacity = len(nodes)
+            visited.add(neighbor)
+            nodes[depth] = neighbor
+            weights[depth] = weight
+            path_weight += weight
+            if stats is not None:
+                stats.relax(neighbor, nodes[depth - 1], weight)
+                stats.expand(neighbor, depth + 1)
+            it = iter(adjacency[neighbor])
+
+        for i in range(depth):
+            iters[i] = None
+        return None, 0.0
+
+    def dfs(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """Depth-First Search with an explicit stack, so path length is not bound by the recursion limit"""
+        return self._timed_search(graph, start, target, None)
+
+    def _timed_search(self, graph: Graph, start: int, target: int,
+                      depth_limit: Optional[int]) -> Tuple[Optional[List[int]], float]:
+        if self.stats is None:
+            return self._iterative_search(graph, start, target, depth_limit)
+        self.stats.reset()
+        result = self._iterative_search(graph, start, target, depth_limit)
+        self.stats.lap("search")
+        return result
+
+    def dfs_recursive(self, graph: Graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """Original recursive DFS, kept as the reference for benchmarks/iterative_dfs.py"""
         self.visited = set() 
         self.path = [] 
         self.path_weight = 0.0 
@@ -50,15 +183,18 @@ float]:
         self.path.pop() 
         return None, 0.0 
      
-    def dls(self, graph: Graph, start: int, target: int, depth_limit: int) -> 
-Tuple[Optional[List[int]], float]: 
+    def dls(self, graph: Graph, start: int, target: int, depth_limit: int) -> Tuple[Optional[List[int]], float]:
+        """Depth-Limited Search with an explicit stack; depth limits in the millions are fine"""
+        return self._timed_search(graph, start, target, depth_limit)
+
+    def dls_recursive(self, graph: Graph, start: int, target: int, depth_limit: int) -> Tuple[Optional[List[int]], float]:
+        """Original recursive DLS, kept as the reference for benchmarks/iterative_dfs.py"""
         self.visited = set() 
         self.path = [] 
         self.path_weight = 0.0 
         return self._dls_util(graph, start, target, depth_limit) 
      
-    def _dls_util(self, graph: Graph, current: int, target: int, depth_limit: int) -> 
-Tuple[Optional[List[int]], float]: 
+    def _dls_util(self, graph: Graph, current: int, target: int, depth_limit: int) -> Tuple[Optional[List[int]], float]: 
         if depth_limit < 0: 
             return None, 0.0 
          
@@ -81,17 +217,122 @@ Tuple[Optional[List[int]], float]:
         self.visited.remove(current) 
         return None, 0.0 
      
-    def dfid(self, graph: Graph, start: int, target: int, max_depth: int) -> 
-Tuple[Optional[List[int]], float]: 
+    def dfid(self, graph: Graph, start: int, target: int, max_depth: int) -> Tuple[Optional[List[int]], float]: 
+        """dls with depth limits 0, 1, ... max_depth until one finds target; stats total every iteration"""
+        stats = self.stats
+        if stats is not None:
+            stats.reset()
         for depth in range(max_depth + 1): 
-            result, weight = self.dls(graph, start, target, depth) 
+            result, weight = self._iterative_search(graph, start, target, depth)
+            if stats is not None:
+                stats.iterations += 1
+                stats.lap(f"depth {depth}")
             if result: 
                 return result, weight 
         return None, 0.0 
      
+    def dfid_frontier(self, graph: Graph, start: int, target: int, max_depth: int,
+                      max_nodes: int = 1_000_000) -> Tuple[Optional[List[int]], float]:
+        """Iterative deepening that resumes each iteration from the previous one's boundary.
+
+        Instead of re-running dls from the start for every depth, the search-tree nodes cut off
+        at the last depth limit are kept (as parent-linked records, in DFS order) and only they
+        are expanded one level further, so shallow levels are never expanded twice. The result
+        is the same path and weight dfid returns. If the kept records would exceed max_nodes,
+        the remaining depths fall back to plain dls, so peak memory stays bounded.
+        """
+        self.visited = set()
+        self.path = []
+        self.path_weight = 0.0
+        if max_depth < 0:
+            return None, 0.0
+        if start == target:
+            self.path = [start]
+            return [start], 0.0
+
+        adjacency = graph.graph
+        record_node = [start]
+        record_parent = [-1]
+        record_weight = [0.0]
+        record_depth = [0]
+        frontier = [0]
+
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            live = 0
+            on_path: List[int] = []
+            on_path_nodes: Set[int] = set()
+            # the running path weight sees the same additions and subtractions, in the same order,
+            # as dls(depth) does, so the total comes out bit-identical to dfid
+            path_weight = 0.0
+            for leaf in frontier:
+                # ~record marks a dead end: a record with no children, which dls still enters and
+                # leaves again on every later iteration
+                dead = leaf < 0
+                if dead:
+                    leaf = ~leaf
+                # move the current path from the previous frontier record to this one; frontier
+                # records are in DFS order, so this walks each tree edge about twice per level
+                chain = []
+                record = leaf
+                level = record_depth[leaf]
+                while level >= len(on_path) or on_path[level] != record:
+                    chain.append(record)
+                    record = record_parent[record]
+                    level -= 1
+                    if level < 0:
+                        break
+                for stale in reversed(on_path[level + 1:]):
+                    on_path_nodes.discard(record_node[stale])
+                    path_weight -= record_weight[stale]
+                del on_path[level + 1:]
+                for record in reversed(chain):
+                    on_path.append(record)
+                    on_path_nodes.add(record_node[record])
+                    path_weight += record_weight[record]
+                if dead:
+                    next_frontier.append(~leaf)
+                    continue
+
+                children = len(next_frontier)
+                for neighbor, weight in adjacency[record_node[leaf]]:
+                    if neighbor in on_path_nodes:
+                        continue
+                    if neighbor == target:
+                        path = [record_node[r] for r in on_path] + [neighbor]
+                        total_weight = path_weight + weight
+                        self.path = path
+                        self.path_weight = total_weight
+                        return path.copy(), total_weight
+                    # dls(depth) enters and leaves this neighbor at its depth limit
+                    path_weight = path_weight + weight - weight
+                    if depth == max_depth:
+                        # nothing expands the last level, so its records are never needed
+                        continue
+                    if len(record_node) >= max_nodes:
+                        for fallback_depth in range(depth, max_depth + 1):
+                            result, weight = self._iterative_search(graph, start, target, fallback_depth)
+                            if result:
+                                return result, weight
+                        return None, 0.0
+                    record_node.append(neighbor)
+                    record_parent.append(leaf)
+                    record_weight.append(weight)
+                    record_depth.append(depth)
+                    next_frontier.append(len(record_node) - 1)
+                if len(next_frontier) == children:
+                    next_frontier.append(~leaf)
+                else:
+                    live += 1
+            if not live:
+                break
+            frontier = next_frontier
+
+        return None, 0.0
+
     def search(self, search_type: SearchType, graph: Graph, start: int, target: int,  
-               depth_limit: int = None, max_depth: int = None) -> Tuple[Optional[List[int]], 
-float]: 
+               depth_limit: int = None, max_depth: int = None,
+               max_nodes: int = 1_000_000) -> Tuple[Optional[List[int]], float]:
         match search_type: 
             case SearchType.DFS: 
                 return self.dfs(graph, start, target) 
@@ -103,6 +344,10 @@ float]:
                 if max_depth is None: 
                     raise ValueError("Max depth must be specified for DFID") 
                 return self.dfid(graph, start, target, max_depth) 
+            case SearchType.DFID_FRONTIER:
+                if max_depth is None:
+                    raise ValueError("Max depth must be specified for DFID")
+                return self.dfid_frontier(graph, start, target, max_depth, max_nodes)
             case _: 
                 raise ValueError("Invalid search type") 
  
@@ -121,10 +366,8 @@ def main():
      
     g = Graph(num_nodes) 
      
-    start_node = get_valid_input(f"Enter the start node (0-{num_nodes-1}): ", 0, num_nodes
-1) 
-    target_node = get_valid_input(f"Enter the target node (0-{num_nodes-1}): ", 0, 
-num_nodes-1) 
+    start_node = get_valid_input(f"Enter the start node (0-{num_nodes-1}): ", 0, num_nodes-1) 
+    target_node = get_valid_input(f"Enter the target node (0-{num_nodes-1}): ", 0, num_nodes-1) 
      
     num_edges = get_valid_input("Enter the number of edges: ", 0, num_nodes * (num_nodes - 1)) 
      
@@ -154,18 +397,19 @@ num_nodes-1)
     print("1. DFS") 
     print("2. DLS") 
     print("3. DFID") 
+    print("4. DFID (resume from frontier)")
      
-    algo_choice = get_valid_input("Enter your choice (1-3): ", 1, 3) 
+    algo_choice = get_valid_input("Enter your choice (1-4): ", 1, 4)
      
     searcher = SearchAlgorithms() 
-    search_type = SearchType(["dfs", "dls", "dfid"][algo_choice - 1]) 
+    search_type = SearchType(["dfs", "dls", "dfid", "dfid_frontier"][algo_choice - 1])
      
     depth_limit = None 
     max_depth = None 
      
     if search_type == SearchType.DLS: 
         depth_limit = get_valid_input("Enter depth limit: ", 0, num_nodes) 
-    elif search_type == SearchType.DFID: 
+    elif search_type in (SearchType.DFID, SearchType.DFID_FRONTIER):
         max_depth = get_valid_input("Enter maximum depth: ", 0, num_nodes) 
      
     try: 
@@ -182,4 +426,4 @@ num_nodes-1)
     except ValueError as e: 
         print(f"Error: {str(e)}") 
 if __name__ == "__main__": 
-main() 
+    main() 
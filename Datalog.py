@@ -0,0 +1,693 @@
+#Datalog engine for Prolog.txt: hash-indexed relations & semi-naive evaluation
+import operator
+import re
+import sys
+from collections import defaultdict
+from itertools import count
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+Constant = Union[str, int]
+Fact = Tuple[Constant, ...]
+
+_TOKEN = re.compile(r"\s*(?:(:-|\\==|\\=|==|=<|>=|[=<>(),.])|([a-z][A-Za-z0-9_]*)|([A-Z_][A-Za-z0-9_]*)"
+                    r"|(-?\d+)|'((?:[^'\\]|\\.)*)')")
+_TRAILING = re.compile(r"\s*$")
+_COMMENT = re.compile(r"^\s*#.*$|%.*$", re.MULTILINE)
+_QUERY_MARKER = re.compile(r"^\s*User Input:\s*$", re.MULTILINE)
+
+
+def _format(term) -> str:
+    """Term as Prolog would print it: constants that are not plain names get quotes"""
+    if isinstance(term, str) and not re.fullmatch(r"[a-z][A-Za-z0-9_]*", term):
+        return "'" + term.replace("'", "\\'") + "'"
+    return str(term)
+
+
+def _ordering(test: Callable[[Constant, Constant], bool]) -> Callable[[Constant, Constant], bool]:
+    """test for two numbers or two atoms; a number against an atom raises ValueError, as Prolog errors"""
+    def compare(left: Constant, right: Constant) -> bool:
+        if isinstance(left, int) != isinstance(right, int):
+            raise ValueError(f"Cannot compare {_format(left)} with {_format(right)}")
+        return test(left, right)
+    return compare
+
+
+_COMPARISONS: Dict[str, Callable[[Constant, Constant], bool]] = {
+    "\\==": operator.ne, "\\=": operator.ne, "==": operator.eq, "=": operator.eq,
+    "<": _ordering(operator.lt), ">": _ordering(operator.gt),
+    "=<": _ordering(operator.le), ">=": _ordering(operator.ge),
+}
+
+
+class Var:
+    """A logic variable; anonymous ones (written _) never bind anything"""
+
+    def __init__(self, name: str, anonymous: bool = False):
+        self.name = name
+        self.anonymous = anonymous
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __str__(self) -> str:
+        return self.name
+
+
+Term = Union[Var, Constant]
+
+
+class Atom:
+    def __init__(self, predicate: str, args: Tuple[Term, ...]):
+        self.predicate = predicate
+        self.args = args
+        self.key = f"{predicate}/{len(args)}"
+
+    def __repr__(self) -> str:
+        return f"{self.predicate}({','.join(map(_format, self.args))})" if self.args else self.predicate
+
+
+class Comparison:
+    """Built-in test between two terms; = also binds a variable the other side determines"""
+
+    def __init__(self, op: str, left: Term, right: Term):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def __repr__(self) -> str:
+        return f"{_format(self.left)}{self.op}{_format(self.right)}"
+
+
+Literal = Union[Atom, Comparison]
+
+
+class Rule:
+    def __init__(self, head: Atom, body: List[Literal]):
+        self.head = head
+        self.body = body
+
+    def __repr__(self) -> str:
+        return f"{self.head!r} :- {', '.join(map(repr, self.body))}."
+
+
+class _Parser:
+    """Recursive-descent parser for the Datalog subset of Prolog syntax"""
+
+    def __init__(self, text: str):
+        self.tokens: List[Tuple[str, str]] = []
+        text = _COMMENT.sub("", text)
+        position = 0
+        while _TRAILING.match(text, position) is None:
+            match = _TOKEN.match(text, position)
+            if match is None:
+                raise ValueError(f"Unexpected character {text[position:].lstrip()[:1]!r}")
+            kind = ("symbol", "name", "var", "number", "quoted")[match.lastindex - 1]
+            self.tokens.append((kind, match.group(match.lastindex)))
+            position = match.end()
+        self.position = 0
+        self.variables: Dict[str, Var] = {}
+        self.anonymous = count()
+
+    def peek(self, offset: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        if self.position + offset < len(self.tokens):
+            return self.tokens[self.position + offset]
+        return None, None
+
+    def take(self, expected: Optional[str] = None) -> Tuple[str, str]:
+        kind, value = self.peek()
+        if kind is None or (expected is not None and value != expected):
+            raise ValueError(f"Expected {expected or 'more input'}, found {value!r}")
+        self.position += 1
+        return kind, value
+
+    def term(self) -> Term:
+        kind, value = self.take()
+        if kind == "var":
+            if value == "_":
+                return Var(f"_{next(self.anonymous)}", anonymous=True)
+            return self.variables.setdefault(value, Var(value))
+        if kind == "number":
+            return int(value)
+        if kind == "quoted":
+            return sys.intern(value.replace("\\'", "'"))
+        if kind == "name":
+            return sys.intern(value)
+        raise ValueError(f"Expected a term, found {value!r}")
+
+    def literal(self) -> Literal:
+        kind, value = self.peek()
+        if kind == "name" and self.peek(1)[1] == "(":
+            self.take()
+            self.take("(")
+            args = [self.term()]
+            while self.peek()[1] == ",":
+                self.take(",")
+                args.append(self.term())
+            self.take(")")
+            return Atom(value, tuple(args))
+        if kind == "name" and self.peek(1)[1] not in _COMPARISONS:
+            self.take()
+            return Atom(value, ())
+        left = self.term()
+        _, op = self.take()
+        if op not in _COMPARISONS:
+            raise ValueError(f"Unknown operator {op!r}")
+        return Comparison(op, left, self.term())
+
+    def conjunction(self) -> List[Literal]:
+        literals = [self.literal()]
+        while self.peek()[1] == ",":
+            self.take(",")
+            literals.append(self.literal())
+        return literals
+
+    def clauses(self) -> Iterable[Union[Atom, Rule]]:
+        """Facts and rules up to the end of the text, each ended by a full stop"""
+        while self.peek()[0] is not None:
+            self.variables = {}
+            head = self.literal()
+            if not isinstance(head, Atom):
+                raise ValueError(f"A clause head must be an atom, not {head!r}")
+            if self.peek()[1] == ":-":
+                self.take(":-")
+                clause = Rule(head, self.conjunction())
+            else:
+                clause = head
+            self.take(".")
+            yield clause
+
+    def queries(self) -> Iterable[List[Literal]]:
+        while self.peek()[0] is not None:
+            self.variables = {}
+            goal = self.conjunction()
+            self.take(".")
+            yield goal
+
+
+def parse_query(text: str) -> List[Literal]:
+    """Literals of a goal such as "sister(X,Y)" or "parent(Z,X), female(X)" (full stop optional)"""
+    text = text.strip()
+    goals = list(_Parser(text if text.endswith(".") else text + ".").queries())
+    if len(goals) != 1:
+        raise ValueError("Expected exactly one query")
+    return goals[0]
+
+
+def _tuple_getter(positions: List[int]) -> Callable[[tuple], tuple]:
+    """itemgetter that always returns a tuple, even for a single position"""
+    if not positions:
+        return lambda row: ()
+    if len(positions) == 1:
+        position = positions[0]
+        return lambda row: (row[position],)
+    return itemgetter(*positions)
+
+
+def _key_getter(sources: List[Tuple[bool, Constant]]) -> Callable[[tuple], object]:
+    """Index key (scalar for one position, tuple otherwise) from binding slots and constants"""
+    if all(is_var for is_var, _ in sources):
+        return itemgetter(*(slot for _, slot in sources))
+    if len(sources) == 1:
+        constant = sources[0][1]
+        return lambda row: constant
+    return lambda row: tuple(row[value] if is_var else value for is_var, value in sources)
+
+
+class Relation:
+    """Set of facts of one predicate plus hash indexes on argument positions.
+
+    index(positions) builds a value -> facts dictionary on first use and keeps it up to date
+    as facts are added, so joins look up matching facts instead of scanning.
+    """
+
+    def __init__(self, arity: int):
+        self.arity = arity
+        self.facts: Set[Fact] = set()
+        self.indexes: Dict[Tuple[int, ...], Dict[object, List[Fact]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.facts)
+
+    def add(self, fact: Fact) -> bool:
+        if fact in self.facts:
+            return False
+        self.add_new({fact})
+        return True
+
+    def add_new(self, facts: Set[Fact]):
+        """Add facts known not to be in the relation yet, updating every index in one pass each"""
+        self.facts |= facts
+        for positions, index in self.indexes.items():
+            key_of = itemgetter(*positions)
+            for fact in facts:
+                key = key_of(fact)
+                matches = index.get(key)
+                if matches is None:
+                    index[key] = [fact]
+                else:
+                    matches.append(fact)
+
+    def index(self, positions: Tuple[int, ...]) -> Dict[object, List[Fact]]:
+        index = self.indexes.get(positions)
+        if index is None:
+            index = defaultdict(list)
+            key_of = itemgetter(*positions)
+            for fact in self.facts:
+                index[key_of(fact)].append(fact)
+            index = self.indexes[positions] = dict(index)
+        return index
+
+    def match(self, constants: Dict[int, Constant]) -> Iterable[Fact]:
+        """Facts that have the given constants at the given positions (through an index)"""
+        if not constants:
+            return self.facts
+        positions = tuple(sorted(constants))
+        key = constants[positions[0]] if len(positions) == 1 else tuple(constants[p] for p in positions)
+        return self.index(positions).get(key, ())
+
+
+class _Stratum:
+    """Rules whose head predicates depend on each other: one strongly connected component"""
+
+    def __init__(self, rules: List[Tuple[int, Rule]]):
+        self.rules = rules
+        self.heads = {rule.head.key for _, rule in rules}
+        self.reads = {literal.key for _, rule in rules for literal in rule.body if isinstance(literal, Atom)}
+        # facts of the relations it reads that its rules have not seen yet
+        self.pending: Dict[str, Set[Fact]] = defaultdict(set)
+        self.rederive = True
+
+
+class Datalog:
+    """Bottom-up Datalog over facts and positive rules (no negation), as loaded from Prolog.txt.
+
+    Rules are grouped into strata (strongly connected components of the predicate graph),
+    evaluated dependencies first, and a query only evaluates the strata its predicates need.
+    Each stratum runs semi-naive fixpoint iteration: a round fires a rule once per body atom
+    whose relation gained facts since the last round, with that atom reading only those new
+    facts and every other atom joined against the full relations through hash indexes.
+    Recursive rules such as ancestor therefore cost work proportional to what is new each
+    round. Facts added later are propagated the same way, starting from just those facts.
+    """
+
+    def __init__(self):
+        self.relations: Dict[str, Relation] = {}
+        self.rules: List[Rule] = []
+        self.strata: List[_Stratum] = []
+        self._readers: Dict[str, List[_Stratum]] = {}
+        self._producers: Dict[str, _Stratum] = {}
+        self._plans: Dict[Tuple[int, int], Tuple[Callable, List[Callable], Callable]] = {}
+
+    def relation(self, key: str, arity: int) -> Relation:
+        relation = self.relations.get(key)
+        if relation is None:
+            relation = self.relations[key] = Relation(arity)
+        return relation
+
+    def add_fact(self, predicate: str, *args: Constant):
+        self.add_facts(predicate, [args])
+
+    def add_facts(self, predicate: str, facts: Iterable[Fact]):
+        """Add ground facts of one predicate; evaluate() derives their consequences"""
+        facts = [tuple(fact) for fact in facts]
+        if not facts:
+            return
+        arity = len(facts[0])
+        for fact in facts:
+            if len(fact) != arity:
+                raise ValueError(f"Fact {predicate}{fact} does not have {arity} arguments")
+        key = f"{predicate}/{arity}"
+        relation = self.relation(key, arity)
+        new = set(facts).difference(relation.facts)
+        relation.add_new(new)
+        self._notify(key, new)
+
+    def _notify(self, key: str, facts: Set[Fact], source: Optional[_Stratum] = None):
+        """Queue new facts of a relation for every stratum that reads it (source handles its own)"""
+        for stratum in self._readers.get(key, ()):
+            if stratum is not source and not stratum.rederive:
+                stratum.pending[key] |= facts
+
+    def add_rule(self, rule: Rule):
+        atoms = [literal for literal in rule.body if isinstance(literal, Atom)]
+        if not atoms:
+            raise ValueError(f"Rule needs at least one atom in its body: {rule!r}")
+        bound = {arg for atom in atoms for arg in atom.args if isinstance(arg, Var) and not arg.anonymous}
+        changed = True
+        while changed:
+            changed = False
+            for literal in rule.body:
+                if isinstance(literal, Comparison) and literal.op == "=":
+                    sides = (literal.left, literal.right)
+                    if any(not isinstance(side, Var) or side in bound for side in sides):
+                        for side in sides:
+                            if isinstance(side, Var) and side not in bound:
+                                bound.add(side)
+                                changed = True
+        used = [arg for arg in rule.head.args if isinstance(arg, Var)]
+        used += [side for literal in rule.body if isinstance(literal, Comparison)
+                 for side in (literal.left, literal.right) if isinstance(side, Var)]
+        for var in used:
+            if var.anonymous or var not in bound:
+                raise ValueError(f"Unsafe rule, {var!r} is not bound by its body: {rule!r}")
+        self.relation(rule.head.key, len(rule.head.args))
+        for atom in atoms:
+            self.relation(atom.key, len(atom.args))
+        self.rules.append(rule)
+        self._stratify()
+
+    def _stratify(self):
+        """Split the rules into strata with Tarjan's algorithm, dependencies first.
+
+        Every stratum starts over from the full relations, so a new rule sees every fact.
+        """
+        by_head: Dict[str, List[Tuple[int, Rule]]] = defaultdict(list)
+        for number, rule in enumerate(self.rules):
+            by_head[rule.head.key].append((number, rule))
+        depends = {head: {literal.key for _, rule in rules for literal in rule.body
+                          if isinstance(literal, Atom) and literal.key in by_head}
+                   for head, rules in by_head.items()}
+        order: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
+
+        # explicit call stack of (key, unvisited dependencies), so long rule chains cannot hit
+        # the recursion limit; visits keys in the same order as the recursive version
+        for root in by_head:
+            if root in order:
+                continue
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            calls = [(root, iter(depends[root]))]
+            while calls:
+                key, dependencies = calls[-1]
+                for dependency in dependencies:
+                    if dependency not in order:
+                        order[dependency] = low[dependency] = len(order)
+                        stack.append(dependency)
+                        on_stack.add(dependency)
+                        calls.append((dependency, iter(depends[dependency])))
+                        break
+                    if dependency in on_stack:
+                        low[key] = min(low[key], order[dependency])
+                else:
+                    calls.pop()
+                    if calls:
+                        caller = calls[-1][0]
+                        low[caller] = min(low[caller], low[key])
+                    if low[key] == order[key]:
+                        component = []
+                        while not component or component[-1] != key:
+                            component.append(stack.pop())
+                            on_stack.discard(component[-1])
+                        components.append(component)
+        self.strata = [_Stratum([entry for key in component for entry in by_head[key]]) for component in components]
+        self._readers = defaultdict(list)
+        self._producers = {}
+        for stratum in self.strata:
+            for key in stratum.reads:
+                self._readers[key].append(stratum)
+            for key in stratum.heads:
+                self._producers[key] = stratum
+
+    def load(self, text: str) -> List[List[Literal]]:
+        """Load facts and rules from Prolog-style text; returns the queries after "User Input:" """
+        parts = _QUERY_MARKER.split(text, maxsplit=1)
+        for clause in _Parser(parts[0]).clauses():
+            if isinstance(clause, Rule):
+                self.add_rule(clause)
+            elif any(isinstance(arg, Var) for arg in clause.args):
+                raise ValueError(f"Fact {clause!r} must not contain variables")
+            else:
+                self.add_facts(clause.predicate, [clause.args])
+        return list(_Parser(parts[1]).queries()) if len(parts) > 1 else []
+
+    def load_file(self, path: str) -> List[List[Literal]]:
+        with open(path) as handle:
+            return self.load(handle.read())
+
+    def _pick(self, body: List[Literal], remaining: List[int], layout: Dict[Var, int]) -> int:
+        """Next literal to join: ready tests first, then atoms sharing the most bound variables"""
+        def bound(term: Term) -> bool:
+            return not isinstance(term, Var) or term in layout
+
+        best, best_rank = None, None
+        for j in remaining:
+            literal = body[j]
+            if isinstance(literal, Comparison):
+                both = bound(literal.left) and bound(literal.right)
+                either = bound(literal.left) or bound(literal.right)
+                if not (both or (literal.op == "=" and either)):
+                    continue
+                rank = (0, 0)
+            else:
+                named = [arg for arg in literal.args if not (isinstance(arg, Var) and arg.anonymous)]
+                bound_args = sum(bound(arg) for arg in named)
+                rank = (1 if bound_args == len(named) else 2 if bound_args else 3, -bound_args)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = j, rank
+        return best
+
+    def _pattern(self, atom: Atom, layout: Dict[Var, int]):
+        """Split an atom's arguments into bound ones, new variables and repeated new variables"""
+        bound: List[Tuple[int, Tuple[bool, Constant]]] = []
+        new: List[int] = []
+        same: List[Tuple[int, int]] = []
+        first_seen: Dict[Var, int] = {}
+        for position, arg in enumerate(atom.args):
+            if not isinstance(arg, Var):
+                bound.append((position, (False, arg)))
+            elif arg.anonymous:
+                continue
+            elif arg in layout:
+                bound.append((position, (True, layout[arg])))
+            elif arg in first_seen:
+                same.append((first_seen[arg], position))
+            else:
+                first_seen[arg] = position
+                new.append(position)
+        for position in new:
+            layout[atom.args[position]] = len(layout)
+        return bound, new, same
+
+    def _scan_step(self, atom: Atom, layout: Dict[Var, int]) -> Callable[[Iterable[Fact]], List[tuple]]:
+        bound, new, same = self._pattern(atom, layout)
+        constants = [(position, value) for position, (_, value) in bound]
+        extract = _tuple_getter(new)
+        if not constants and not same:
+            if new == list(range(len(atom.args))):
+                # every argument is a distinct new variable: the facts are the bindings
+                return list
+            return lambda facts: [extract(fact) for fact in facts]
+
+        def scan(facts: Iterable[Fact]) -> List[tuple]:
+            return [extract(fact) for fact in facts
+                    if all(fact[p] == value for p, value in constants) and all(fact[p] == fact[q] for p, q in same)]
+        return scan
+
+    def _join_step(self, atom: Atom, layout: Dict[Var, int]) -> Callable[[List[tuple]], List[tuple]]:
+        relation = self.relations[atom.key]
+        bound, new, same = self._pattern(atom, layout)
+        extract = _tuple_getter(new)
+        if not bound and not new:
+            return lambda bindings: bindings if relation.facts else []
+        if not bound:
+            def product(bindings: List[tuple]) -> List[tuple]:
+                facts = [extract(fact) for fact in relation.facts if all(fact[p] == fact[q] for p, q in same)]
+                return [binding + values for binding in bindings for values in facts]
+            return product
+        index = relation.index(tuple(position for position, _ in bound))
+        key_of = _key_getter([source for _, source in bound])
+        if not new:
+            return lambda bindings: [binding for binding in bindings if key_of(binding) in index]
+        if not same and len(new) == 1:
+            position = new[0]
+
+            def join_one(bindings: List[tuple]) -> List[tuple]:
+                get = index.get
+                out = []
+                for binding in bindings:
+                    matches = get(key_of(binding))
+                    if matches:
+                        out.extend([binding + (fact[position],) for fact in matches])
+                return out
+            return join_one
+        if not same:
+            def join(bindings: List[tuple]) -> List[tuple]:
+                get = index.get
+                out = []
+                for binding in bindings:
+                    matches = get(key_of(binding))
+                    if matches:
+                        out.extend([binding + extract(fact) for fact in matches])
+                return out
+            return join
+
+        def join_same(bindings: List[tuple]) -> List[tuple]:
+            return [binding + extract(fact) for binding in bindings for fact in index.get(key_of(binding), ())
+                    if all(fact[p] == fact[q] for p, q in same)]
+        return join_same
+
+    def _comparison_step(self, comparison: Comparison, layout: Dict[Var, int]) -> Callable[[List[tuple]], List[tuple]]:
+        def side(term: Term) -> Optional[Callable[[tuple], Constant]]:
+            if not isinstance(term, Var):
+                return lambda binding: term
+            if term in layout:
+                return itemgetter(layout[term])
+            return None
+
+        left, right = side(comparison.left), side(comparison.right)
+        if left is None or right is None:
+            # = with one unbound side: bind it to the other side's value
+            target = comparison.left if left is None else comparison.right
+            value_of = right if left is None else left
+            layout[target] = len(layout)
+            return lambda bindings: [binding + (value_of(binding),) for binding in bindings]
+        test = _COMPARISONS[comparison.op]
+        return lambda bindings: [binding for binding in bindings if test(left(binding), right(binding))]
+
+    def _compile(self, body: List[Literal], first: int, head: Tuple[Term, ...]):
+        """(scan, steps, project) running body with literal first read from a given set of facts"""
+        layout: Dict[Var, int] = {}
+        scan = self._scan_step(body[first], layout)
+        steps = []
+        remaining = [j for j in range(len(body)) if j != first]
+        while remaining:
+            j = self._pick(body, remaining, layout)
+            if j is None:
+                raise ValueError(f"Cannot evaluate {body[remaining[0]]!r}: its variables are never bound")
+            remaining.remove(j)
+            literal = body[j]
+            if isinstance(literal, Comparison):
+                steps.append(self._comparison_step(literal, layout))
+            else:
+                steps.append(self._join_step(literal, layout))
+        if not head:
+            return scan, steps, lambda binding: ()
+        project = _key_getter([(True, layout[arg]) if isinstance(arg, Var) else (False, arg) for arg in head])
+        if len(head) == 1:
+            single = project
+            project = lambda binding: (single(binding),)
+        return scan, steps, project
+
+    def _run(self, plan, facts: Iterable[Fact]) -> List[tuple]:
+        scan, steps, project = plan
+        bindings = scan(facts)
+        for step in steps:
+            if not bindings:
+                return []
+            bindings = step(bindings)
+        return [project(binding) for binding in bindings]
+
+    def _needed(self, keys: Iterable[str]) -> Set[int]:
+        """ids of the strata that relations keys depend on"""
+        needed: Set[int] = set()
+        stack = list(keys)
+        while stack:
+            stratum = self._producers.get(stack.pop())
+            if stratum is not None and id(stratum) not in needed:
+                needed.add(id(stratum))
+                stack.extend(stratum.reads)
+        return needed
+
+    def evaluate(self, keys: Optional[Iterable[str]] = None):
+        """Run the rules to a fixpoint over everything added since the last evaluation.
+
+        keys ("sister/2", ...) limits the work to the strata those relations depend on.
+        """
+        needed = None if keys is None else self._needed(keys)
+        for stratum in self.strata:
+            if needed is None or id(stratum) in needed:
+                self._evaluate_stratum(stratum)
+
+    def _evaluate_stratum(self, stratum: _Stratum):
+        # starting over, one pass of every rule over the full relations replaces the per-atom deltas
+        full = stratum.rederive
+        delta = {key: facts for key, facts in stratum.pending.items() if facts}
+        stratum.rederive = False
+        stratum.pending = defaultdict(set)
+
+        while full or delta:
+            derived: Dict[str, Set[Fact]] = defaultdict(set)
+            for number, rule in stratum.rules:
+                head = self.relations[rule.head.key]
+                for i, literal in enumerate(rule.body):
+                    if not isinstance(literal, Atom) or not (full or literal.key in delta):
+                        continue
+                    plan = self._plans.get((number, i))
+                    if plan is None:
+                        plan = self._plans[(number, i)] = self._compile(rule.body, i, rule.head.args)
+                    facts = self.relations[literal.key].facts if full else delta[literal.key]
+                    derived[rule.head.key] |= set(self._run(plan, facts)).difference(head.facts)
+                    if full:
+                        break
+            for key, facts in derived.items():
+                self.relations[key].add_new(facts)
+                self._notify(key, facts, stratum)
+            # only recursive rules read what this stratum just derived
+            delta = {key: facts for key, facts in derived.items() if facts and key in stratum.reads}
+            full = False
+
+    def query(self, goal: Union[str, List[Literal]]) -> List[Dict[str, Constant]]:
+        """Every distinct answer to a goal as {variable name: value}, evaluating what it needs first.
+
+        A goal without variables gives [{}] when it holds and [] when it does not.
+        """
+        if isinstance(goal, str):
+            goal = parse_query(goal)
+        atoms = [j for j, literal in enumerate(goal) if isinstance(literal, Atom)]
+        if not atoms:
+            raise ValueError("A query needs at least one atom")
+        self.evaluate(goal[j].key for j in atoms)
+        for j in atoms:
+            if goal[j].key not in self.relations:
+                return []
+        # start from the atom with the most constants, read straight out of an index
+        first = max(atoms, key=lambda j: sum(not isinstance(arg, Var) for arg in goal[j].args))
+        names: List[Var] = []
+        for literal in goal:
+            terms = literal.args if isinstance(literal, Atom) else (literal.left, literal.right)
+            for term in terms:
+                if isinstance(term, Var) and not term.anonymous and term not in names:
+                    names.append(term)
+        plan = self._compile(goal, first, tuple(names))
+        constants = {p: arg for p, arg in enumerate(goal[first].args) if not isinstance(arg, Var)}
+        answers = self._run(plan, self.relations[goal[first].key].match(constants))
+        return [dict(zip((var.name for var in names), answer)) for answer in dict.fromkeys(answers)]
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "Prolog.txt"
+    engine = Datalog()
+    queries = engine.load_file(path)
+    engine.evaluate()
+
+    def answer(goal: List[Literal]):
+        # answers come out in hash order; sorted reads better
+        answers = sorted(engine.query(goal), key=lambda bindings: [str(value) for value in bindings.values()])
+        if not answers:
+            print("false.")
+        for bindings in answers:
+            print(", ".join(f"{name} = {_format(value)}" for name, value in bindings.items()) or "true.")
+
+    for goal in queries:
+        print(f"?- {', '.join(map(repr, goal))}.")
+        answer(goal)
+    while True:
+        try:
+            text = input("?- ").strip()
+        except EOFError:
+            break
+        if not text:
+            break
+        try:
+            answer(parse_query(text))
+        except ValueError as error:
+            print(f"Error: {error}")
+
+if __name__ == "__main__":
+    main()
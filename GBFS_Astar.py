@@ -1,33 +1,98 @@
 #Greedy Best First Search & A* 
 from enum import Enum 
 from collections import defaultdict 
-from typing import Dict, List, Optional, Tuple 
+from typing import Callable, Dict, List, Optional, Tuple 
 import heapq 
- 
+import math
+from itertools import count
+from CSR_Graph import CSRGraph, set_edge_weight
+from Path_Cache import ShortestPathCache
+from Priority_Queues import QueueType, make_queue
+from Landmarks import LandmarkIndex
+from Search_Stats import SearchStats
+from Search_Workspace import SearchWorkspace
+
 class SearchType(Enum): 
     GBFS = "gbfs" 
     ASTAR = "astar" 
+    GBFS_FRONTIER = "gbfs_frontier"
+    BEAM = "beam"
+    IDASTAR = "idastar"
+    SMASTAR = "smastar"
  
 class Graph: 
     def __init__(self, num_nodes: int): 
         self.num_nodes = num_nodes 
         self.graph = defaultdict(list) 
+        self.version = 0
         self.heuristics = {} 
+        self.reverse_graph = defaultdict(list)
      
     def add_edge(self, u: int, v: int, weight: float): 
         self.graph[u].append((v, weight)) 
+        self.version += 1
+        self.reverse_graph[v].append((u, weight))
+
+    def update_edge(self, u: int, v: int, weight: float):
+        """Set the weight of every u -> v edge, adding one if there is none"""
+        set_edge_weight(self.graph[u], v, weight)
+        set_edge_weight(self.reverse_graph[v], u, weight)
+        self.version += 1
      
     def set_heuristic(self, node: int, value: float): 
         self.heuristics[node] = value 
      
     def get_heuristic(self, node: int) -> float: 
         return self.heuristics.get(node, float('inf')) 
- 
+
+    def to_csr(self) -> CSRGraph:
+        """Pack the adjacency lists into flat CSR arrays; the result works with every search here"""
+        return CSRGraph.from_graph(self)
+
+
+def _check_start_heuristic(start: int, value: float):
+    # graph.get_heuristic is inf for nodes without a value, which would leave every bound infinite
+    if not math.isfinite(value):
+        raise ValueError(f"Heuristic of start node {start} is {value}; set heuristic values "
+                         f"or pass a heuristic")
+
+
+class _MemoryNode:
+    """One search-tree node of smastar; children and forgotten are keyed by successor index"""
+    __slots__ = ("node", "g", "f", "parent", "weight", "index", "depth", "successors",
+                 "next_index", "children", "forgotten", "queued", "stamp")
+
+    def __init__(self, node: int, g: float, parent: Optional["_MemoryNode"], weight: float, index: int):
+        self.node = node
+        self.g = g
+        self.f = 0.0
+        self.parent = parent
+        self.weight = weight
+        self.index = index
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.successors: List[Tuple[int, float]] = []
+        self.next_index = 0
+        self.children: Dict[int, "_MemoryNode"] = {}
+        self.forgotten: Dict[int, float] = {}
+        self.queued = False
+        self.stamp = 0
+
 class SearchAlgorithms: 
-    def __init__(self): 
+    def __init__(self, path_cache: Optional[ShortestPathCache] = None, stats: Optional[SearchStats] = None,
+                 workspace: Optional[SearchWorkspace] = None):
         self.path: Dict[int, Optional[Tuple[int, float]]] = {} 
+        self.path_cache = path_cache
+        self.queue = None
+        self.stats = stats
+        self.workspace = workspace
      
-    def gbfs(self, graph: Graph, start: int, target: int) -> Tuple[List[int], float]: 
+    def gbfs(self, graph: Graph, start: int, target: int,
+             heuristic: Optional[Callable[[int], float]] = None) -> Tuple[List[int], float]:
+        """Greedy walk towards the neighbor with the lowest heuristic (graph.get_heuristic by default)"""
+        heuristic = heuristic or graph.get_heuristic
+        stats = self.stats
+        if stats is not None:
+            stats.reset()
         current = start 
         path = [start] 
         total_weight = 0 
@@ -35,22 +100,52 @@ class SearchAlgorithms:
          
         while current != target: 
             neighbors = [(n, w) for n, w in graph.graph[current] if n not in visited] 
+            if stats is not None:
+                stats.expand(current, len(neighbors))
             if not neighbors: 
+                if stats is not None:
+                    stats.lap("search")
                 return [], 0 
                  
-            next_node = min(neighbors, key=lambda x: graph.get_heuristic(x[0])) 
+            next_node = min(neighbors, key=lambda x: heuristic(x[0]))
             next_node, weight = next_node 
+            if stats is not None:
+                stats.relax(next_node, current, weight)
              
             visited.add(next_node) 
             path.append(next_node) 
             total_weight += weight 
             current = next_node 
              
+        if stats is not None:
+            stats.lap("search")
         return path, total_weight 
  
-    def astar(self, graph: Graph, start: int, target: int) -> Tuple[List[int], float]: 
+    def astar(self, graph: Graph, start: int, target: int,
+              queue_type: Optional[QueueType] = None,
+              heuristic: Optional[Callable[[int], float]] = None) -> Tuple[List[int], float]:
+        """A* search; queue_type picks a Priority_Queues open set, None uses the inline heapq one.
+
+        heuristic overrides graph.get_heuristic, e.g. LandmarkIndex.heuristic(target).
+        Stale pops are counted by the inline loop only; queue_type queues keep their own count.
+        A workspace replaces the inline loop's dicts and set.
+        """
+        heuristic = heuristic or graph.get_heuristic
+        stats = self.stats
+        if stats is not None:
+            stats.reset()
+        if self.path_cache is not None:
+            # a cached Dijkstra tree gives the same optimal cost A* would with an admissible heuristic
+            path, total_weight = self.path_cache.query(graph, start, target)
+            if stats is not None:
+                stats.lap("cache")
+            return (path, total_weight) if path else ([], 0)
+        if queue_type is not None:
+            return self._astar_with_queue(graph, start, target, make_queue(queue_type), heuristic)
+        if self.workspace is not None:
+            return self._astar_in_workspace(graph, start, target, heuristic)
         g_score = {start: 0} 
-        open_set = [(graph.get_heuristic(start), start)] 
+        open_set = [(heuristic(start), start)]
         closed_set = set() 
         came_from = {start: None} 
         weights = {} 
@@ -59,9 +154,13 @@ class SearchAlgorithms:
             _, current = heapq.heappop(open_set) 
              
             if current in closed_set: 
+                if stats is not None:
+                    stats.stale_pops += 1
                 continue 
                  
             if current == target: 
+                if stats is not None:
+                    stats.lap("search")
                 path = [] 
                 total_weight = 0 
                 while current is not None: 
@@ -69,10 +168,14 @@ class SearchAlgorithms:
                     if current in weights: 
                         total_weight += weights[current] 
                     current = came_from[current] 
+                if stats is not None:
+                    stats.lap("reconstruct")
                 return path[::-1], total_weight 
              
             closed_set.add(current) 
              
+            if stats is not None:
+                stats.expand(current, len(open_set) + 1)
             for neighbor, weight in graph.graph[current]: 
                 if neighbor in closed_set: 
                     continue 
@@ -83,18 +186,418 @@ class SearchAlgorithms:
                     came_from[neighbor] = current 
                     weights[neighbor] = weight 
                     g_score[neighbor] = tentative_g 
-                    f_score = tentative_g + graph.get_heuristic(neighbor) 
+                    f_score = tentative_g + heuristic(neighbor)
                     heapq.heappush(open_set, (f_score, neighbor)) 
+                    if stats is not None:
+                        stats.relax(neighbor, current, weight)
          
+        if stats is not None:
+            stats.lap("search")
         return [], 0 
      
-    def search(self, search_type: SearchType, graph: Graph, start: int, target: int) -> 
-Tuple[List[int], float]: 
+    def _astar_in_workspace(self, graph: Graph, start: int, target: int,
+                            heuristic: Callable[[int], float]) -> Tuple[List[int], float]:
+        """The inline astar loop on the workspace's stamped arrays and reused heap list"""
+        workspace = self.workspace
+        stats = self.stats
+        epoch = workspace.begin(graph.num_nodes)
+        seen, done, came_from, weights, g_score = (workspace.seen, workspace.done, workspace.parent,
+                                                   workspace.weight, workspace.cost)
+        seen[start], came_from[start], weights[start], g_score[start] = epoch, -1, 0, 0
+        open_set = workspace.heap
+        open_set.append((heuristic(start), start))
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+
+            if done[current] == epoch:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+
+            if current == target:
+                if stats is not None:
+                    stats.lap("search")
+                path = []
+                total_weight = 0
+                while current != start:
+                    path.append(current)
+                    total_weight += weights[current]
+                    current = came_from[current]
+                path.append(start)
+                if stats is not None:
+                    stats.lap("reconstruct")
+                return path[::-1], total_weight
+
+            done[current] = epoch
+
+            if stats is not None:
+                stats.expand(current, len(open_set) + 1)
+            for neighbor, weight in graph.graph[current]:
+                if done[neighbor] == epoch:
+                    continue
+
+                tentative_g = g_score[current] + weight
+
+                if seen[neighbor] != epoch or tentative_g < g_score[neighbor]:
+                    seen[neighbor] = epoch
+                    came_from[neighbor] = current
+                    weights[neighbor] = weight
+                    g_score[neighbor] = tentative_g
+                    heapq.heappush(open_set, (tentative_g + heuristic(neighbor), neighbor))
+                    if stats is not None:
+                        stats.relax(neighbor, current, weight)
+
+        if stats is not None:
+            stats.lap("search")
+        return [], 0
+
+    def _astar_with_queue(self, graph: Graph, start: int, target: int, queue,
+                          heuristic: Callable[[int], float]) -> Tuple[List[int], float]:
+        """astar over a queue that handles decrease-key itself, so every pop is a live node"""
+        stats = self.stats
+        self.queue = queue
+        g_score = {start: 0}
+        closed_set = set()
+        came_from = {start: None}
+        weights = {}
+        queue.push(start, heuristic(start))
+
+        while queue:
+            _, current = queue.pop()
+
+            if current == target:
+                if stats is not None:
+                    stats.lap("search")
+                path = []
+                total_weight = 0
+                while current is not None:
+                    path.append(current)
+                    if current in weights:
+                        total_weight += weights[current]
+                    current = came_from[current]
+                if stats is not None:
+                    stats.lap("reconstruct")
+                return path[::-1], total_weight
+
+            closed_set.add(current)
+
+            if stats is not None:
+                stats.expand(current, len(queue) + 1)
+            for neighbor, weight in graph.graph[current]:
+                if neighbor in closed_set:
+                    continue
+
+                tentative_g = g_score[current] + weight
+
+                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    weights[neighbor] = weight
+                    g_score[neighbor] = tentative_g
+                    queue.push(neighbor, tentative_g + heuristic(neighbor))
+                    if stats is not None:
+                        stats.relax(neighbor, current, weight)
+
+        if stats is not None:
+            stats.lap("search")
+        return [], 0
+
+    def _trace_path(self, came_from: Dict[int, Optional[int]], weights: Dict[int, float],
+                    target: int) -> Tuple[List[int], float]:
+        """Follow came_from back from target, the same way astar builds its result"""
+        path = []
+        total_weight = 0
+        current = target
+        while current is not None:
+            path.append(current)
+            if current in weights:
+                total_weight += weights[current]
+            current = came_from[current]
+        return path[::-1], total_weight
+
+    def gbfs_frontier(self, graph: Graph, start: int, target: int,
+                      heuristic: Optional[Callable[[int], float]] = None) -> Tuple[List[int], float]:
+        """Greedy best-first search over a priority queue of every generated node.
+
+        Unlike gbfs it backs up from a dead end to the next most promising node, so it finds
+        a path whenever one exists (not necessarily the cheapest).
+        """
+        heuristic = heuristic or graph.get_heuristic
+        open_set = [(heuristic(start), start)]
+        came_from = {start: None}
+        weights = {}
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if current == target:
+                return self._trace_path(came_from, weights, target)
+            for neighbor, weight in graph.graph[current]:
+                if neighbor not in came_from:
+                    came_from[neighbor] = current
+                    weights[neighbor] = weight
+                    heapq.heappush(open_set, (heuristic(neighbor), neighbor))
+
+        return [], 0
+
+    def beam_search(self, graph: Graph, start: int, target: int, beam_width: int,
+                    heuristic: Optional[Callable[[int], float]] = None) -> Tuple[List[int], float]:
+        """Breadth-first by level, keeping only the beam_width successors with the lowest g + h.
+
+        Memory grows with beam_width times the path length instead of the graph size; the price
+        is that pruned nodes are never revisited, so it can miss the best path or any path.
+        """
+        if beam_width < 1:
+            raise ValueError("Beam width must be at least 1")
+        heuristic = heuristic or graph.get_heuristic
+        g_score = {start: 0}
+        came_from = {start: None}
+        weights = {}
+        beam = [start]
+
+        while beam:
+            if target in g_score:
+                return self._trace_path(came_from, weights, target)
+            candidates = {}
+            for current in beam:
+                for neighbor, weight in graph.graph[current]:
+                    if neighbor in g_score:
+                        continue
+                    tentative_g = g_score[current] + weight
+                    if neighbor not in candidates or tentative_g < candidates[neighbor][0]:
+                        candidates[neighbor] = (tentative_g, current, weight)
+            best = heapq.nsmallest(beam_width, candidates,
+                                   key=lambda node: (candidates[node][0] + heuristic(node), node))
+            for node in best:
+                g_score[node], came_from[node], weights[node] = candidates[node]
+            beam = best
+
+        return [], 0
+
+    def idastar(self, graph: Graph, start: int, target: int, max_nodes: int = 100_000,
+                heuristic: Optional[Callable[[int], float]] = None) -> Tuple[List[int], float]:
+        """Iterative deepening A*: depth-first passes bounded by f = g + h, each pass raising the
+        bound to the smallest f that exceeded it.
+
+        Besides the current path, each pass remembers the cheapest g it reached up to max_nodes
+        nodes with, and skips a node it reaches again at no lower cost; without that table the
+        passes can enumerate exponentially many paths. With an admissible heuristic the result
+        is optimal. heuristic(start) must be finite, since it is the first bound.
+        """
+        heuristic = heuristic or graph.get_heuristic
+        if start == target:
+            return [start], 0
+        bound = heuristic(start)
+        _check_start_heuristic(start, bound)
+
+        while bound != float('inf'):
+            path = [start]
+            costs = [0]
+            on_path = {start}
+            best_g = {start: 0}
+            iterators = [iter(graph.graph[start])]
+            next_bound = float('inf')
+
+            while iterators:
+                for neighbor, weight in iterators[-1]:
+                    if neighbor in on_path:
+                        continue
+                    cost = costs[-1] + weight
+                    if cost >= best_g.get(neighbor, float('inf')):
+                        continue
+                    f_score = cost + heuristic(neighbor)
+                    if f_score > bound:
+                        next_bound = min(next_bound, f_score)
+                        continue
+                    path.append(neighbor)
+                    costs.append(cost)
+                    if neighbor == target:
+                        return path, cost
+                    if neighbor in best_g or len(best_g) < max_nodes:
+                        best_g[neighbor] = cost
+                    on_path.add(neighbor)
+                    iterators.append(iter(graph.graph[neighbor]))
+                    break
+                else:
+                    iterators.pop()
+                    on_path.discard(path.pop())
+                    costs.pop()
+            bound = next_bound
+
+        return [], 0
+
+    def smastar(self, graph: Graph, start: int, target: int, max_nodes: int,
+                heuristic: Optional[Callable[[int], float]] = None) -> Tuple[List[int], float]:
+        """Simplified memory-bounded A* (SMA*): never holds more than max_nodes search nodes.
+
+        Successors are generated one at a time. When memory is full the shallowest leaf with
+        the highest f is forgotten and its f is remembered by its parent, which regenerates it
+        with that f once everything cheaper has been tried. Completed parents take the lowest
+        f of their children. Nodes max_nodes - 1 steps deep get f = inf, as their children
+        would not fit. Optimal if the cheapest path fits in memory; ([], 0) if no path does.
+        With max_nodes well below what A* would hold, time grows sharply as forgotten parts
+        of the tree are regenerated. heuristic(start) must be finite.
+        """
+        if max_nodes < 2:
+            raise ValueError("SMA* needs room for at least 2 nodes")
+        heuristic = heuristic or graph.get_heuristic
+        inf = float('inf')
+        counter = count()
+        open_set = []
+        leaves = []
+
+        def make(node: int, g: float, f: float, parent: Optional[_MemoryNode], weight: float,
+                 index: int) -> _MemoryNode:
+            record = _MemoryNode(node, g, parent, weight, index)
+            ancestors = set()
+            current = record
+            while current is not None:
+                ancestors.add(current.node)
+                current = current.parent
+            record.successors = [edge for edge in graph.graph[node] if edge[0] not in ancestors]
+            if node != target and (not record.successors or record.depth >= max_nodes - 1):
+                f = inf
+            record.f = f
+            return record
+
+        # heap entries carry the record's stamp at push time; any later change re-stamps the
+        # record, so outdated entries are recognised and skipped (the stamp also breaks ties)
+        def enqueue(record: _MemoryNode):
+            record.stamp = next(counter)
+            record.queued = True
+            heapq.heappush(open_set, (record.f, -record.depth, record.stamp, record))
+            if not record.children:
+                heapq.heappush(leaves, (-record.f, record.depth, record.stamp, record))
+
+        def back_up(record: Optional[_MemoryNode]):
+            """Once all successors of record exist, its f is the lowest f among them"""
+            while record is not None and record.next_index == len(record.successors):
+                values = [child.f for child in record.children.values()] + list(record.forgotten.values())
+                # nothing left to explore below record makes it a dead end
+                best = min(values, default=inf)
+                if best == record.f:
+                    break
+                record.f = best
+                if record.queued:
+                    enqueue(record)
+                record = record.parent
+
+        if start == target:
+            return [start], 0
+        start_f = heuristic(start)
+        _check_start_heuristic(start, start_f)
+        root = make(start, 0, start_f, None, 0, -1)
+        enqueue(root)
+        best_held = {start: root}
+        used = 1
+
+        while open_set:
+            f, _, stamp, current = open_set[0]
+            if not current.queued or stamp != current.stamp:
+                heapq.heappop(open_set)
+                continue
+            if f == inf:
+                break
+            if current.node == target:
+                path = []
+                total_weight = 0
+                while current is not None:
+                    path.append(current.node)
+                    total_weight += current.weight
+                    current = current.parent
+                return path[::-1], total_weight
+
+            held = best_held.get(current.node)
+            if held is not current and held is not None and held.g <= current.g and held.f != inf:
+                # a cheaper copy of this node exists, so nothing below this one can be better
+                current.next_index = len(current.successors)
+                current.forgotten.clear()
+                back_up(current)
+                if current.children:
+                    current.queued = False
+                continue
+
+            # a successor already held elsewhere at no higher cost adds nothing, unless that copy
+            # is stuck at f = inf (e.g. too deep to expand)
+            child = None
+            while current.next_index < len(current.successors):
+                index = current.next_index
+                current.next_index += 1
+                neighbor, weight = current.successors[index]
+                g = current.g + weight
+                held = best_held.get(neighbor)
+                if held is None or g < held.g or held.f == inf:
+                    child = make(neighbor, g, max(current.f, g + heuristic(neighbor)), current, weight, index)
+                    break
+            if child is None and current.forgotten:
+                index = min(current.forgotten, key=current.forgotten.get)
+                neighbor, weight = current.successors[index]
+                child = make(neighbor, current.g + weight, current.forgotten.pop(index), current, weight, index)
+            if child is not None:
+                current.children[index] = child
+                held = best_held.get(child.node)
+                if held is None or child.g < held.g:
+                    best_held[child.node] = child
+            back_up(current)
+            if current.next_index == len(current.successors) and not current.forgotten and current.children:
+                current.queued = False
+            if child is None:
+                continue
+
+            used += 1
+            while used > max_nodes and leaves:
+                _, _, stamp, leaf = heapq.heappop(leaves)
+                if not leaf.queued or stamp != leaf.stamp or leaf.children or leaf.parent is None:
+                    continue
+                parent = leaf.parent
+                del parent.children[leaf.index]
+                parent.forgotten[leaf.index] = leaf.f
+                if best_held.get(leaf.node) is leaf:
+                    del best_held[leaf.node]
+                leaf.queued = False
+                used -= 1
+                if not parent.queued:
+                    enqueue(parent)
+                elif not parent.children:
+                    heapq.heappush(leaves, (-parent.f, parent.depth, parent.stamp, parent))
+            enqueue(child)
+
+            # lazily deleted heap entries would otherwise grow without bound; keep them in check
+            if len(open_set) + len(leaves) > 4 * used + 64:
+                open_set[:] = [entry for entry in open_set if entry[3].queued and entry[2] == entry[3].stamp]
+                leaves[:] = [entry for entry in leaves if entry[3].queued and entry[2] == entry[3].stamp
+                             and not entry[3].children]
+                heapq.heapify(open_set)
+                heapq.heapify(leaves)
+
+        return [], 0
+
+    def search(self, search_type: SearchType, graph: Graph, start: int, target: int,
+               queue_type: Optional[QueueType] = None,
+               landmarks: Optional[LandmarkIndex] = None, beam_width: Optional[int] = None,
+               max_nodes: Optional[int] = None) -> Tuple[List[int], float]:
+        """Run the chosen search; with landmarks, their ALT bound replaces the graph's heuristic values.
+
+        beam_width is required for BEAM and max_nodes for SMASTAR (IDASTAR uses it to size its
+        table, default 100_000).
+        """
+        heuristic = landmarks.heuristic(target) if landmarks is not None else None
         match search_type: 
             case SearchType.GBFS: 
-                return self.gbfs(graph, start, target) 
+                return self.gbfs(graph, start, target, heuristic)
             case SearchType.ASTAR: 
-                return self.astar(graph, start, target) 
+                return self.astar(graph, start, target, queue_type, heuristic)
+            case SearchType.GBFS_FRONTIER:
+                return self.gbfs_frontier(graph, start, target, heuristic)
+            case SearchType.BEAM:
+                if beam_width is None:
+                    raise ValueError("Beam width must be specified for beam search")
+                return self.beam_search(graph, start, target, beam_width, heuristic)
+            case SearchType.IDASTAR:
+                return self.idastar(graph, start, target, max_nodes or 100_000, heuristic)
+            case SearchType.SMASTAR:
+                if max_nodes is None:
+                    raise ValueError("Memory limit (max_nodes) must be specified for SMA*")
+                return self.smastar(graph, start, target, max_nodes, heuristic)
             case _: 
                 raise ValueError("Invalid search type") 
  
@@ -119,10 +622,8 @@ def main():
     num_nodes = get_valid_input("Enter the number of nodes (1-100): ", 1, 100) 
     g = Graph(num_nodes) 
      
-    start_node = get_valid_input(f"Enter the start node (0-{num_nodes-1}): ", 0, num_nodes
-1) 
-    target_node = get_valid_input(f"Enter the target node (0-{num_nodes-1}): ", 0, 
-num_nodes-1) 
+    start_node = get_valid_input(f"Enter the start node (0-{num_nodes-1}): ", 0, num_nodes-1) 
+    target_node = get_valid_input(f"Enter the target node (0-{num_nodes-1}): ", 0, num_nodes-1) 
      
     print("\nEnter heuristic values for each node:") 
     for i in range(num_nodes): 
@@ -157,13 +658,25 @@ num_nodes-1)
     print("\nSelect search algorithm:") 
     print("1. Greedy Best First Search") 
     print("2. A* Search") 
+    print("3. Greedy Best First Search (priority queue)")
+    print("4. Beam Search")
+    print("5. IDA* Search")
+    print("6. SMA* Search (memory-bounded)")
      
-    algo_choice = get_valid_input("Enter your choice (1-2): ", 1, 2) 
+    algo_choice = get_valid_input("Enter your choice (1-6): ", 1, 6)
     searcher = SearchAlgorithms() 
-    search_type = SearchType(["gbfs", "astar"][algo_choice - 1]) 
+    search_type = SearchType(["gbfs", "astar", "gbfs_frontier", "beam", "idastar", "smastar"][algo_choice - 1])
+
+    beam_width = None
+    max_nodes = None
+    if search_type == SearchType.BEAM:
+        beam_width = get_valid_input("Enter beam width: ", 1, num_nodes)
+    elif search_type == SearchType.SMASTAR:
+        max_nodes = get_valid_input("Enter memory limit (nodes): ", 2, 1_000_000)
      
     try: 
-        path, total_weight = searcher.search(search_type, g, start_node, target_node) 
+        path, total_weight = searcher.search(search_type, g, start_node, target_node,
+                                             beam_width=beam_width, max_nodes=max_nodes)
          
         print(f"\n{search_type.value.upper()} result:") 
         if path: 
@@ -1,5 +1,17 @@
 #Genetics
+import heapq
+import os
 import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from enum import Enum
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def fitness_function(x):
     return x * x
 
@@ -19,28 +31,294 @@ def mutate(child, lower, upper, mutation_rate=0.1):
         child = max(min(child, upper), lower)
     return child
 
-def genetic_algorithm():
-    lower = int(input("Enter lower bound: "))
-    upper = int(input("Enter upper bound: "))
-    population_size = int(input("Enter population size: "))
-    generations = int(input("Enter number of generations: "))
-    
-    population = generate_population(population_size, lower, upper)
-    
+def _require_numpy():
+    if np is None:
+        raise ImportError("The vectorized GA needs NumPy: pip install numpy")
+
+def select_elites(population, scores, count):
+    """The count fittest individuals, found with argpartition instead of sorting everything"""
+    if count <= 0:
+        return population[:0]
+    if count >= len(population):
+        return population.copy()
+    return population[np.argpartition(scores, -count)[-count:]]
+
+def select_parents_vectorized(rng, size, count):
+    """count pairs of distinct parent indices, each pair uniform like random.sample(population, 2)"""
+    first = rng.integers(0, size, count)
+    second = rng.integers(0, size - 1, count)
+    second += second >= first
+    return first, second
+
+def crossover_vectorized(p1, p2):
+    """(p1 + p2) // 2 element-wise, without the sum overflowing int64"""
+    return (p1 >> 1) + (p2 >> 1) + (p1 & p2 & 1)
+
+def mutate_vectorized(rng, children, lower, upper, mutation_rate=0.1):
+    """In place: each child moves by -1 or +1 with probability mutation_rate, then is clipped to the bounds"""
+    mutated = np.flatnonzero(rng.random(len(children)) < mutation_rate)
+    children[mutated] += rng.integers(0, 2, len(mutated)) * 2 - 1
+    np.clip(children, lower, upper, out=children)
+    return children
+
+def genetic_algorithm_vectorized(lower, upper, population_size, generations, fitness=fitness_function,
+                                 elites=2, mutation_rate=0.1, seed=None):
+    """The same GA as genetic_algorithm over whole NumPy generations; returns (best, fitness).
+
+    fitness gets the population as a float64 array and must return one score per individual
+    (fitness_function works as is). The same seed gives the same run.
+    """
+    _require_numpy()
+    if population_size < 2:
+        raise ValueError("Population size must be at least 2")
+    if not 0 <= elites <= population_size:
+        raise ValueError("Elites must be between 0 and the population size")
+    rng = np.random.default_rng(seed)
+    population = rng.integers(lower, upper, population_size, dtype=np.int64, endpoint=True)
+    children = population_size - elites
+
+    for _ in range(generations):
+        scores = fitness(population.astype(np.float64))
+        p1, p2 = select_parents_vectorized(rng, population_size, children)
+        offspring = crossover_vectorized(population[p1], population[p2])
+        mutate_vectorized(rng, offspring, lower, upper, mutation_rate)
+        population = np.concatenate((select_elites(population, scores, elites), offspring))
+
+    scores = fitness(population.astype(np.float64))
+    best = int(np.argmax(scores))
+    return int(population[best]), float(scores[best])
+
+def batched(fitness, executor=None, chunk_size=64):
+    """Batch fitness function (list of genomes -> list of scores) from a per-genome one.
+
+    With a ThreadPoolExecutor or ProcessPoolExecutor the batch is spread over its workers
+    (a process pool needs fitness to be picklable).
+    """
+    if executor is None:
+        return lambda genomes: [fitness(genome) for genome in genomes]
+    return lambda genomes: list(executor.map(fitness, genomes, chunksize=chunk_size))
+
+class Eviction(Enum):
+    LRU = "lru"
+    GENERATIONAL = "generational"
+
+class FitnessCache:
+    """Bounded genome -> fitness cache in front of a batch fitness function.
+
+    evaluate(genomes) is one generation: it looks every genome up and sends the unique misses
+    to batch_fitness in a single call. LRU drops the least recently used genome once
+    max_size is passed; GENERATIONAL keeps the genomes of this generation and the one before
+    (anything seen in neither is dropped), starting a new generation early if one outgrows
+    max_size. Calling the cache on a single genome works too, so it can stand in for fitness.
+    """
+
+    def __init__(self, batch_fitness, max_size=100_000, eviction=Eviction.LRU):
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.batch_fitness = batch_fitness
+        self.max_size = max_size
+        self.eviction = eviction
+        self.recent = OrderedDict()
+        self.previous = {}
+        self.hits = 0
+        self.misses = 0
+        self.evaluation_time = 0.0
+
+    def __len__(self):
+        return len(self.recent) + len(self.previous)
+
+    def _lookup(self, genome):
+        if genome in self.recent:
+            if self.eviction == Eviction.LRU:
+                self.recent.move_to_end(genome)
+            return self.recent[genome]
+        if genome in self.previous:
+            # still in use: carry it over into the current generation
+            self._store(genome, self.previous.pop(genome))
+            return self.recent[genome]
+        return None
+
+    def _store(self, genome, score):
+        self.recent[genome] = score
+        if len(self.recent) > self.max_size:
+            if self.eviction == Eviction.LRU:
+                self.recent.popitem(last=False)
+            else:
+                self.next_generation()
+
+    def next_generation(self):
+        """Generational eviction: forget the genomes not seen since the generation before last"""
+        self.previous = self.recent
+        self.recent = OrderedDict()
+
+    def evaluate(self, genomes):
+        """Scores for a list of genomes, evaluating each uncached genome once in one batch"""
+        if self.eviction == Eviction.GENERATIONAL:
+            self.next_generation()
+        scores = {}
+        for genome in genomes:
+            if genome not in scores:
+                score = self._lookup(genome)
+                if score is not None:
+                    scores[genome] = score
+        misses = [genome for genome in dict.fromkeys(genomes) if genome not in scores]
+        self.hits += len(genomes) - len(misses)
+        self.misses += len(misses)
+        if misses:
+            begin = time.perf_counter()
+            results = self.batch_fitness(misses)
+            self.evaluation_time += time.perf_counter() - begin
+            for genome, score in zip(misses, results):
+                scores[genome] = score
+                self._store(genome, score)
+        return [scores[genome] for genome in genomes]
+
+    def __call__(self, genome):
+        score = self._lookup(genome)
+        if score is not None:
+            self.hits += 1
+            return score
+        self.misses += 1
+        begin = time.perf_counter()
+        score = self.batch_fitness([genome])[0]
+        self.evaluation_time += time.perf_counter() - begin
+        self._store(genome, score)
+        return score
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def time_saved(self):
+        """Estimated seconds not spent evaluating: hits times the average time of an evaluation"""
+        return self.hits * self.evaluation_time / self.misses if self.misses else 0.0
+
+    def report(self):
+        return (f"Fitness cache: {self.hits} hits, {self.misses} evaluations, hit rate {self.hit_rate:.1%}, "
+                f"{self.evaluation_time:.3f}s evaluating, ~{self.time_saved:.3f}s saved")
+
+def evolve(population, lower, upper, generations, fitness=fitness_function, elites=2, mutation_rate=0.1,
+           evaluate=None):
+    """Run generations of the GA on a list population and return the last one.
+
+    Each generation is scored with one evaluate(population) call (a FitnessCache.evaluate or
+    any batch function); without one, fitness runs on every individual.
+    """
+    evaluate = evaluate or batched(fitness)
+    population_size = len(population)
     for _ in range(generations):
-        population = sorted(population, key=fitness_function, reverse=True)
-        new_population = population[:2]  
-        
+        scores = evaluate(population)
+        new_population = [population[i] for i in heapq.nlargest(elites, range(population_size),
+                                                                  key=scores.__getitem__)]
+
         while len(new_population) < population_size:
             p1, p2 = select_parents(population)
             child = crossover(p1, p2)
-            child = mutate(child, lower, upper)
+            child = mutate(child, lower, upper, mutation_rate)
             new_population.append(child)
-        
+
         population = new_population
-    
-    best = max(population, key=fitness_function)
-    print(f"Best solution: {best} with fitness {fitness_function(best)}")
+    return population
+
+class Topology(Enum):
+    RING = "ring"
+    RANDOM = "random"
+
+def _run_island(island, epoch, seed, population, immigrants, lower, upper, population_size,
+                generations, fitness, elites, mutation_rate, migrants):
+    """One epoch of one island in a worker: take in migrants, evolve, pick the emigrants"""
+    # reseeding per (island, epoch) keeps a run reproducible whichever worker gets the task
+    random.seed(f"{seed}-{island}-{epoch}")
+    if population is None:
+        population = generate_population(population_size, lower, upper)
+    if immigrants:
+        # immigrants replace the island's weakest individuals
+        weakest = heapq.nsmallest(len(immigrants), range(len(population)), key=lambda i: fitness(population[i]))
+        for i, immigrant in zip(weakest, immigrants):
+            population[i] = immigrant
+    population = evolve(population, lower, upper, generations, fitness, elites, mutation_rate)
+    emigrants = heapq.nlargest(migrants, population, key=fitness)
+    best = max(population, key=fitness)
+    return island, population, emigrants, (best, fitness(best))
+
+def island_model(lower, upper, population_size, generations, islands=4, migration_interval=10, migrants=2,
+                 topology=Topology.RING, processes=None, fitness=fitness_function, elites=2,
+                 mutation_rate=0.1, seed=None):
+    """Island-model GA: independent populations evolved in a process pool, with migration between them.
+
+    Every migration_interval generations each island sends copies of its migrants best
+    individuals to the next island (RING) or to a randomly chosen other island (RANDOM), where
+    they replace the weakest. fitness must be picklable (a module-level function). Yields
+    (generations_done, [(best, best_fitness) per island]) after every migration round; the
+    same seed gives the same run.
+    """
+    if islands < 1:
+        raise ValueError("Need at least one island")
+    if generations < 1:
+        raise ValueError("Need at least one generation")
+    if migration_interval < 1:
+        raise ValueError("Migration interval must be at least 1")
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    router = random.Random(seed)
+    populations = [None] * islands
+    inbound = [[] for _ in range(islands)]
+    bests = [None] * islands
+    done = 0
+    processes = processes or min(islands, os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        epoch = 0
+        while done < generations:
+            span = min(migration_interval, generations - done)
+            futures = [executor.submit(_run_island, island, epoch, seed, populations[island], inbound[island],
+                                       lower, upper, population_size, span, fitness, elites, mutation_rate,
+                                       migrants)
+                       for island in range(islands)]
+            outbound = [None] * islands
+            for future in as_completed(futures):
+                island, population, emigrants, best = future.result()
+                populations[island] = population
+                outbound[island] = emigrants
+                bests[island] = best
+            done += span
+            epoch += 1
+
+            inbound = [[] for _ in range(islands)]
+            if islands > 1:
+                for island in range(islands):
+                    if topology == Topology.RING:
+                        destination = (island + 1) % islands
+                    else:
+                        destination = router.randrange(islands - 1)
+                        destination += destination >= island
+                    inbound[destination].extend(outbound[island])
+            yield done, list(bests)
+
+def genetic_algorithm():
+    lower = int(input("Enter lower bound: "))
+    upper = int(input("Enter upper bound: "))
+    population_size = int(input("Enter population size: "))
+    generations = int(input("Enter number of generations: "))
+    islands = int(input("Enter number of islands (1 for a single population): "))
+
+    if islands > 1:
+        migration_interval = int(input("Enter generations between migrations: "))
+        for done, bests in island_model(lower, upper, population_size, generations, islands, migration_interval):
+            print(f"Generation {done}: " + ", ".join(f"island {i} best {best}" for i, (best, _) in enumerate(bests)))
+        best, best_fitness = max(bests, key=lambda entry: entry[1])
+        print(f"Best solution: {best} with fitness {best_fitness}")
+        return
+
+    cache = FitnessCache(batched(fitness_function))
+    population = generate_population(population_size, lower, upper)
+    population = evolve(population, lower, upper, generations, evaluate=cache.evaluate)
+
+    best = max(population, key=cache)
+    print(f"Best solution: {best} with fitness {cache(best)}")
+    print(cache.report())
 
 if __name__ == "__main__":
     genetic_algorithm()
@@ -0,0 +1,199 @@
+#Graph loading & binary snapshots
+import argparse
+import math
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import Iterable, Optional, Tuple
+
+from CSR_Graph import (CSRGraph, CSRGraphBuilder, NODE_TYPECODE, OFFSET_TYPECODE,
+                       WEIGHT_TYPECODE)
+
+SNAPSHOT_MAGIC = b"CSRG"
+SNAPSHOT_VERSION = 1
+# magic, version, little-endian flag, has heuristics, num_nodes, num_edges
+_HEADER = struct.Struct("<4sHBBqq")
+_ALIGN = 8
+
+
+def _parse_rows(lines: Iterable[str], delimiter: Optional[str]):
+    """Yield (line_number, fields) for data rows, skipping blanks, comments and a header row"""
+    first = True
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = line.replace(",", " ").split() if delimiter is None else line.split(delimiter)
+        if first:
+            first = False
+            # a header can only be the first row with content
+            if not fields[0].strip().lstrip("-").isdigit():
+                continue
+        yield line_number, fields
+
+
+def iter_edge_chunks(path: str, delimiter: Optional[str] = None,
+                     chunk_size: int = 1_000_000) -> Iterable[Tuple[array, array, array, array]]:
+    """Stream an edge list ("source destination [weight]" per line) in chunks.
+
+    Fields are split on delimiter, or on commas/whitespace when it is None. Each chunk is
+    (sources, targets, weights, line_numbers); a missing weight defaults to 1.0.
+    """
+    with open(path, "r", newline="") as f:
+        rows = _parse_rows(f, delimiter)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            sources = array(NODE_TYPECODE)
+            targets = array(NODE_TYPECODE)
+            weights = array(WEIGHT_TYPECODE)
+            line_numbers = array("q")
+            for line_number, fields in chunk:
+                try:
+                    sources.append(int(fields[0]))
+                    targets.append(int(fields[1]))
+                    weights.append(float(fields[2]) if len(fields) > 2 else 1.0)
+                except (ValueError, IndexError, OverflowError):
+                    raise ValueError(f"{path}:{line_number}: expected 'source destination weight'")
+                line_numbers.append(line_number)
+            yield sources, targets, weights, line_numbers
+
+
+def load_edge_list(path: str, num_nodes: Optional[int] = None, delimiter: Optional[str] = None,
+                   chunk_size: int = 1_000_000) -> CSRGraph:
+    """Load an edge list into a CSRGraph, validating node bounds and weights one chunk at a time.
+
+    If num_nodes is None it is inferred as the largest node id + 1.
+    """
+    builder = CSRGraphBuilder(num_nodes if num_nodes is not None else 0)
+    largest = -1
+    for sources, targets, weights, line_numbers in iter_edge_chunks(path, delimiter, chunk_size):
+        low = min(min(sources), min(targets))
+        high = max(max(sources), max(targets))
+        if low < 0 or (num_nodes is not None and high >= num_nodes):
+            limit = num_nodes if num_nodes is not None else float('inf')
+            bad = next(line_number for u, v, line_number in zip(sources, targets, line_numbers)
+                       if not (0 <= u < limit and 0 <= v < limit))
+            if num_nodes is None:
+                raise ValueError(f"{path}:{bad}: node ids must be non-negative")
+            raise ValueError(f"{path}:{bad}: nodes must be between 0 and {num_nodes - 1}")
+        # NaN fails every comparison, so min(weights) < 0 alone would let it through
+        if not all(math.isfinite(w) and w >= 0 for w in weights):
+            bad = next(line_number for w, line_number in zip(weights, line_numbers)
+                       if not (math.isfinite(w) and w >= 0))
+            raise ValueError(f"{path}:{bad}: weight must be a non-negative finite number")
+        largest = max(largest, high)
+        builder.add_edges(sources, targets, weights)
+    if num_nodes is None:
+        builder.num_nodes = largest + 1
+    return builder.build()
+
+
+def load_heuristics(path: str, graph, delimiter: Optional[str] = None,
+                    chunk_size: int = 1_000_000):
+    """Stream a "node value" table into graph.set_heuristic (GBFS_Astar.Graph or CSRGraph)"""
+    with open(path, "r", newline="") as f:
+        rows = _parse_rows(f, delimiter)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return graph
+            try:
+                nodes = array(NODE_TYPECODE, [int(fields[0]) for _, fields in chunk])
+                values = array(WEIGHT_TYPECODE, [float(fields[1]) for _, fields in chunk])
+            except (ValueError, IndexError, OverflowError):
+                raise ValueError(f"{path}: expected 'node value' rows near line {chunk[0][0]}")
+            if min(nodes) < 0 or max(nodes) >= graph.num_nodes:
+                bad = next(n for (n, _), node in zip(chunk, nodes) if not 0 <= node < graph.num_nodes)
+                raise ValueError(f"{path}:{bad}: nodes must be between 0 and {graph.num_nodes-1}")
+            for node, value in zip(nodes, values):
+                graph.set_heuristic(node, value)
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGN
+
+
+def save_snapshot(graph, path: str):
+    """Write a graph (CSRGraph or any Graph with .graph adjacency lists) as a binary snapshot.
+
+    Layout: header, then offsets (int64), targets (int32), weights (float64) and optional
+    heuristics (float64), each section padded to 8 bytes so it can be mapped in place.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph)
+    sections = [array(OFFSET_TYPECODE, graph.offsets), array(NODE_TYPECODE, graph.targets),
+                array(WEIGHT_TYPECODE, graph.weights)]
+    if graph.heuristics is not None:
+        sections.append(array(WEIGHT_TYPECODE, graph.heuristics))
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, sys.byteorder == "little",
+                             graph.heuristics is not None, graph.num_nodes, graph.num_edges))
+        written = _HEADER.size
+        for section in sections:
+            f.write(bytes(_padding(written)))
+            written += _padding(written)
+            section.tofile(f)
+            written += len(section) * section.itemsize
+
+
+def load_snapshot(path: str) -> CSRGraph:
+    """Memory-map a snapshot written by save_snapshot; no edge data is parsed or copied.
+
+    The returned graph is read-only and pages are loaded lazily by the OS on first touch.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapped)
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"{path} is truncated")
+    magic, version, little, has_heuristics, num_nodes, num_edges = _HEADER.unpack_from(buffer)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"{path} is not a graph snapshot")
+    if bool(little) != (sys.byteorder == "little"):
+        raise ValueError(f"{path} was written on a machine with a different byte order")
+
+    position = _HEADER.size
+    lengths = [(OFFSET_TYPECODE, num_nodes + 1), (NODE_TYPECODE, num_edges),
+               (WEIGHT_TYPECODE, num_edges)]
+    if has_heuristics:
+        lengths.append((WEIGHT_TYPECODE, num_nodes))
+    # slicing past the end would just cut a section short, so check the whole size first
+    spans = []
+    for typecode, length in lengths:
+        position += _padding(position)
+        size = length * array(typecode).itemsize
+        spans.append((typecode, position, size))
+        position += size
+    if len(buffer) < position:
+        raise ValueError(f"{path} is truncated")
+    sections = [buffer[start:start + size].cast(typecode) for typecode, start, size in spans]
+    offsets, targets, weights = sections[:3]
+    heuristics = sections[3] if has_heuristics else None
+    return CSRGraph(num_nodes, offsets, targets, weights, heuristics)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert an edge list into a binary graph snapshot")
+    parser.add_argument("edges", help="edge list: 'source destination [weight]' per line")
+    parser.add_argument("snapshot", help="output snapshot path")
+    parser.add_argument("--nodes", type=int, help="number of nodes (default: largest id + 1)")
+    parser.add_argument("--heuristics", help="optional 'node value' table for GBFS/A*")
+    parser.add_argument("--delimiter", help="field delimiter (default: commas or whitespace)")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    try:
+        graph = load_edge_list(args.edges, args.nodes, args.delimiter, args.chunk_size)
+        if args.heuristics:
+            load_heuristics(args.heuristics, graph, args.delimiter, args.chunk_size)
+        save_snapshot(graph, args.snapshot)
+        print(f"Wrote {graph.num_nodes} nodes and {graph.num_edges} edges to {args.snapshot}")
+    except ValueError as e:
+        print(f"Error: {str(e)}")
+
+if __name__ == "__main__":
+    main()
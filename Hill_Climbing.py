@@ -1,4 +1,12 @@
 #Hill climbing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def calfunc(x, y): 
     return 3 - (x*2 + y*2) 
  
@@ -10,20 +18,152 @@ def findneighbors(x, y):
     list2.append([x - 1, y + 1]) 
     return list2 
  
-x = int(input("Enter initial value for x: ")) 
-y = int(input("Enter initial value for y: ")) 
- 
-while True: 
-    list1 = [] 
-    opt = calfunc(x, y) 
-    neighbors = findneighbors(x, y) 
-    for i in range(len(neighbors)): 
-        list1.append(calfunc(neighbors[i][0], neighbors[i][1])) 
-    max_val = max(list1) 
-    index = list1.index(max_val) 
-    x_new, y_new = neighbors[index][0], neighbors[index][1] 
-     
-    if calfunc(x_new, y_new) <= opt: 
-        break 
-    x, y = x_new, y_new 
-    print(f"New x: {x}, New y: {y}")
+def _require_numpy():
+    if np is None:
+        raise ImportError("The hill-climbing library needs NumPy: pip install numpy")
+
+# 2**20 rows is already a million candidates per step
+MAX_DIAGONAL_DIMENSIONS = 20
+# above this axis_neighbors' 2N x N candidate array gets expensive; None picks RandomNeighbors instead
+MAX_AXIS_DIMENSIONS = 256
+
+def diagonal_neighbors(point, rng=None):
+    """Every point one step away on all axes at once (findneighbors in N dimensions, 2**N rows).
+
+    Only for small N: more than MAX_DIAGONAL_DIMENSIONS dimensions is a ValueError.
+    """
+    if len(point) > MAX_DIAGONAL_DIMENSIONS:
+        raise ValueError(f"diagonal_neighbors makes 2**N neighbors; {len(point)} dimensions is too many "
+                         f"(at most {MAX_DIAGONAL_DIMENSIONS}), use axis_neighbors or RandomNeighbors")
+    signs = (np.arange(2 ** len(point))[:, None] >> np.arange(len(point))) & 1
+    return point + (signs * 2 - 1).astype(point.dtype)
+
+def axis_neighbors(point, rng=None, step=1):
+    """The 2N points one step away along a single axis"""
+    moves = np.concatenate((np.eye(len(point)), -np.eye(len(point)))) * step
+    return point + moves.astype(np.result_type(point, step), copy=False)
+
+class RandomNeighbors:
+    """count random Gaussian moves of the given scale; cheap in thousands of dimensions"""
+
+    def __init__(self, count=64, scale=1.0):
+        self.count = count
+        self.scale = scale
+
+    def __call__(self, point, rng):
+        return point + rng.normal(0.0, self.scale, (self.count, len(point)))
+
+def default_neighbors(dimensions):
+    """What neighbors=None means: axis_neighbors up to MAX_AXIS_DIMENSIONS dimensions, beyond
+    that RandomNeighbors with moves of about unit length (scale 1 / sqrt(N))"""
+    if dimensions <= MAX_AXIS_DIMENSIONS:
+        return axis_neighbors
+    return RandomNeighbors(scale=1.0 / dimensions ** 0.5)
+
+def hill_climb(objective, neighbors, start, max_steps=1000, rng=None):
+    """Steepest-ascent hill climbing from start; returns (point, value, trajectory).
+
+    objective scores a whole (k, N) array of points in one call and returns k values;
+    neighbors(point, rng) returns the (k, N) candidates of a point (None: default_neighbors(N)).
+    Stops when no neighbor is better or after max_steps moves. trajectory holds the value after every move,
+    starting with the value of start.
+    """
+    _require_numpy()
+    rng = rng or np.random.default_rng()
+    point = np.asarray(start)
+    if neighbors is None:
+        neighbors = default_neighbors(len(point))
+    value = objective(point[None, :])[0]
+    trajectory = [value]
+
+    for _ in range(max_steps):
+        candidates = neighbors(point, rng)
+        scores = objective(candidates)
+        best = int(np.argmax(scores))
+        if scores[best] <= value:
+            break
+        point, value = candidates[best], scores[best]
+        trajectory.append(value)
+
+    return point, value, np.array(trajectory, dtype=np.float64)
+
+class RestartResult:
+    """What random_restarts returns: the overall best plus one row per restart.
+
+    points/values are every restart's final point and value; trajectories is
+    (restarts, longest run + 1), padded with NaN after a restart stopped; steps counts the
+    moves each restart made.
+    """
+
+    def __init__(self, points, values, trajectories):
+        self.points = np.stack(points)
+        self.values = np.array(values, dtype=np.float64)
+        self.steps = np.array([len(trajectory) - 1 for trajectory in trajectories])
+        self.trajectories = np.full((len(trajectories), self.steps.max() + 1), np.nan)
+        for row, trajectory in enumerate(trajectories):
+            self.trajectories[row, :len(trajectory)] = trajectory
+        best = int(np.argmax(self.values))
+        self.best_point = self.points[best]
+        self.best_value = self.values[best]
+
+def _climb_chunk(objective, neighbors, starts, first, max_steps, seed):
+    results = []
+    for offset, start in enumerate(starts):
+        # one generator per restart, so results do not depend on how restarts are split up
+        rng = np.random.default_rng([seed, first + offset])
+        results.append(hill_climb(objective, neighbors, start, max_steps, rng))
+    return results
+
+def random_restarts(objective, neighbors, lower, upper, dimensions, restarts, max_steps=1000,
+                    processes=None, seed=None):
+    """Hill climbing from restarts uniform random points in [lower, upper]**dimensions.
+
+    The restarts are split across a process pool (objective and neighbors must be picklable,
+    e.g. module-level functions or RandomNeighbors); processes=1 runs them here instead.
+    neighbors=None uses default_neighbors(dimensions). The same seed gives the same
+    RestartResult whatever the process count.
+    """
+    _require_numpy()
+    if restarts < 1:
+        raise ValueError("Need at least one restart")
+    if neighbors is None:
+        neighbors = default_neighbors(dimensions)
+    if seed is None:
+        seed = int(np.random.default_rng().integers(2 ** 63))
+    starts = np.random.default_rng(seed).uniform(lower, upper, (restarts, dimensions))
+    processes = processes or min(restarts, os.cpu_count() or 1)
+    chunks = np.array_split(np.arange(restarts), processes)
+
+    if processes == 1:
+        results = _climb_chunk(objective, neighbors, starts, 0, max_steps, seed)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_climb_chunk, objective, neighbors, starts[chunk], int(chunk[0]),
+                                       max_steps, seed)
+                       for chunk in chunks if len(chunk)]
+            results = [result for future in futures for result in future.result()]
+
+    points, values, trajectories = zip(*results)
+    return RestartResult(points, values, trajectories)
+
+def main():
+    x = int(input("Enter initial value for x: "))
+    y = int(input("Enter initial value for y: "))
+
+    while True:
+        list1 = []
+        opt = calfunc(x, y)
+        neighbors = findneighbors(x, y)
+        for i in range(len(neighbors)):
+            list1.append(calfunc(neighbors[i][0], neighbors[i][1]))
+        max_val = max(list1)
+        index = list1.index(max_val)
+        x_new, y_new = neighbors[index][0], neighbors[index][1]
+
+        if calfunc(x_new, y_new) <= opt:
+            break
+        x, y = x_new, y_new
+        print(f"New x: {x}, New y: {y}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#BFS, UCS, DFID & A* over implicit graphs given by a successor callback
+import heapq
+from array import array
+from collections import deque
+from enum import Enum
+from itertools import count
+from typing import Callable, Hashable, Iterable, List, Optional, Tuple
+
+State = Hashable
+Successors = Callable[[State], Iterable[Tuple[State, float]]]
+
+_MASK = (1 << 64) - 1
+_EMPTY = 0
+
+
+class SearchType(Enum):
+    BFS = "bfs"
+    UCS = "ucs"
+    DFID = "dfid"
+    ASTAR = "astar"
+
+
+def fingerprint(state: State) -> int:
+    """64-bit fingerprint of a hashable state, never 0.
+
+    hash() times a 64-bit odd constant, with the high half folded down so the low bits the
+    table probes on depend on the whole hash (hash(n) == n for small ints).
+    """
+    x = (hash(state) * 0x9E3779B97F4A7C15) & _MASK
+    return (x ^ (x >> 32)) or 1
+
+
+def graph_successors(graph) -> Successors:
+    """Successor callback over an explicit graph, so every Graph class works here too"""
+    return lambda node: graph.graph[node]
+
+
+class FingerprintTable:
+    """Open-addressing (linear probing) table of 64-bit state fingerprints.
+
+    Each key carries its parent's fingerprint and a cost, all in flat arrays: 24 bytes a
+    slot, at most half of them full, instead of a dict entry plus the state object itself.
+    Two states with the same fingerprint are taken to be the same state; with 64 bits that
+    needs around 2**32 stored states to become likely.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        size = 8
+        while size < 2 * capacity:
+            size *= 2
+        self._allocate(size)
+
+    def _allocate(self, size: int):
+        self.mask = size - 1
+        self.size = 0
+        self.keys = array('Q', bytes(8 * size))
+        self.parents = array('Q', bytes(8 * size))
+        self.costs = array('d', bytes(8 * size))
+
+    def _slot(self, key: int) -> int:
+        keys, mask = self.keys, self.mask
+        slot = key & mask
+        while True:
+            found = keys[slot]
+            if found == key or found == _EMPTY:
+                return slot
+            slot = (slot + 1) & mask
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: int) -> bool:
+        return self.keys[self._slot(key)] == key
+
+    def cost(self, key: int) -> Optional[float]:
+        slot = self._slot(key)
+        return self.costs[slot] if self.keys[slot] == key else None
+
+    def parent(self, key: int) -> int:
+        """Fingerprint of the parent key was stored with (0 for the root)"""
+        return self.parents[self._slot(key)]
+
+    def put(self, key: int, parent: int, cost: float):
+        slot = self._slot(key)
+        if self.keys[slot] != key:
+            slot = self._claim(slot, key)
+        self.parents[slot] = parent
+        self.costs[slot] = cost
+
+    def relax(self, key: int, parent: int, cost: float) -> bool:
+        """Store key if it is new or cost beats its stored cost, with a single probe; True if stored"""
+        slot = self._slot(key)
+        if self.keys[slot] != key:
+            slot = self._claim(slot, key)
+        elif cost >= self.costs[slot]:
+            return False
+        self.parents[slot] = parent
+        self.costs[slot] = cost
+        return True
+
+    def _claim(self, slot: int, key: int) -> int:
+        """Take the empty slot key probed to, growing first when that would pass half full"""
+        if 2 * (self.size + 1) > len(self.keys):
+            self._grow()
+            slot = self._slot(key)
+        self.keys[slot] = key
+        self.size += 1
+        return slot
+
+    def _grow(self):
+        keys, parents, costs = self.keys, self.parents, self.costs
+        size = self.size
+        self._allocate(2 * len(keys))
+        self.size = size
+        new_keys, new_parents, new_costs, mask = self.keys, self.parents, self.costs, self.mask
+        for slot, key in enumerate(keys):
+            if key != _EMPTY:
+                new_slot = key & mask
+                while new_keys[new_slot] != _EMPTY:
+                    new_slot = (new_slot + 1) & mask
+                new_keys[new_slot] = key
+                new_parents[new_slot] = parents[slot]
+                new_costs[new_slot] = costs[slot]
+
+    def nbytes(self) -> int:
+        return len(self.keys) * 24
+
+    def chain(self, key: int) -> List[int]:
+        """Fingerprints from the root down to key, following parents"""
+        chain = []
+        while key != _EMPTY:
+            chain.append(key)
+            key = self.parent(key)
+        chain.reverse()
+        return chain
+
+
+class ImplicitSearch:
+    """Searches that generate neighbours on demand with successors(state) -> (state, weight) pairs.
+
+    Only fingerprints go into the visited/closed table; states are kept just while they wait
+    in the frontier. Paths are rebuilt by replaying successors from the start along the stored
+    fingerprint chain, so successors must be deterministic.
+    """
+
+    def __init__(self, fingerprint: Callable[[State], int] = fingerprint):
+        self.fingerprint = fingerprint
+        self.table: Optional[FingerprintTable] = None
+
+    def _replay(self, start: State, successors: Successors, target_key: int,
+                cheapest: bool) -> Tuple[List[State], float]:
+        """Walk the fingerprint chain forwards, regenerating the states and edge weights.
+
+        cheapest picks the lightest edge to each next state (what UCS/A* settled on);
+        otherwise the first one, the edge BFS discovered it through.
+        """
+        path = [start]
+        total_weight = 0.0
+        current = start
+        for key in self.table.chain(target_key)[1:]:
+            best = None
+            for state, weight in successors(current):
+                if self.fingerprint(state) == key and (best is None or (cheapest and weight < best[1])):
+                    best = (state, weight)
+                    if not cheapest:
+                        break
+            current, weight = best
+            path.append(current)
+            total_weight += weight
+        return path, total_weight
+
+    def bfs(self, start: State, target: State, successors: Successors) -> Tuple[Optional[List[State]], float]:
+        """Breadth-First Search; the same path as SearchAlgorithms.bfs on an explicit graph"""
+        fingerprint = self.fingerprint
+        self.table = table = FingerprintTable()
+        table.put(fingerprint(start), _EMPTY, 0.0)
+        if start == target:
+            return [start], 0.0
+        relax = table.relax
+        # only states wait in the queue; their fingerprint is cheaper to recompute than to keep
+        queue = deque([start])
+
+        while queue:
+            current = queue.popleft()
+            current_key = fingerprint(current)
+            for state, _ in successors(current):
+                key = fingerprint(state)
+                if not relax(key, current_key, 0.0):
+                    continue
+                if state == target:
+                    return self._replay(start, successors, key, cheapest=False)
+                queue.append(state)
+
+        return None, 0.0
+
+    def astar(self, start: State, target: State, successors: Successors,
+              heuristic: Optional[Callable[[State], float]] = None) -> Tuple[Optional[List[State]], float]:
+        """A* search (Uniform Cost Search when heuristic is None); the table holds each state's best g"""
+        heuristic = heuristic or (lambda state: 0.0)
+        fingerprint = self.fingerprint
+        self.table = table = FingerprintTable()
+        table.put(fingerprint(start), _EMPTY, 0.0)
+        # the counter breaks ties, so states never need to be comparable
+        tie = count()
+        open_set = [(heuristic(start), 0.0, next(tie), start)]
+        relax = table.relax
+
+        while open_set:
+            _, cost, _, current = heapq.heappop(open_set)
+            current_key = fingerprint(current)
+            if cost > table.cost(current_key):
+                continue
+            if current == target:
+                return self._replay(start, successors, current_key, cheapest=True)
+            for state, weight in successors(current):
+                new_cost = cost + weight
+                if relax(fingerprint(state), current_key, new_cost):
+                    heapq.heappush(open_set, (new_cost + heuristic(state), new_cost, next(tie), state))
+
+        return None, 0.0
+
+    def ucs(self, start: State, target: State, successors: Successors) -> Tuple[Optional[List[State]], float]:
+        """Uniform Cost Search"""
+        return self.astar(start, target, successors)
+
+    def dfid(self, start: State, target: State, successors: Successors,
+             max_depth: int) -> Tuple[Optional[List[State]], float]:
+        """Depth-First Iterative Deepening; returns the first path found at the smallest depth.
+
+        Each iteration keeps the shallowest depth it reached every state at, so a state met
+        again no shallower is not explored twice within the iteration.
+        """
+        fingerprint = self.fingerprint
+        if start == target:
+            return [start], 0.0
+        for depth_limit in range(1, max_depth + 1):
+            self.table = table = FingerprintTable()
+            table.put(fingerprint(start), _EMPTY, 0)
+            path = [start]
+            weights = [0.0]
+            iterators = [iter(successors(start))]
+
+            while iterators:
+                for state, weight in iterators[-1]:
+                    depth = len(path)
+                    if not table.relax(fingerprint(state), _EMPTY, depth):
+                        continue
+                    if state == target:
+                        path.append(state)
+                        weights.append(weight)
+                        return path, sum(weights)
+                    if depth < depth_limit:
+                        path.append(state)
+                        weights.append(weight)
+                        iterators.append(iter(successors(state)))
+                        break
+                else:
+                    iterators.pop()
+                    path.pop()
+                    weights.pop()
+
+        return None, 0.0
+
+    def search(self, search_type: SearchType, start: State, target: State, successors: Successors,
+               heuristic: Optional[Callable[[State], float]] = None,
+               max_depth: Optional[int] = None) -> Tuple[Optional[List[State]], float]:
+        match search_type:
+            case SearchType.BFS:
+                return self.bfs(start, target, successors)
+            case SearchType.UCS:
+                return self.ucs(start, target, successors)
+            case SearchType.DFID:
+                if max_depth is None:
+                    raise ValueError("Max depth must be specified for DFID")
+                return self.dfid(start, target, successors, max_depth)
+            case SearchType.ASTAR:
+                return self.astar(start, target, successors, heuristic)
+            case _:
+                raise ValueError("Invalid search type")
@@ -0,0 +1,144 @@
+#Incremental replanning (Lifelong Planning A*) for graphs whose edges change
+import heapq
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+INF = float('inf')
+
+
+class IncrementalSearch:
+    """Lifelong Planning A* between a fixed start and target.
+
+    g and rhs (the one-step lookahead cost through the best predecessor) are kept between
+    plan() calls. update_edges changes weights through graph.update_edge and only touches the
+    nodes at the changed edges; the next plan() re-expands just the nodes whose cost those
+    changes made inconsistent, instead of searching the whole graph again.
+
+    The graph needs reverse_graph and update_edge (both Graph classes of BFS_UCS and
+    GBFS_Astar have them). Changes made behind the planner's back - through add_edge or
+    update_edge directly - show up as a new graph.version and trigger a full replan.
+    Weights must be positive: around a zero-weight cycle rhs values can end up supporting
+    each other instead of coming from the start.
+    """
+
+    def __init__(self, graph, start: int, target: int,
+                 heuristic: Optional[Callable[[int], float]] = None):
+        if getattr(graph, "reverse_graph", None) is None:
+            raise ValueError("Incremental search needs a graph with a reverse adjacency index")
+        self.graph = graph
+        self.start = start
+        self.target = target
+        # must be consistent, e.g. LandmarkIndex.heuristic(target); the default 0 gives incremental UCS
+        self.heuristic = heuristic or (lambda node: 0.0)
+        self.expansions = 0
+        self._reset()
+
+    def _reset(self):
+        self.g: Dict[int, float] = {}
+        self.rhs: Dict[int, float] = {self.start: 0.0}
+        self.parents: Dict[int, Optional[Tuple[int, float]]] = {self.start: None}
+        self.keys: Dict[int, Tuple[float, float]] = {}
+        self.queue: List[Tuple[float, float, int]] = []
+        self.version = getattr(self.graph, "version", 0)
+        self._enqueue(self.start)
+
+    def _key(self, node: int) -> Tuple[float, float]:
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return best + self.heuristic(node), best
+
+    def _enqueue(self, node: int):
+        """Queue node under its current key if g and rhs disagree, otherwise drop it from the queue"""
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            key = self._key(node)
+            self.keys[node] = key
+            heapq.heappush(self.queue, (key[0], key[1], node))
+        else:
+            self.keys.pop(node, None)
+
+    def _recompute(self, node: int):
+        """Set rhs of node from scratch over all its predecessors (the start stays at 0)"""
+        if node == self.start:
+            return
+        best, parent = INF, None
+        for predecessor, weight in self.graph.reverse_graph[node]:
+            cost = self.g.get(predecessor, INF) + weight
+            if cost < best:
+                best, parent = cost, (predecessor, weight)
+        if parent is None:
+            self.rhs.pop(node, None)
+            self.parents.pop(node, None)
+        else:
+            self.rhs[node] = best
+            self.parents[node] = parent
+        self._enqueue(node)
+
+    def _compute(self):
+        g, rhs, parents, keys, queue = self.g, self.rhs, self.parents, self.keys, self.queue
+        target = self.target
+        while queue:
+            k1, k2, node = queue[0]
+            if keys.get(node) != (k1, k2):
+                heapq.heappop(queue)
+                continue
+            if (k1, k2) >= self._key(target) and rhs.get(target, INF) == g.get(target, INF):
+                break
+            heapq.heappop(queue)
+            del keys[node]
+            self.expansions += 1
+
+            old_cost = g.get(node, INF)
+            new_cost = rhs.get(node, INF)
+            if old_cost > new_cost:
+                # cost went down: settle it and offer the cheaper route to every successor
+                g[node] = new_cost
+                for neighbor, weight in self.graph.graph[node]:
+                    if neighbor != self.start and new_cost + weight < rhs.get(neighbor, INF):
+                        rhs[neighbor] = new_cost + weight
+                        parents[neighbor] = (node, weight)
+                        self._enqueue(neighbor)
+            else:
+                # cost went up: forget it, and re-derive every node whose best route came through it
+                del g[node]
+                self._recompute(node)
+                for neighbor, _ in self.graph.graph[node]:
+                    parent = parents.get(neighbor)
+                    if parent is not None and parent[0] == node:
+                        self._recompute(neighbor)
+
+    def update_edges(self, changes: Iterable[Tuple[int, int, float]]):
+        """Apply (u, v, weight) changes with graph.update_edge, adding edges that do not exist yet"""
+        update_edge = getattr(self.graph, "update_edge", None)
+        if update_edge is None:
+            raise ValueError("Incremental search needs a graph with update_edge")
+        if getattr(self.graph, "version", 0) != self.version:
+            self._reset()
+        for u, v, weight in changes:
+            if weight <= 0:
+                raise ValueError("Incremental search needs positive edge weights")
+            update_edge(u, v, weight)
+            if v == self.start:
+                continue
+            parent = self.parents.get(v)
+            if self.g.get(u, INF) + weight < self.rhs.get(v, INF):
+                self.rhs[v] = self.g[u] + weight
+                self.parents[v] = (u, weight)
+                self._enqueue(v)
+            elif parent is not None and parent[0] == u:
+                self._recompute(v)
+        self.version = getattr(self.graph, "version", 0)
+
+    def plan(self) -> Tuple[List[int], float]:
+        """Shortest (path, total_weight) for the current weights, ([], 0) if there is none"""
+        if getattr(self.graph, "version", 0) != self.version:
+            self._reset()
+        self._compute()
+        if self.g.get(self.target, INF) == INF:
+            return [], 0
+        path = []
+        total_weight = 0
+        current = self.target
+        while current != self.start:
+            path.append(current)
+            current, weight = self.parents[current]
+            total_weight += weight
+        path.append(self.start)
+        return path[::-1], total_weight
@@ -0,0 +1,87 @@
+#Lazy k-shortest loopless paths (Yen's algorithm) on top of UCS
+import heapq
+from collections import defaultdict
+from itertools import count
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from BFS_UCS import SearchAlgorithms
+
+
+class _MaskedAdjacency:
+    """graph.graph with some nodes and edges hidden, without copying any adjacency list"""
+
+    def __init__(self, adjacency, removed_nodes: Set[int], removed_edges: Set[Tuple[int, int]]):
+        self.adjacency = adjacency
+        self.removed_nodes = removed_nodes
+        self.removed_edges = removed_edges
+
+    def __getitem__(self, node: int) -> List[Tuple[int, float]]:
+        if node in self.removed_nodes:
+            return []
+        removed_nodes, removed_edges = self.removed_nodes, self.removed_edges
+        return [(neighbor, weight) for neighbor, weight in self.adjacency[node]
+                if neighbor not in removed_nodes and (node, neighbor) not in removed_edges]
+
+
+class _MaskedGraph:
+    """Just enough of a graph for SearchAlgorithms.ucs: num_nodes and a masked .graph"""
+
+    def __init__(self, graph, removed_nodes: Set[int], removed_edges: Set[Tuple[int, int]]):
+        self.num_nodes = graph.num_nodes
+        self.graph = _MaskedAdjacency(graph.graph, removed_nodes, removed_edges)
+
+
+def _prefix_costs(searcher: SearchAlgorithms, path: List[int], base: float) -> List[float]:
+    """Cost of reaching every node of a path ucs just returned, from the parent pointers it left"""
+    costs = [base]
+    for node in path[1:]:
+        costs.append(costs[-1] + searcher.path[node][1])
+    return costs
+
+
+def k_shortest_paths(graph, start: int, target: int,
+                     max_paths: Optional[int] = None) -> Iterator[Tuple[List[int], float]]:
+    """Yield loopless start -> target paths as (path, total_weight), cheapest first.
+
+    Yen's algorithm: every new path comes from a ucs "spur" search off a prefix of the one
+    before, on a view of graph with the prefix's nodes and the already-used next edges hidden.
+    Work happens only when the next path is asked for, so stopping after 3 paths costs the
+    spur searches of 3 paths. Paths are distinct node sequences; between parallel edges the
+    lightest one is used, as ucs does.
+    """
+    searcher = SearchAlgorithms()
+    path, total_weight = searcher.ucs(graph, start, target)
+    if not path:
+        return
+    # every accepted path is stored with its prefix costs and the index it left its parent at
+    accepted: List[Tuple[List[int], List[float]]] = []
+    # shared prefixes: prefix -> nodes some accepted path goes to right after it
+    next_nodes: Dict[Tuple[int, ...], Set[int]] = defaultdict(set)
+    candidates = [(total_weight, 0, path, _prefix_costs(searcher, path, 0.0), 0)]
+    seen = {tuple(path)}
+    tie = count(1)
+
+    while candidates and (max_paths is None or len(accepted) < max_paths):
+        total_weight, _, path, costs, deviation = heapq.heappop(candidates)
+        accepted.append((path, costs))
+        for i in range(len(path) - 1):
+            next_nodes[tuple(path[:i + 1])].add(path[i + 1])
+        yield path, total_weight
+
+        if max_paths is not None and len(accepted) == max_paths:
+            return
+        # spurs before the deviation index repeat ones the parent path already generated (Lawler)
+        for i in range(deviation, len(path) - 1):
+            root = path[:i + 1]
+            removed_edges = {(path[i], node) for node in next_nodes[tuple(root)]}
+            masked = _MaskedGraph(graph, set(root[:-1]), removed_edges)
+            spur, _ = searcher.ucs(masked, path[i], target)
+            if not spur:
+                continue
+            candidate = root[:-1] + spur
+            key = tuple(candidate)
+            if key in seen:
+                continue
+            seen.add(key)
+            candidate_costs = costs[:i] + _prefix_costs(searcher, spur, costs[i])
+            heapq.heappush(candidates, (candidate_costs[-1], next(tie), candidate, candidate_costs, i))
@@ -0,0 +1,144 @@
+#Landmark (ALT) heuristics for GBFS & A*
+import heapq
+import mmap
+import random
+import struct
+from array import array
+from typing import Callable, List
+
+from CSR_Graph import CSRGraph
+
+LANDMARK_MAGIC = b"ALTL"
+LANDMARK_VERSION = 1
+# magic, version, num_nodes, num_edges, number of landmarks
+_HEADER = struct.Struct("<4sHxxqqq")
+# float32 keeps ~24 bits of mantissa; bounds shrink by this much per stored value to stay admissible
+_FLOAT32_SLACK = 2.0 ** -23
+
+
+def _as_csr(graph) -> CSRGraph:
+    return graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+
+
+def _edge_count(graph) -> int:
+    if isinstance(graph, CSRGraph):
+        return graph.num_edges
+    return sum(len(edges) for edges in graph.graph.values())
+
+
+def one_to_all(graph: CSRGraph, source: int) -> array:
+    """Dijkstra distances from source to every node as float32 (inf where unreachable)"""
+    costs = [float('inf')] * graph.num_nodes
+    costs[source] = 0.0
+    queue = [(0.0, source)]
+    adjacency = graph.graph
+    while queue:
+        total_cost, current = heapq.heappop(queue)
+        if total_cost > costs[current]:
+            continue
+        for neighbor, weight in adjacency[current]:
+            new_cost = total_cost + weight
+            if new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                heapq.heappush(queue, (new_cost, neighbor))
+    return array('f', costs)
+
+
+class LandmarkIndex:
+    """Distances to and from K landmark nodes, serving the ALT lower bound for any target.
+
+    For a landmark L the triangle inequality gives d(v, t) >= d(L, t) - d(L, v) and
+    d(v, t) >= d(v, L) - d(t, L); the heuristic is the best of these over all landmarks,
+    so it is admissible (and, up to float32 rounding, consistent) on any directed graph with
+    non-negative weights.
+    """
+
+    def __init__(self, num_nodes: int, num_edges: int, landmarks: List[int],
+                 from_landmark: List, to_landmark: List):
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.landmarks = landmarks
+        self.from_landmark = from_landmark
+        self.to_landmark = to_landmark
+
+    @classmethod
+    def build(cls, graph, num_landmarks: int = 8, seed: int = 0) -> "LandmarkIndex":
+        """Pick landmarks by farthest-first selection and run one forward and one reverse pass each"""
+        csr = _as_csr(graph)
+        reverse = csr.reverse()
+        rng = random.Random(seed)
+        num_landmarks = min(num_landmarks, csr.num_nodes)
+        landmarks, from_landmark, to_landmark = [], [], []
+        # smallest round-trip distance to any landmark chosen so far; the next one maximises it
+        spread = [0.0] * csr.num_nodes
+        landmark = rng.randrange(csr.num_nodes) if csr.num_nodes else None
+
+        while len(landmarks) < num_landmarks:
+            landmarks.append(landmark)
+            from_landmark.append(one_to_all(csr, landmark))
+            to_landmark.append(one_to_all(reverse, landmark))
+            best, landmark = -1.0, None
+            for v in range(csr.num_nodes):
+                round_trip = from_landmark[-1][v] + to_landmark[-1][v]
+                spread[v] = min(spread[v], round_trip) if len(landmarks) > 1 else round_trip
+                if spread[v] > best and spread[v] != float('inf') and v not in landmarks:
+                    best, landmark = spread[v], v
+            if landmark is None:
+                remaining = [v for v in range(csr.num_nodes) if v not in landmarks]
+                if not remaining:
+                    break
+                landmark = rng.choice(remaining)
+
+        return cls(csr.num_nodes, csr.num_edges, landmarks, from_landmark, to_landmark)
+
+    def heuristic(self, target: int) -> Callable[[int], float]:
+        """Admissible estimate of d(v, target), for the heuristic argument of gbfs/astar"""
+        bounds = [(forward, forward[target], backward, backward[target])
+                  for forward, backward in zip(self.from_landmark, self.to_landmark)]
+
+        def estimate(node: int) -> float:
+            best = 0.0
+            for forward, forward_target, backward, backward_target in bounds:
+                forward_node = forward[node]
+                backward_node = backward[node]
+                bound = forward_target - forward_node
+                slack = (forward_target + forward_node) * _FLOAT32_SLACK
+                if bound - slack > best:
+                    best = bound - slack
+                bound = backward_node - backward_target
+                slack = (backward_node + backward_target) * _FLOAT32_SLACK
+                if bound - slack > best:
+                    best = bound - slack
+            return best
+
+        return estimate
+
+    def save(self, path: str):
+        """Write the landmark ids and both distance tables as float32, ready to be mapped back in"""
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(LANDMARK_MAGIC, LANDMARK_VERSION, self.num_nodes, self.num_edges,
+                                 len(self.landmarks)))
+            array('q', self.landmarks).tofile(f)
+            for table in self.from_landmark + self.to_landmark:
+                array('f', table).tofile(f)
+
+    @classmethod
+    def load(cls, path: str, graph=None) -> "LandmarkIndex":
+        """Memory-map tables written by save; if graph is given, check they were built for it"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapped)
+        magic, version, num_nodes, num_edges, count = _HEADER.unpack_from(buffer)
+        if magic != LANDMARK_MAGIC or version != LANDMARK_VERSION:
+            raise ValueError(f"{path} is not a landmark table")
+        if graph is not None and (graph.num_nodes != num_nodes or _edge_count(graph) != num_edges):
+            raise ValueError(f"{path} was built for a different graph")
+
+        position = _HEADER.size
+        landmarks = list(buffer[position:position + 8 * count].cast('q'))
+        position += 8 * count
+        tables = []
+        for _ in range(2 * count):
+            tables.append(buffer[position:position + 4 * num_nodes].cast('f'))
+            position += 4 * num_nodes
+        return cls(num_nodes, num_edges, landmarks, tables[:count], tables[count:])
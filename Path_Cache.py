@@ -0,0 +1,135 @@
+#Shortest-path-tree cache for UCS & A*
+import heapq
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# rough per-entry cost of a (parent, weight) tuple plus its float, used for the memory budget
+_ENTRY_BYTES = 80
+
+
+class ShortestPathTree:
+    """Single-source Dijkstra that keeps its state so later targets can reuse or extend it.
+
+    Nodes are settled only as far as the targets asked for so far; a target beyond the
+    settled region resumes the same run instead of starting over. parents holds settled
+    nodes only, so it is always a true shortest-path tree; parents of nodes still in the
+    queue wait in pending until they are popped.
+    """
+
+    def __init__(self, graph, source: int):
+        self.graph = graph
+        self.source = source
+        self.version = getattr(graph, "version", 0)
+        self.parents: Dict[int, Tuple[Optional[int], float]] = {}
+        self.pending: Dict[int, Tuple[Optional[int], float]] = {source: (None, 0.0)}
+        self.costs: Dict[int, float] = {source: 0.0}
+        self.queue = [(0.0, source)]
+
+    def settle_until(self, target: Optional[int] = None) -> bool:
+        """Continue Dijkstra until target is settled (or everything is, if target is None)"""
+        parents, pending = self.parents, self.pending
+        if target in parents:
+            return True
+        adjacency = self.graph.graph
+        while self.queue:
+            total_cost, current = heapq.heappop(self.queue)
+            if current in parents:
+                continue
+            parents[current] = pending.pop(current)
+            for neighbor, weight in adjacency[current]:
+                if neighbor not in parents:
+                    new_cost = total_cost + weight
+                    if neighbor not in self.costs or new_cost < self.costs[neighbor]:
+                        self.costs[neighbor] = new_cost
+                        pending[neighbor] = (current, weight)
+                        heapq.heappush(self.queue, (new_cost, neighbor))
+            if current == target:
+                return True
+        return target is None
+
+    def path_to(self, target: int) -> Tuple[Optional[List[int]], float]:
+        """Walk parent pointers back from an already settled target, O(path length)"""
+        if target not in self.parents:
+            return None, 0.0
+        path = []
+        total_weight = 0.0
+        current = target
+        while current is not None:
+            path.append(current)
+            current, weight = self.parents[current]
+            total_weight += weight
+        path.reverse()
+        return path, total_weight
+
+    def query(self, target: int) -> Tuple[Optional[List[int]], float]:
+        self.settle_until(target)
+        return self.path_to(target)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the tree and its pending queue"""
+        return (sys.getsizeof(self.parents) + sys.getsizeof(self.pending) + sys.getsizeof(self.costs)
+                + sys.getsizeof(self.queue)
+                + (len(self.parents) + len(self.pending) + len(self.queue)) * _ENTRY_BYTES)
+
+
+class ShortestPathCache:
+    """LRU cache of ShortestPathTrees keyed by (graph, source), bounded by approximate bytes.
+
+    A tree is dropped as soon as its graph's version counter moves (Graph.add_edge bumps it),
+    so answers never come from a stale graph.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.trees: "OrderedDict[Tuple[int, int], ShortestPathTree]" = OrderedDict()
+        self.sizes: Dict[Tuple[int, int], int] = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _drop(self, key: Tuple[int, int]):
+        del self.trees[key]
+        self.nbytes -= self.sizes.pop(key)
+
+    def invalidate(self, graph=None):
+        """Forget every tree built on graph, or every tree if graph is None"""
+        for key in [k for k in self.trees if graph is None or k[0] == id(graph)]:
+            self._drop(key)
+
+    def tree(self, graph, source: int) -> ShortestPathTree:
+        key = (id(graph), source)
+        tree = self.trees.get(key)
+        if tree is not None and tree.version != getattr(graph, "version", 0):
+            self.invalidate(graph)
+            tree = None
+        if tree is None:
+            self.misses += 1
+            tree = ShortestPathTree(graph, source)
+            self.trees[key] = tree
+            self.sizes[key] = 0
+        else:
+            self.hits += 1
+            self.trees.move_to_end(key)
+        return tree
+
+    def parents(self, graph, source: int) -> Dict[int, Tuple[Optional[int], float]]:
+        """Settled parent pointers of the cached tree for source, without touching LRU order or stats"""
+        return self.trees[(id(graph), source)].parents
+
+    def query(self, graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """Shortest (path, total_weight) from start to target, reusing any cached tree for start"""
+        key = (id(graph), start)
+        tree = self.tree(graph, start)
+        result = tree.query(target)
+
+        size = tree.nbytes()
+        self.nbytes += size - self.sizes[key]
+        self.sizes[key] = size
+        while self.nbytes > self.max_bytes and len(self.trees) > 1:
+            oldest = next(iter(self.trees))
+            if oldest == key:
+                self.trees.move_to_end(key)
+                continue
+            self._drop(oldest)
+        return result
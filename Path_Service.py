@@ -0,0 +1,411 @@
+#Asyncio path-query service: one loaded graph, many clients over TCP or a Unix socket
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import BFS_UCS
+import Batch_Search
+import DFS_DLS_DFID
+import GBFS_Astar
+from Batch_Search import SharedGraph, _attach_worker
+from Search_Workspace import SearchWorkspace
+
+ALGORITHMS = {
+    "bfs": (BFS_UCS, BFS_UCS.SearchType.BFS),
+    "ucs": (BFS_UCS, BFS_UCS.SearchType.UCS),
+    "astar": (GBFS_Astar, GBFS_Astar.SearchType.ASTAR),
+    "dfid": (DFS_DLS_DFID, DFS_DLS_DFID.SearchType.DFID),
+}
+
+Answer = Tuple[Optional[List[int]], Optional[float]]
+
+
+def _zero_heuristic(node: int) -> float:
+    return 0.0
+
+
+class _Searchers:
+    """One SearchAlgorithms per module over a shared workspace; answers one query at a time"""
+
+    def __init__(self, graph):
+        self.graph = graph
+        workspace = SearchWorkspace(graph.num_nodes)
+        self.searchers = {module: module.SearchAlgorithms(workspace=workspace) for module, _ in ALGORITHMS.values()}
+        # without heuristic values get_heuristic is inf everywhere and A* degrades to the first path
+        # it reaches; 0 is admissible, so astar then returns the same cost as ucs
+        heuristics = getattr(graph, "heuristics", None)
+        self.heuristic = _zero_heuristic if heuristics is None or len(heuristics) == 0 else None
+
+    def answer(self, algorithm: str, start: int, target: int, max_depth: Optional[int]) -> Answer:
+        module, search_type = ALGORITHMS[algorithm]
+        searcher = self.searchers[module]
+        if module is GBFS_Astar:
+            path, total_weight = searcher.astar(self.graph, start, target, heuristic=self.heuristic)
+        else:
+            kwargs = {"max_depth": max_depth} if module is DFS_DLS_DFID else {}
+            path, total_weight = searcher.search(search_type, self.graph, start, target, **kwargs)
+        return (path, total_weight) if path else (None, None)
+
+
+# set in each worker process by _start_worker
+_worker_searchers: Optional[_Searchers] = None
+
+
+def _start_worker(num_nodes: int, layout):
+    global _worker_searchers
+    _attach_worker(num_nodes, layout)
+    _worker_searchers = _Searchers(Batch_Search._worker_graph)
+
+
+def _answer_in_worker(algorithm: str, start: int, target: int, max_depth: Optional[int]) -> Answer:
+    return _worker_searchers.answer(algorithm, start, target, max_depth)
+
+
+def percentiles(samples, points=(50, 90, 99, 99.9)) -> Dict[str, float]:
+    """Nearest-rank percentiles of samples as {"p50": ..., "max": ...}; empty if there are none"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    result = {f"p{point:g}": ordered[max(0, math.ceil(len(ordered) * point / 100) - 1)] for point in points}
+    result["max"] = ordered[-1]
+    return result
+
+
+class PathService:
+    """Answers bfs / ucs / astar / dfid queries on one graph for any number of asyncio clients.
+
+    Searches run in a process pool that maps the graph from shared memory (processes=0 runs
+    them on a single thread of this process instead, which suits small graphs). Identical
+    (algorithm, start, target, max_depth) queries arriving while one is being computed share
+    its result. At most max_pending distinct queries wait for a worker; once that queue is
+    full, new ones wait to get in, and so do the connections sending them, since each client
+    may only have max_client_requests requests open before the service stops reading from it.
+    Latencies of the last `history` requests are kept for latency_percentiles(). On a graph
+    without heuristic values (e.g. a snapshot saved without them) astar uses 0 everywhere,
+    so it still returns the optimal cost.
+
+    Protocol: one JSON object per line each way. {"id": 1, "algorithm": "ucs", "start": 0,
+    "target": 9} gets {"id": 1, "path": [0, ..., 9], "weight": 12.0} (path and weight null if
+    there is none) or {"id": 1, "error": "..."}; dfid takes an optional "max_depth", at most
+    the service's max_depth (also its default).
+    {"id": 2, "op": "stats"} gets {"id": 2, "stats": report()}. Replies to one connection
+    come back in completion order, so clients match them up by id.
+    """
+
+    def __init__(self, graph, processes: Optional[int] = None, max_pending: int = 1024,
+                 max_client_requests: int = 64, max_depth: int = 10, history: int = 100_000):
+        if max_pending < 1 or max_client_requests < 1:
+            raise ValueError("Queue and per-client limits must be at least 1")
+        self.graph = graph
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.max_pending = max_pending
+        self.max_client_requests = max_client_requests
+        self.max_depth = max_depth
+        self.latencies = deque(maxlen=history)
+        self.in_flight: Dict[tuple, asyncio.Future] = {}
+        self.requests = 0
+        self.coalesced = 0
+        self.computed = 0
+        self.errors = 0
+        self.queue: Optional[asyncio.Queue] = None
+        self.executor = None
+        self.shared: Optional[SharedGraph] = None
+        self.local: Optional[_Searchers] = None
+        self.dispatchers: List[asyncio.Task] = []
+        self.servers: List[asyncio.AbstractServer] = []
+        # connection handler task -> its writer and the tasks answering its requests
+        self.connections: Dict[asyncio.Task, Tuple[asyncio.StreamWriter, set]] = {}
+        self.started = 0.0
+        self.closing = False
+
+    async def start(self):
+        """Start the workers; listen() and query() need this first (async with does it)"""
+        self.closing = False
+        self.queue = asyncio.Queue(self.max_pending)
+        if self.processes == 0:
+            self.local = _Searchers(self.graph)
+            self.executor = ThreadPoolExecutor(max_workers=1)
+            workers = 1
+        else:
+            self.shared = SharedGraph(self.graph)
+            self.executor = ProcessPoolExecutor(max_workers=self.processes, initializer=_start_worker,
+                                                initargs=(self.shared.num_nodes, self.shared.layout))
+            workers = self.processes
+        # one dispatcher per worker, so queries wait in the bounded queue rather than the executor's
+        self.dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(workers)]
+        self.started = time.perf_counter()
+
+    async def close(self):
+        """Stop listening, drop the open connections and cancel the queries still waiting"""
+        self.closing = True
+        for server in self.servers:
+            server.close()
+        for writer, tasks in self.connections.values():
+            writer.close()
+            for task in tasks:
+                task.cancel()
+        for task in self.dispatchers:
+            task.cancel()
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        self.dispatchers = []
+        for future in self.in_flight.values():
+            future.cancel()
+        self.in_flight.clear()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        for server in self.servers:
+            await server.wait_closed()
+        self.servers = []
+        if self.executor is not None:
+            # in a thread, so a search still running does not block the event loop
+            await asyncio.to_thread(self.executor.shutdown, wait=True, cancel_futures=True)
+            self.executor = None
+        if self.shared is not None:
+            self.shared.close()
+            self.shared = None
+
+    async def __aenter__(self) -> "PathService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def listen(self, host: str = "127.0.0.1", port: int = 0,
+                     path: Optional[str] = None) -> asyncio.AbstractServer:
+        """Accept clients on a Unix socket at path, or on host:port (port 0 picks a free one)"""
+        if path is not None:
+            server = await asyncio.start_unix_server(self._serve_client, path=path)
+        else:
+            server = await asyncio.start_server(self._serve_client, host, port)
+        self.servers.append(server)
+        return server
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        answer = self.local.answer if self.local is not None else _answer_in_worker
+        while True:
+            key, future = await self.queue.get()
+            try:
+                result = await loop.run_in_executor(self.executor, answer, *key)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.in_flight.pop(key, None)
+                self.computed += 1
+
+    async def query(self, algorithm: str, start: int, target: int, max_depth: Optional[int] = None) -> Answer:
+        """(path, total_weight) for one query, or (None, None) if target cannot be reached"""
+        if self.closing:
+            raise RuntimeError("The service is closing")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algorithm!r}; use one of {', '.join(ALGORITHMS)}")
+        for node in (start, target):
+            if type(node) is not int or not 0 <= node < self.graph.num_nodes:
+                raise ValueError(f"Nodes must be integers between 0 and {self.graph.num_nodes - 1}")
+        if algorithm == "dfid":
+            max_depth = self.max_depth if max_depth is None else max_depth
+            # DFID work grows exponentially with depth, so clients may not go past the service's limit
+            if type(max_depth) is not int or not 0 <= max_depth <= self.max_depth:
+                raise ValueError(f"max_depth must be an integer between 0 and {self.max_depth}")
+        else:
+            max_depth = None
+        key = (algorithm, start, target, max_depth)
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self.in_flight[key] = future
+            try:
+                await self.queue.put((key, future))
+            except asyncio.CancelledError:
+                # never queued: nobody would ever complete it
+                self.in_flight.pop(key, None)
+                future.cancel()
+                raise
+        # shield: one waiter giving up must not cancel the result for the others
+        return await asyncio.shield(future)
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        slots = asyncio.Semaphore(self.max_client_requests)
+        tasks = set()
+        connection = asyncio.current_task()
+        self.connections[connection] = (writer, tasks)
+        try:
+            while True:
+                await slots.acquire()
+                if self.closing:
+                    # lines still buffered from a dropped connection
+                    break
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    break
+                if not line:
+                    break
+                task = asyncio.create_task(self._respond(line, writer, slots))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.connections.pop(connection, None)
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter, slots: asyncio.Semaphore):
+        begin = time.perf_counter()
+        self.requests += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Requests must be JSON objects")
+            request_id = request.get("id")
+            if request.get("op") == "stats":
+                reply = {"id": request_id, "stats": self.report()}
+            else:
+                path, total_weight = await self.query(request.get("algorithm"), request.get("start"),
+                                                      request.get("target"), request.get("max_depth"))
+                reply = {"id": request_id, "path": path, "weight": total_weight}
+        except Exception as error:
+            self.errors += 1
+            reply = {"id": request_id, "error": str(error) or type(error).__name__}
+        finally:
+            slots.release()
+        self.latencies.append(time.perf_counter() - begin)
+        if writer.is_closing():
+            return
+        writer.write(json.dumps(reply).encode() + b"\n")
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        """Percentiles in seconds over the latest requests, from line received to reply ready"""
+        return percentiles(self.latencies)
+
+    def report(self) -> dict:
+        uptime = time.perf_counter() - self.started
+        return {"requests": self.requests, "coalesced": self.coalesced, "computed": self.computed,
+                "errors": self.errors, "queued": self.queue.qsize() if self.queue is not None else 0,
+                "in_flight": len(self.in_flight), "uptime": uptime,
+                "latency_ms": {name: seconds * 1000 for name, seconds in self.latency_percentiles().items()}}
+
+
+class PathClient:
+    """One connection to a PathService; any number of query() calls may be awaited at once"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.waiting: Dict[int, asyncio.Future] = {}
+        self.next_id = 0
+        self.receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None) -> "PathClient":
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _receive(self):
+        try:
+            while line := await self.reader.readline():
+                reply = json.loads(line)
+                future = self.waiting.pop(reply.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        finally:
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Service closed the connection"))
+            self.waiting.clear()
+
+    async def request(self, **fields) -> dict:
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[self.next_id] = future
+        self.writer.write(json.dumps({"id": self.next_id, **fields}).encode() + b"\n")
+        await self.writer.drain()
+        return await future
+
+    async def query(self, algorithm: str, start: int, target: int, max_depth: Optional[int] = None) -> Answer:
+        fields = {"algorithm": algorithm, "start": start, "target": target}
+        if max_depth is not None:
+            fields["max_depth"] = max_depth
+        reply = await self.request(**fields)
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        return reply["path"], reply["weight"]
+
+    async def stats(self) -> dict:
+        return (await self.request(op="stats"))["stats"]
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.receiver.cancel()
+        await asyncio.gather(self.receiver, return_exceptions=True)
+
+
+async def serve(args):
+    from Graph_IO import load_snapshot
+    graph = load_snapshot(args.snapshot)
+    async with PathService(graph, args.processes, args.max_pending, args.max_client_requests,
+                           args.max_depth) as service:
+        if args.unix:
+            await service.listen(path=args.unix)
+            where = args.unix
+        else:
+            server = await service.listen(args.host, args.port)
+            where = "{}:{}".format(*server.sockets[0].getsockname()[:2])
+        print(f"Serving {graph.num_nodes} nodes / {graph.num_edges} edges on {where}")
+        try:
+            while True:
+                await asyncio.sleep(args.report_every)
+                print(json.dumps(service.report()))
+        finally:
+            print(json.dumps(service.report()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve path queries on a graph snapshot (see Graph_IO.py)")
+    parser.add_argument("snapshot", help="graph snapshot written by Graph_IO.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--processes", type=int, default=None, help="search processes (0: one thread here)")
+    parser.add_argument("--max-pending", type=int, default=1024, help="distinct queries allowed to wait")
+    parser.add_argument("--max-client-requests", type=int, default=64, help="open requests per connection")
+    parser.add_argument("--max-depth", type=int, default=10,
+                        help="DFID depth when a query gives none, and the most one may ask for")
+    parser.add_argument("--report-every", type=float, default=60.0, help="seconds between stats lines")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#Priority queues for UCS & A*
+import heapq
+from enum import Enum
+from typing import Dict, List, Tuple
+
+
+class QueueType(Enum):
+    HEAPQ = "heapq"
+    BINARY_HEAP = "binary"
+    DARY_HEAP = "4-ary"
+    BUCKET = "bucket"
+
+
+class LazyHeapQueue:
+    """The heapq approach ucs/astar use inline: push a new entry per improvement, skip stale pops"""
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int]] = []
+        self.best: Dict[int, float] = {}
+        self.max_size = 0
+        self.stale_pops = 0
+        self.pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+    def push(self, node: int, priority: float):
+        """Insert node, or lower its priority if it is already queued"""
+        self.best[node] = priority
+        heapq.heappush(self.heap, (priority, node))
+        self.pushes += 1
+        if len(self.heap) > self.max_size:
+            self.max_size = len(self.heap)
+
+    def pop(self) -> Tuple[float, int]:
+        while True:
+            priority, node = heapq.heappop(self.heap)
+            if self.best.get(node) == priority:
+                del self.best[node]
+                return priority, node
+            self.stale_pops += 1
+
+
+class IndexedHeap:
+    """d-ary min-heap with a node -> slot index, so decrease-key moves the entry in place.
+
+    Entries are ordered by (priority, node), the same order heapq gives (cost, node) tuples,
+    so searches pop nodes in the same sequence whichever queue they use.
+    """
+
+    def __init__(self, arity: int = 2):
+        self.arity = arity
+        self.nodes: List[int] = []
+        self.priorities: List[float] = []
+        self.slots: Dict[int, int] = {}
+        self.max_size = 0
+        self.stale_pops = 0
+        self.pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def _sift_up(self, i: int, node: int, priority: float):
+        nodes, priorities, slots, arity = self.nodes, self.priorities, self.slots, self.arity
+        while i > 0:
+            parent = (i - 1) // arity
+            parent_priority = priorities[parent]
+            if parent_priority < priority or (parent_priority == priority and nodes[parent] < node):
+                break
+            nodes[i] = nodes[parent]
+            priorities[i] = parent_priority
+            slots[nodes[i]] = i
+            i = parent
+        nodes[i] = node
+        priorities[i] = priority
+        slots[node] = i
+
+    def _sift_down(self, i: int, node: int, priority: float):
+        nodes, priorities, slots, arity = self.nodes, self.priorities, self.slots, self.arity
+        size = len(nodes)
+        while True:
+            first = arity * i + 1
+            if first >= size:
+                break
+            best = first
+            best_priority = priorities[first]
+            for child in range(first + 1, min(first + arity, size)):
+                child_priority = priorities[child]
+                if child_priority < best_priority or (child_priority == best_priority and nodes[child] < nodes[best]):
+                    best = child
+                    best_priority = child_priority
+            if priority < best_priority or (priority == best_priority and node < nodes[best]):
+                break
+            nodes[i] = nodes[best]
+            priorities[i] = best_priority
+            slots[nodes[i]] = i
+            i = best
+        nodes[i] = node
+        priorities[i] = priority
+        slots[node] = i
+
+    def push(self, node: int, priority: float):
+        """Insert node, or decrease its key in place if it is already queued with a higher one"""
+        self.pushes += 1
+        i = self.slots.get(node)
+        if i is None:
+            self.nodes.append(node)
+            self.priorities.append(priority)
+            self._sift_up(len(self.nodes) - 1, node, priority)
+            if len(self.nodes) > self.max_size:
+                self.max_size = len(self.nodes)
+        elif priority < self.priorities[i]:
+            self._sift_up(i, node, priority)
+
+    def pop(self) -> Tuple[float, int]:
+        node = self.nodes[0]
+        priority = self.priorities[0]
+        del self.slots[node]
+        last_node = self.nodes.pop()
+        last_priority = self.priorities.pop()
+        if self.nodes:
+            self._sift_down(0, last_node, last_priority)
+        return priority, node
+
+
+class BucketQueue:
+    """Dial's bucket queue for integer priorities that never go below the last popped one.
+
+    One bucket per priority value; within a bucket nodes pop smallest id first, matching the
+    heap queues. A decrease-key leaves a stale copy in the old bucket that pop skips.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[int, List[int]] = {}
+        self.best: Dict[int, int] = {}
+        self.cursor = 0
+        self.size = 0
+        self.max_size = 0
+        self.stale_pops = 0
+        self.pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+    def push(self, node: int, priority: float):
+        if not float(priority).is_integer():
+            raise ValueError("Bucket queue needs integer priorities (integer weights and heuristics)")
+        priority = int(priority)
+        if priority < self.cursor:
+            raise ValueError("Bucket queue priorities must not decrease below the last pop")
+        self.best[node] = priority
+        heapq.heappush(self.buckets.setdefault(priority, []), node)
+        self.pushes += 1
+        self.size += 1
+        if self.size > self.max_size:
+            self.max_size = self.size
+
+    def pop(self) -> Tuple[int, int]:
+        while True:
+            bucket = self.buckets.get(self.cursor)
+            if not bucket:
+                self.buckets.pop(self.cursor, None)
+                self.cursor += 1
+                continue
+            node = heapq.heappop(bucket)
+            self.size -= 1
+            if self.best.get(node) == self.cursor:
+                del self.best[node]
+                return self.cursor, node
+            self.stale_pops += 1
+
+
+def make_queue(queue_type: QueueType):
+    match queue_type:
+        case QueueType.HEAPQ:
+            return LazyHeapQueue()
+        case QueueType.BINARY_HEAP:
+            return IndexedHeap(2)
+        case QueueType.DARY_HEAP:
+            return IndexedHeap(4)
+        case QueueType.BUCKET:
+            return BucketQueue()
+        case _:
+            raise ValueError("Invalid queue type")
@@ -0,0 +1,64 @@
+#Per-query statistics and profiler hooks for the searches
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+
+class SearchStats:
+    """Counters and phase timings of the last search a SearchAlgorithms ran with it.
+
+    Pass one as SearchAlgorithms(stats=...); every query resets it first. Searches without
+    one skip all of this behind a single `is not None` check per expanded node and per
+    relaxed edge. on_expand(node) runs when a node is expanded, on_relax(node, parent, weight)
+    when the parent -> node edge of that weight becomes node's best way in.
+
+    expanded: nodes whose successors were generated
+    relaxed: edges that set or improved a node's parent
+    peak_frontier: largest open set (queue, heap or DFS stack) seen at an expansion
+    stale_pops: heap entries popped for nodes already closed (ucs and astar only)
+    iterations: depth limits tried by dfid
+    timings: seconds per phase, e.g. "search" and "reconstruct", or "depth 3" in dfid
+    """
+
+    def __init__(self, on_expand: Optional[Callable[[int], None]] = None,
+                 on_relax: Optional[Callable[[int, int, float], None]] = None):
+        self.on_expand = on_expand
+        self.on_relax = on_relax
+        self.reset()
+
+    def reset(self):
+        self.expanded = 0
+        self.relaxed = 0
+        self.peak_frontier = 0
+        self.stale_pops = 0
+        self.iterations = 0
+        self.timings: Dict[str, float] = defaultdict(float)
+        self._mark = time.perf_counter()
+
+    def expand(self, node: int, frontier: int):
+        self.expanded += 1
+        if frontier > self.peak_frontier:
+            self.peak_frontier = frontier
+        if self.on_expand is not None:
+            self.on_expand(node)
+
+    def relax(self, node: int, parent: int, weight: float):
+        self.relaxed += 1
+        if self.on_relax is not None:
+            self.on_relax(node, parent, weight)
+
+    def lap(self, phase: str):
+        """Charge the time since the last lap (or reset) to phase"""
+        now = time.perf_counter()
+        self.timings[phase] += now - self._mark
+        self._mark = now
+
+    def as_dict(self) -> dict:
+        return {"expanded": self.expanded, "relaxed": self.relaxed, "peak_frontier": self.peak_frontier,
+                "stale_pops": self.stale_pops, "iterations": self.iterations, "timings": dict(self.timings)}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{phase} {seconds * 1000:.2f} ms" for phase, seconds in self.timings.items())
+        return (f"SearchStats(expanded={self.expanded}, relaxed={self.relaxed}, "
+                f"peak_frontier={self.peak_frontier}, stale_pops={self.stale_pops}, "
+                f"iterations={self.iterations}, {phases or 'no timings'})")
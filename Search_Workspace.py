@@ -0,0 +1,113 @@
+#Reusable per-query search state, reset in O(1) with epoch stamps
+from typing import Iterator, List, Optional, Set, Tuple
+
+
+class _Marked:
+    """The nodes whose stamp equals the workspace's current epoch, as a read-only set"""
+
+    def __init__(self, workspace: "SearchWorkspace", stamps: List[int]):
+        self.workspace = workspace
+        self.stamps = stamps
+
+    def __contains__(self, node: int) -> bool:
+        return 0 <= node < len(self.stamps) and self.stamps[node] == self.workspace.epoch
+
+    def __iter__(self) -> Iterator[int]:
+        epoch = self.workspace.epoch
+        return (node for node, stamp in enumerate(self.stamps) if stamp == epoch)
+
+    def __len__(self) -> int:
+        return self.stamps.count(self.workspace.epoch)
+
+
+class _Parents(_Marked):
+    """node -> (parent, weight) for the nodes reached this query, like the dicts searches keep in self.path"""
+
+    def __init__(self, workspace: "SearchWorkspace"):
+        super().__init__(workspace, workspace.seen)
+
+    def get(self, node: int, default=None) -> Optional[Tuple[Optional[int], float]]:
+        if node not in self:
+            return default
+        parent = self.workspace.parent[node]
+        return (None if parent < 0 else parent), self.workspace.weight[node]
+
+    def __getitem__(self, node: int) -> Tuple[Optional[int], float]:
+        entry = self.get(node)
+        if entry is None:
+            raise KeyError(node)
+        return entry
+
+
+class SearchWorkspace:
+    """Parent, edge weight, cost and visited arrays sized to the graph, shared by query after query.
+
+    A node's entries only count if its stamp equals the current epoch, so begin() resets the
+    per-node arrays by bumping the epoch instead of clearing N entries. seen marks nodes
+    reached (their parent, weight and cost are set), done marks nodes closed. The depth-first
+    searches keep their visited nodes in the visited set instead. begin() does empty the heap,
+    queue and visited set, which costs time in proportion to what the previous query left in
+    them: what it pushed or visited, rather than N.
+    Pass one to SearchAlgorithms(workspace=...) of BFS_UCS, DFS_DLS_DFID or GBFS_Astar; the
+    graph's nodes must be the integers 0 .. num_nodes - 1. One workspace serves one query at
+    a time, so give each thread its own.
+    """
+
+    def __init__(self, num_nodes: int = 0):
+        self.epoch = 0
+        self.seen: List[int] = []
+        self.done: List[int] = []
+        self.parent: List[int] = []
+        self.weight: List[float] = []
+        self.cost: List[float] = []
+        # open-set storage, emptied by begin() rather than reallocated
+        self.heap: List[Tuple[float, int]] = []
+        self.queue: List[int] = []
+        self.visited: Set[int] = set()
+        self.parents = _Parents(self)
+        self.closed = _Marked(self, self.done)
+        self.reserve(num_nodes)
+
+    def __len__(self) -> int:
+        return len(self.seen)
+
+    def reserve(self, num_nodes: int):
+        """Grow the arrays to num_nodes entries; they never shrink"""
+        extra = num_nodes - len(self.seen)
+        if extra <= 0:
+            return
+        self.seen.extend([0] * extra)
+        self.done.extend([0] * extra)
+        self.parent.extend([-1] * extra)
+        self.weight.extend([0.0] * extra)
+        self.cost.extend([0.0] * extra)
+
+    def begin(self, num_nodes: int) -> int:
+        """Start a query on a graph of num_nodes nodes: every node unseen, open and visited sets empty.
+
+        O(1) for the per-node arrays; emptying the heap, queue and visited set is linear in
+        whatever the previous query left in them.
+        """
+        if num_nodes > len(self.seen):
+            self.reserve(num_nodes)
+        self.heap.clear()
+        self.queue.clear()
+        self.visited.clear()
+        self.epoch += 1
+        return self.epoch
+
+    def trace(self, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """Follow parent entries back from target; (None, 0.0) if target was not reached"""
+        epoch = self.epoch
+        if self.seen[target] != epoch:
+            return None, 0.0
+        parent, weight = self.parent, self.weight
+        path = []
+        total_weight = 0.0
+        current = target
+        while current >= 0:
+            path.append(current)
+            total_weight += weight[current]
+            current = parent[current]
+        path.reverse()
+        return (path if path[0] == start else None), total_weight
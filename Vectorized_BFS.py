@@ -0,0 +1,179 @@
+#Level-synchronous vectorized BFS (needs NumPy)
+import weakref
+from typing import List, Optional, Tuple
+
+from CSR_Graph import CSRGraph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Vectorized BFS needs NumPy: pip install numpy")
+
+
+# Graph -> (graph.version, CSRGraph), so dict based graphs are only converted again after they change
+_csr_cache = weakref.WeakKeyDictionary()
+
+
+def _as_csr(graph) -> CSRGraph:
+    if isinstance(graph, CSRGraph):
+        return graph
+    version = getattr(graph, "version", None)
+    cached = _csr_cache.get(graph)
+    if cached is not None and version is not None and cached[0] == version:
+        return cached[1]
+    csr = CSRGraph.from_graph(graph)
+    if version is not None:
+        _csr_cache[graph] = (version, csr)
+    return csr
+
+
+def _index_array(values, name: str):
+    """An int32/int64 NumPy view of values (array, memoryview or NumPy array); copies other int types"""
+    result = np.asarray(values)
+    if result.dtype.kind not in "iu":
+        raise ValueError(f"CSR {name} must hold integers, not {result.dtype}")
+    if result.dtype not in (np.int32, np.int64):
+        result = result.astype(np.int64)
+    return result
+
+
+_reverse_cache = weakref.WeakKeyDictionary()
+_NO_KEY = 2 ** 62
+
+
+def _reverse_arrays(csr: CSRGraph):
+    """(offsets, sources, edge_ids) of the transposed graph, same layout as CSRGraph.reverse()"""
+    if csr not in _reverse_cache:
+        offsets = _index_array(csr.offsets, "offsets")
+        targets = _index_array(csr.targets, "targets")
+        edge_ids = np.argsort(targets, kind="stable")
+        sources = np.repeat(np.arange(csr.num_nodes, dtype=np.int32), np.diff(offsets))[edge_ids]
+        reverse_offsets = np.zeros(csr.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(targets, minlength=csr.num_nodes), out=reverse_offsets[1:])
+        _reverse_cache[csr] = (reverse_offsets, sources, edge_ids)
+    return _reverse_cache[csr]
+
+
+def _gather(offsets, nodes):
+    """Edge indices offsets[u]:offsets[u + 1] for every u in nodes, concatenated in order"""
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), counts
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return np.arange(total, dtype=np.int64) + shift, counts
+
+
+def bfs_levels(graph, start: int, target: Optional[int] = None, alpha: float = 1.0):
+    """Breadth-first search that expands a whole level per step with NumPy array operations.
+
+    Returns (parents, parent_edges, hops) arrays over all nodes: hops[v] is the edge count from
+    start (-1 if unreached) and parent_edges[v] the index into graph.targets/weights of the
+    edge that discovered v. Parents are exactly the ones the deque based bfs picks. If target
+    is given the search stops after the level that reaches it.
+
+    A level is expanded top-down (scan out-edges of the frontier) unless its out-edges outnumber
+    alpha times the in-edges of all still-unvisited nodes, in which case it is expanded
+    bottom-up (every unvisited node looks for a parent in the frontier).
+
+    graph is ideally a CSRGraph. Any other Graph is converted to one on first use and the
+    conversion is cached until graph.version changes (graphs without a version are converted
+    on every call).
+    """
+    _require_numpy()
+    csr = _as_csr(graph)
+    n = csr.num_nodes
+    offsets = _index_array(csr.offsets, "offsets")
+    targets = _index_array(csr.targets, "targets")
+
+    parents = np.full(n, -1, dtype=np.int64)
+    parent_edges = np.full(n, -1, dtype=np.int64)
+    hops = np.full(n, -1, dtype=np.int64)
+    if not 0 <= start < n:
+        return parents, parent_edges, hops
+
+    hops[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    rank = np.full(n, -1, dtype=np.int64)
+    rank[start] = 0
+    first_key = np.full(n, _NO_KEY, dtype=np.int64)
+    unvisited_in_edges = None
+    level = 0
+
+    while frontier.size and (target is None or hops[target] < 0):
+        frontier_degrees = offsets[frontier + 1] - offsets[frontier]
+        frontier_edges = int(frontier_degrees.sum())
+        frontier_starts = np.cumsum(frontier_degrees) - frontier_degrees
+        if unvisited_in_edges is None and frontier_edges * 8 > csr.num_edges:
+            reverse_offsets, reverse_sources, reverse_edge_ids = _reverse_arrays(csr)
+            in_degree = np.diff(reverse_offsets)
+            unvisited_in_edges = int(in_degree[hops < 0].sum())
+
+        if unvisited_in_edges is not None and frontier_edges > alpha * unvisited_in_edges:
+            # bottom-up: in-edges of unvisited nodes whose source sits in the frontier. Each is
+            # keyed by the position it would have in the top-down edge list below, so taking the
+            # smallest key per node picks the same parent the deque bfs would
+            unvisited = np.flatnonzero(hops < 0)
+            edges, counts = _gather(reverse_offsets, unvisited)
+            sources = reverse_sources[edges].astype(np.int64)
+            keep = rank[sources] >= 0
+            nodes = np.repeat(unvisited, counts)[keep]
+            sources = sources[keep]
+            edges = reverse_edge_ids[edges[keep]]
+            keys = frontier_starts[rank[sources]] + (edges - offsets[sources])
+            bottom_up = True
+        else:
+            edges, counts = _gather(offsets, frontier)
+            nodes = targets[edges].astype(np.int64)
+            keep = hops[nodes] < 0
+            nodes, edges = nodes[keep], edges[keep]
+            sources = np.repeat(frontier, counts)[keep]
+            keys = np.flatnonzero(keep)
+            bottom_up = False
+
+        # first discovery of each node: smallest key wins, then order the winners by key
+        # (top-down keys already increase along the edge list)
+        np.minimum.at(first_key, nodes, keys)
+        winners = np.flatnonzero(first_key[nodes] == keys)
+        first_key[nodes] = _NO_KEY
+        if bottom_up:
+            winners = winners[np.argsort(keys[winners])]
+        new_nodes, new_parents, new_edges = nodes[winners], sources[winners], edges[winners]
+        rank[frontier] = -1
+        rank[new_nodes] = np.arange(new_nodes.size)
+
+        level += 1
+        hops[new_nodes] = level
+        parents[new_nodes] = new_parents
+        parent_edges[new_nodes] = new_edges
+        if unvisited_in_edges is not None:
+            unvisited_in_edges -= int(in_degree[new_nodes].sum())
+        frontier = new_nodes
+
+    return parents, parent_edges, hops
+
+
+def vectorized_bfs(graph, start: int, target: int) -> Tuple[Optional[List[int]], float]:
+    """Same (path, total_weight) as SearchAlgorithms.bfs, computed with bfs_levels"""
+    csr = _as_csr(graph)
+    if not 0 <= target < csr.num_nodes:
+        return None, 0.0
+    parents, parent_edges, hops = bfs_levels(csr, start, target)
+    if hops[target] < 0:
+        return None, 0.0
+    path = []
+    total_weight = 0.0
+    current = target
+    while current != start:
+        path.append(current)
+        total_weight += csr.weights[int(parent_edges[current])]
+        current = int(parents[current])
+    path.append(start)
+    path.reverse()
+    return path, total_weight
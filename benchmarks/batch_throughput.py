@@ -0,0 +1,53 @@
+#Batch query throughput: search_many queries/second against the number of worker processes
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BFS_UCS
+import DFS_DLS_DFID
+import GBFS_Astar
+from Batch_Search import search_many
+from CSR_Graph import CSRGraphBuilder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure search_many throughput per process count")
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--edges", type=int, default=80_000)
+    parser.add_argument("--queries", type=int, default=400)
+    parser.add_argument("--max-processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    builder = CSRGraphBuilder(args.nodes)
+    for _ in range(args.edges):
+        builder.add_edge(rng.randrange(args.nodes), rng.randrange(args.nodes), rng.randint(1, 9))
+    for node in range(args.nodes):
+        builder.set_heuristic(node, 0.0)
+    graph = builder.build()
+    pairs = [(rng.randrange(args.nodes), rng.randrange(args.nodes)) for _ in range(args.queries)]
+
+    cases = [(BFS_UCS.SearchType.BFS, {}), (BFS_UCS.SearchType.UCS, {}),
+             (DFS_DLS_DFID.SearchType.DFS, {}), (DFS_DLS_DFID.SearchType.DLS, {"depth_limit": 6}),
+             (DFS_DLS_DFID.SearchType.DFID, {"max_depth": 6}),
+             (GBFS_Astar.SearchType.GBFS, {}), (GBFS_Astar.SearchType.ASTAR, {})]
+    process_counts = sorted({1, *range(2, args.max_processes + 1, 2), args.max_processes})
+
+    print(f"{'search':<8}" + "".join(f"{p:>10}p" for p in process_counts) + "   (queries/s)")
+    for search_type, kwargs in cases:
+        row = []
+        for processes in process_counts:
+            start = time.perf_counter()
+            for _ in search_many(search_type, graph, pairs, processes=processes, **kwargs):
+                pass
+            row.append(len(pairs) / (time.perf_counter() - start))
+        print(f"{search_type.value:<8}" + "".join(f"{qps:>11.0f}" for qps in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#Memory-bounded and greedy searches vs A*: path cost, wall time and peak memory
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GBFS_Astar import Graph, SearchAlgorithms, SearchType
+
+
+def grid_graph(side: int, seed: int) -> Graph:
+    """side x side grid, both edge directions, integer weights 1-10, Manhattan heuristic to the far corner"""
+    rng = random.Random(seed)
+    graph = Graph(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            graph.set_heuristic(node, (side - 1 - row) + (side - 1 - col))
+            if col + 1 < side:
+                graph.add_edge(node, node + 1, rng.randint(1, 10))
+                graph.add_edge(node + 1, node, rng.randint(1, 10))
+            if row + 1 < side:
+                graph.add_edge(node, node + side, rng.randint(1, 10))
+                graph.add_edge(node + side, node, rng.randint(1, 10))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare A* with GBFS, beam, IDA* and SMA*")
+    parser.add_argument("--side", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = grid_graph(args.side, args.seed)
+    start, target = 0, args.side * args.side - 1
+    searcher = SearchAlgorithms()
+    runs = [("astar", SearchType.ASTAR, {}),
+            ("gbfs_frontier", SearchType.GBFS_FRONTIER, {}),
+            ("beam 10", SearchType.BEAM, {"beam_width": 10}),
+            ("beam 100", SearchType.BEAM, {"beam_width": 100}),
+            ("idastar", SearchType.IDASTAR, {}),
+            ("smastar 1000", SearchType.SMASTAR, {"max_nodes": 1000}),
+            ("smastar 400", SearchType.SMASTAR, {"max_nodes": 400})]
+
+    print(f"{graph.num_nodes} nodes, {start} -> {target}")
+    print(f"{'search':<16}{'cost':>8}{'ms':>10}{'peak KiB':>10}")
+    for name, search_type, kwargs in runs:
+        tracemalloc.start()
+        begin = time.perf_counter()
+        path, total_weight = searcher.search(search_type, graph, start, target, **kwargs)
+        elapsed = (time.perf_counter() - begin) * 1000
+        peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+        cost = f"{total_weight:g}" if path else "-"
+        print(f"{name:<16}{cost:>8}{elapsed:>10.1f}{peak:>10}")
+
+
+if __name__ == "__main__":
+    main()
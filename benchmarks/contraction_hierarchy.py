@@ -0,0 +1,67 @@
+#Contraction hierarchy: preprocessing cost and query time vs UCS on a random road-like grid
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BFS_UCS import SearchAlgorithms
+from CSR_Graph import CSRGraphBuilder
+from Contraction_Hierarchy import ContractionHierarchy
+
+
+def grid_graph(side: int, seed: int):
+    """side x side grid with both edge directions and random weights 1-10"""
+    rng = random.Random(seed)
+    builder = CSRGraphBuilder(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                builder.add_edge(node, node + 1, rng.uniform(1, 10))
+                builder.add_edge(node + 1, node, rng.uniform(1, 10))
+            if row + 1 < side:
+                builder.add_edge(node, node + side, rng.uniform(1, 10))
+                builder.add_edge(node + side, node, rng.uniform(1, 10))
+    return builder.build()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare UCS with contraction hierarchy queries")
+    parser.add_argument("--side", type=int, default=100)
+    parser.add_argument("--witness-limit", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = grid_graph(args.side, args.seed)
+    begin = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(graph, args.witness_limit)
+    build_time = time.perf_counter() - begin
+    path = os.path.join(tempfile.mkdtemp(), "grid.ch")
+    hierarchy.save(path)
+    begin = time.perf_counter()
+    hierarchy = ContractionHierarchy.load(path, graph)
+    load_time = time.perf_counter() - begin
+
+    print(f"{graph.num_nodes} nodes, {graph.num_edges} edges, {hierarchy.num_shortcuts} shortcuts")
+    print(f"build {build_time:.1f} s, load {load_time * 1000:.2f} ms, {os.path.getsize(path)} bytes on disk")
+
+    rng = random.Random(args.seed + 1)
+    queries = [(rng.randrange(graph.num_nodes), rng.randrange(graph.num_nodes)) for _ in range(args.queries)]
+    timings = {}
+    for name, searcher in (("ucs", SearchAlgorithms()), ("ucs + hierarchy", SearchAlgorithms(hierarchy=hierarchy))):
+        begin = time.perf_counter()
+        costs = [searcher.ucs(graph, s, t)[1] for s, t in queries]
+        timings[name] = ((time.perf_counter() - begin) * 1000 / len(queries), costs)
+    reference = timings["ucs"][1]
+    for name, (elapsed, costs) in timings.items():
+        assert all(abs(a - b) < 1e-6 for a, b in zip(costs, reference))
+        print(f"{name:<18}{elapsed:>10.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#CSR memory benchmark: bytes per edge and search time, defaultdict Graph vs CSRGraph
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BFS_UCS import Graph, SearchAlgorithms, SearchType
+from CSR_Graph import CSRGraphBuilder
+
+
+def random_edges(num_nodes: int, num_edges: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(num_edges):
+        yield rng.randrange(num_nodes), rng.randrange(num_nodes), rng.random() * 10
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return graph, current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare defaultdict Graph and CSRGraph memory and search time")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    def build_dict():
+        g = Graph(args.nodes)
+        for u, v, w in random_edges(args.nodes, args.edges, args.seed):
+            g.add_edge(u, v, w)
+        return g
+
+    def build_csr():
+        b = CSRGraphBuilder(args.nodes)
+        for u, v, w in random_edges(args.nodes, args.edges, args.seed):
+            b.add_edge(u, v, w)
+        return b.build()
+
+    rng = random.Random(args.seed + 1)
+    queries = [(rng.randrange(args.nodes), rng.randrange(args.nodes)) for _ in range(args.queries)]
+
+    print(f"{args.nodes} nodes, {args.edges} edges, {args.queries} BFS/UCS queries")
+    print(f"{'graph':<10}{'bytes/edge':>12}{'build s':>10}{'bfs ms/q':>10}{'ucs ms/q':>10}")
+    for name, build in (("defaultdict", build_dict), ("csr", build_csr)):
+        graph, nbytes, build_time = measure(build)
+        searcher = SearchAlgorithms()
+        timings = []
+        for search_type in (SearchType.BFS, SearchType.UCS):
+            start = time.perf_counter()
+            for s, t in queries:
+                searcher.search(search_type, graph, s, t)
+            timings.append((time.perf_counter() - start) * 1000 / len(queries))
+        print(f"{name:<10}{nbytes / args.edges:>12.1f}{build_time:>10.2f}{timings[0]:>10.1f}{timings[1]:>10.1f}")
+        del graph
+
+
+if __name__ == "__main__":
+    main()
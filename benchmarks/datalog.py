@@ -0,0 +1,75 @@
+#Datalog engine on a synthetic family tree: the Prolog.txt rules over many parent facts
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Datalog import Datalog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def family(people: int, generations: int, seed: int):
+    """Equal-sized generations; everyone after the first gets a random mother and father from the one before"""
+    rng = random.Random(seed)
+    size = people // generations
+    females, males, parents = [], [], []
+    previous = None
+    for generation in range(generations):
+        current = [f"p{generation}_{i}" for i in range(size)]
+        sexes = [rng.random() < 0.5 for _ in current]
+        females.extend((person,) for person, female in zip(current, sexes) if female)
+        males.extend((person,) for person, female in zip(current, sexes) if not female)
+        if previous is not None:
+            mothers = [person for person, female in previous if female]
+            fathers = [person for person, female in previous if not female]
+            for person in current:
+                parents.append((rng.choice(mothers), person))
+                parents.append((rng.choice(fathers), person))
+        previous = list(zip(current, sexes))
+    return females, males, parents
+
+
+def timed(label: str, run):
+    begin = time.perf_counter()
+    result = run()
+    print(f"{label:<28}{time.perf_counter() - begin:>8.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the Datalog engine on the Prolog.txt family rules")
+    parser.add_argument("--people", type=int, default=500_000)
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    females, males, parents = family(args.people, args.generations, args.seed)
+    engine = Datalog()
+    with open(os.path.join(ROOT, "Prolog.txt")) as handle:
+        engine.load(handle.read())
+    print(f"{len(parents)} parent facts, {args.generations} generations")
+
+    def add():
+        engine.add_facts("female", females)
+        engine.add_facts("male", males)
+        engine.add_facts("parent", parents)
+    timed("add facts", add)
+    # a query evaluates only the strata it depends on: sister needs neither ancestor nor brother
+    answers = timed("query sister(X,Y), cold", lambda: engine.query("sister(X,Y)"))
+    timed("query sister(X,Y), warm", lambda: engine.query("sister(X,Y)"))
+    print(f"{'':<28}{len(answers):>9} answers")
+    someone = parents[-1][1]
+    answers = timed(f"query ancestor(X,{someone})", lambda: engine.query(f"ancestor(X,{someone})"))
+    print(f"{'':<28}{len(answers):>9} answers, {len(engine.relations['ancestor/2'])} ancestor facts")
+
+    # incremental: a new child of the last person only extends the closure by its ancestors
+    timed("add 1 parent fact", lambda: engine.add_fact("parent", someone, "newborn"))
+    answers = timed("query ancestor(X,newborn)", lambda: engine.query("ancestor(X,newborn)"))
+    print(f"{'':<28}{len(answers):>9} answers")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#GA wall time with an expensive fitness: no cache vs LRU vs generational FitnessCache
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Genetics import Eviction, FitnessCache, batched, evolve, generate_population
+
+
+def simulation(x):
+    """Stand-in for an expensive objective: about 0.5 ms of busy work"""
+    end = time.perf_counter() + 0.0005
+    while time.perf_counter() < end:
+        pass
+    return -(x - 1234) ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure FitnessCache savings on an expensive objective")
+    parser.add_argument("--population", type=int, default=200)
+    parser.add_argument("--generations", type=int, default=30)
+    parser.add_argument("--cache-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    runs = [("no cache", None),
+            ("lru", FitnessCache(batched(simulation), args.cache_size, Eviction.LRU)),
+            ("generational", FitnessCache(batched(simulation), args.cache_size, Eviction.GENERATIONAL))]
+    print(f"{'cache':<14}{'seconds':>9}{'hit rate':>10}")
+    for name, cache in runs:
+        random.seed(args.seed)
+        population = generate_population(args.population, 0, 10_000)
+        begin = time.perf_counter()
+        evolve(population, 0, 10_000, args.generations, simulation,
+               evaluate=cache.evaluate if cache is not None else None)
+        elapsed = time.perf_counter() - begin
+        hit_rate = f"{cache.hit_rate:.1%}" if cache is not None else "-"
+        print(f"{name:<14}{elapsed:>9.2f}{hit_rate:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#List-based GA loop vs the vectorized NumPy engine: seconds per generation (needs NumPy)
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Genetics import (crossover, fitness_function, generate_population, genetic_algorithm_vectorized,
+                      mutate, select_parents)
+
+
+def list_generations(lower: int, upper: int, population_size: int, generations: int):
+    """genetic_algorithm's loop without the input() prompts"""
+    population = generate_population(population_size, lower, upper)
+    for _ in range(generations):
+        population = sorted(population, key=fitness_function, reverse=True)
+        new_population = population[:2]
+        while len(new_population) < population_size:
+            p1, p2 = select_parents(population)
+            new_population.append(mutate(crossover(p1, p2), lower, upper))
+        population = new_population
+    return max(population, key=fitness_function)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the list GA against the vectorized GA")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 4_000_000])
+    parser.add_argument("--list-limit", type=int, default=100_000, help="largest size the list loop runs at")
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    lower, upper = -1_000_000, 1_000_000
+    print(f"{'population':>12}{'list s/gen':>12}{'numpy s/gen':>13}")
+    for size in args.sizes:
+        list_time = "-"
+        if size <= args.list_limit:
+            begin = time.perf_counter()
+            list_generations(lower, upper, size, args.generations)
+            list_time = f"{(time.perf_counter() - begin) / args.generations:.4f}"
+        begin = time.perf_counter()
+        genetic_algorithm_vectorized(lower, upper, size, args.generations, seed=args.seed)
+        numpy_time = (time.perf_counter() - begin) / args.generations
+        print(f"{size:>12}{list_time:>12}{numpy_time:>13.4f}")
+
+
+if __name__ == "__main__":
+    main()
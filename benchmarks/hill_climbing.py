@@ -0,0 +1,62 @@
+#Hill climbing in many dimensions: one batched objective call per step vs one call per neighbor (needs NumPy)
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from Hill_Climbing import RandomNeighbors, hill_climb, random_restarts
+
+
+def sphere(points):
+    """Peak of 0 at (1, 1, ..., 1)"""
+    return -np.sum((points - 1.0) ** 2, axis=1)
+
+
+def one_at_a_time(points):
+    """The same objective scored a row at a time, like calling calfunc per neighbor"""
+    return np.array([sphere(point[None, :])[0] for point in points])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time batched neighbor scoring and parallel restarts")
+    parser.add_argument("--dimensions", type=int, default=2000)
+    parser.add_argument("--neighbors", type=int, default=256)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--restarts", type=int, nargs="+", default=[1, 4, 16],
+                        help="restart counts for the scaling table")
+    parser.add_argument("--processes", type=int, nargs="+", default=None,
+                        help="process counts for the scaling table (default: 1, 2, 4 and the CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    neighbors = RandomNeighbors(args.neighbors, 0.05)
+    start = np.zeros(args.dimensions)
+    print(f"{args.dimensions} dimensions, {args.neighbors} neighbors per step, {args.steps} steps")
+    for name, objective in (("batched", sphere), ("one at a time", one_at_a_time)):
+        begin = time.perf_counter()
+        _, value, trajectory = hill_climb(objective, neighbors, start, args.steps, np.random.default_rng(args.seed))
+        print(f"{name:<16}{time.perf_counter() - begin:>8.2f}s  value {value:.1f} after {len(trajectory) - 1} moves")
+
+    # restart scaling: wall time for each restart count and process count, pool start-up included
+    process_counts = args.processes or sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"\nrandom_restarts wall time in seconds ({os.cpu_count()} CPUs)")
+    print(f"{'restarts':>9}" + "".join(f"{f'{processes} proc':>10}" for processes in process_counts)
+          + f"{'restarts/s':>12}")
+    for restarts in args.restarts:
+        row = []
+        for processes in process_counts:
+            begin = time.perf_counter()
+            result = random_restarts(sphere, neighbors, -1, 1, args.dimensions, restarts, args.steps,
+                                     processes=processes, seed=args.seed)
+            row.append(time.perf_counter() - begin)
+        print(f"{restarts:>9}" + "".join(f"{seconds:>10.2f}" for seconds in row)
+              + f"{restarts / min(row):>12.1f}")
+    print(f"best value {result.best_value:.1f}, trajectories {result.trajectories.shape}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#Implicit-graph search on the 8-puzzle: fingerprint table vs a dict of visited states
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from itertools import count
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Implicit_Search import ImplicitSearch
+
+GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+MOVES = {blank: [blank + step for step, ok in ((-3, blank >= 3), (3, blank < 6),
+                                                 (-1, blank % 3 > 0), (1, blank % 3 < 2)) if ok]
+         for blank in range(9)}
+
+
+def successors(board):
+    blank = board.index(0)
+    for tile in MOVES[blank]:
+        cells = list(board)
+        cells[blank], cells[tile] = cells[tile], 0
+        yield tuple(cells), 1
+
+
+def manhattan(board) -> int:
+    return sum(abs(i // 3 - (tile - 1) // 3) + abs(i % 3 - (tile - 1) % 3)
+               for i, tile in enumerate(board) if tile)
+
+
+def scramble(moves: int, seed: int):
+    rng = random.Random(seed)
+    board = GOAL
+    for _ in range(moves):
+        board = rng.choice([state for state, _ in successors(board)])
+    return board
+
+
+def dict_bfs(start, target):
+    """Baseline: the same BFS with the states themselves as keys of a parent dict"""
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for state, _ in successors(current):
+            if state not in parents:
+                parents[state] = current
+                if state == target:
+                    return len(parents)
+                queue.append(state)
+    return None
+
+
+def dict_astar(start, target):
+    """Baseline: the same A* with the states themselves as keys of a g-score dict"""
+    g_score, parents = {start: 0}, {start: None}
+    tie = count()
+    open_set = [(manhattan(start), 0, next(tie), start)]
+    while open_set:
+        _, cost, _, current = heapq.heappop(open_set)
+        if cost > g_score[current]:
+            continue
+        if current == target:
+            return cost
+        for state, weight in successors(current):
+            if cost + weight < g_score.get(state, float('inf')):
+                g_score[state] = cost + weight
+                parents[state] = current
+                heapq.heappush(open_set, (cost + weight + manhattan(state), cost + weight, next(tie), state))
+    return None
+
+
+def measure(run):
+    tracemalloc.start()
+    begin = time.perf_counter()
+    result = run()
+    elapsed = (time.perf_counter() - begin) * 1000
+    peak = tracemalloc.get_traced_memory()[1] // 1024
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fingerprint-table and dict visited sets on the 8-puzzle")
+    parser.add_argument("--moves", type=int, default=60, help="random moves used to scramble the goal")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = scramble(args.moves, args.seed)
+    searcher = ImplicitSearch()
+    runs = [("bfs table", lambda: searcher.bfs(start, GOAL, successors)),
+            ("bfs dict", lambda: dict_bfs(start, GOAL)),
+            ("astar table", lambda: searcher.astar(start, GOAL, successors, manhattan)),
+            ("astar dict", lambda: dict_astar(start, GOAL))]
+
+    print(f"start {start}")
+    print(f"{'search':<14}{'ms':>10}{'peak KiB':>10}")
+    for name, run in runs:
+        _, elapsed, peak = measure(run)
+        print(f"{name:<14}{elapsed:>10.1f}{peak:>10}")
+    path, total_weight = searcher.bfs(start, GOAL, successors)
+    print(f"{len(searcher.table)} states in the table, {searcher.table.nbytes() // 1024} KiB, "
+          f"solution {total_weight:g} moves")
+
+
+if __name__ == "__main__":
+    main()
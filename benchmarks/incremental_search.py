@@ -0,0 +1,71 @@
+#Incremental replanning vs repeated A* under random edge weight changes
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GBFS_Astar import Graph, SearchAlgorithms
+from Incremental_Search import IncrementalSearch
+
+
+def grid_graph(side: int, seed: int) -> Graph:
+    """side x side grid with both edge directions, random weights 1-10 and Manhattan heuristics"""
+    rng = random.Random(seed)
+    graph = Graph(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                graph.add_edge(node, node + 1, rng.uniform(1, 10))
+                graph.add_edge(node + 1, node, rng.uniform(1, 10))
+            if row + 1 < side:
+                graph.add_edge(node, node + side, rng.uniform(1, 10))
+                graph.add_edge(node + side, node, rng.uniform(1, 10))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare repeated A* with incremental repair")
+    parser.add_argument("--side", type=int, default=150)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--changes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = grid_graph(args.side, args.seed)
+    side = args.side
+    start, target = 0, side * side - 1
+    # Manhattan distance times the smallest weight is consistent on this grid
+    for node in range(side * side):
+        graph.set_heuristic(node, (side - 1 - node // side) + (side - 1 - node % side))
+    edges = [(u, v) for u in range(side * side) for v, _ in graph.graph[u]]
+    rng = random.Random(args.seed + 1)
+    searcher = SearchAlgorithms()
+    planner = IncrementalSearch(graph, start, target, graph.get_heuristic)
+    planner.plan()
+
+    print(f"{graph.num_nodes} nodes, {len(edges)} edges, {start} -> {target}")
+    print(f"{'changes/round':<15}{'astar ms':>10}{'repair ms':>11}{'speedup':>9}{'expanded':>10}")
+    for count in args.changes:
+        astar_time = repair_time = 0.0
+        expansions = planner.expansions
+        for _ in range(args.rounds):
+            changes = [(*rng.choice(edges), rng.uniform(1, 10)) for _ in range(count)]
+            begin = time.perf_counter()
+            planner.update_edges(changes)
+            _, repaired = planner.plan()
+            repair_time += time.perf_counter() - begin
+            begin = time.perf_counter()
+            _, expected = searcher.astar(graph, start, target)
+            astar_time += time.perf_counter() - begin
+            assert abs(repaired - expected) < 1e-6
+        expanded = (planner.expansions - expansions) // args.rounds
+        print(f"{count:<15}{astar_time * 1000 / args.rounds:>10.2f}{repair_time * 1000 / args.rounds:>11.2f}"
+              f"{astar_time / repair_time:>8.1f}x{expanded:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#Island-model GA throughput (generations x population per second) as islands and processes grow
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Genetics import island_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure island-model GA throughput")
+    parser.add_argument("--islands", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--population", type=int, default=20_000, help="individuals per island")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--interval", type=int, default=5, help="generations between migrations")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.population} individuals per island, {args.generations} generations")
+    print(f"{'islands':>8}{'processes':>10}{'seconds':>10}{'individuals/s':>15}")
+    for islands in args.islands:
+        processes = min(islands, os.cpu_count() or 1)
+        begin = time.perf_counter()
+        for _ in island_model(-1_000_000, 1_000_000, args.population, args.generations, islands,
+                              args.interval, processes=processes, seed=args.seed):
+            pass
+        elapsed = time.perf_counter() - begin
+        throughput = islands * args.population * args.generations / elapsed
+        print(f"{islands:>8}{processes:>10}{elapsed:>10.2f}{throughput:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#Iterative vs recursive DFS/DLS: time per node expansion; DFID vs frontier-resuming DFID
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DFS_DLS_DFID import Graph, SearchAlgorithms
+
+
+class CountingAdjacency:
+    """Wraps graph.graph and counts lookups, i.e. node expansions"""
+
+    def __init__(self, adjacency):
+        self.adjacency = adjacency
+        self.expansions = 0
+
+    def __getitem__(self, u):
+        self.expansions += 1
+        return self.adjacency[u]
+
+
+def count_expansions(graph, run) -> int:
+    adjacency = graph.graph
+    graph.graph = CountingAdjacency(adjacency)
+    try:
+        run()
+        return graph.graph.expansions
+    finally:
+        graph.graph = adjacency
+
+
+def best_time(run, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare iterative and recursive DFS/DLS/DFID")
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--dfs-nodes", type=int, default=20_000)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--branching", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # let the recursive reference versions go as deep as the DFS graphs need
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.dfs_nodes + 1000))
+    rng = random.Random(args.seed)
+    random_graph = Graph(args.nodes)
+    for _ in range(args.edges):
+        random_graph.add_edge(rng.randrange(args.nodes), rng.randrange(args.nodes), rng.randint(1, 9))
+    dfs_graph = Graph(args.dfs_nodes)
+    for _ in range(args.dfs_nodes * 4):
+        dfs_graph.add_edge(rng.randrange(args.dfs_nodes), rng.randrange(args.dfs_nodes), rng.randint(1, 9))
+    chain = Graph(args.dfs_nodes)
+    for i in range(args.dfs_nodes - 1):
+        chain.add_edge(i, i + 1, 1)
+
+    searcher = SearchAlgorithms()
+    missing = args.nodes  # not a node, so every search exhausts its space
+    cases = [
+        ("dfs random", dfs_graph, lambda g: searcher.dfs(g, 0, missing), lambda g: searcher.dfs_recursive(g, 0, missing)),
+        ("dfs chain", chain, lambda g: searcher.dfs(g, 0, missing), lambda g: searcher.dfs_recursive(g, 0, missing)),
+        ("dls random", random_graph, lambda g: searcher.dls(g, 0, missing, args.depth), lambda g: searcher.dls_recursive(g, 0, missing, args.depth)),
+    ]
+
+    print(f"{'case':<12}{'expansions':>12}{'recursive ns':>14}{'iterative ns':>14}{'speedup':>9}")
+    for name, graph, iterative, recursive in cases:
+        expansions = count_expansions(graph, lambda: iterative(graph))
+        assert expansions == count_expansions(graph, lambda: recursive(graph))
+        slow = best_time(lambda: recursive(graph), args.repeat) / expansions * 1e9
+        fast = best_time(lambda: iterative(graph), args.repeat) / expansions * 1e9
+        print(f"{name:<12}{expansions:>12}{slow:>14.0f}{fast:>14.0f}{slow / fast:>8.2f}x")
+
+    branching = Graph(args.nodes)
+    for u in range(args.nodes):
+        for _ in range(args.branching):
+            branching.add_edge(u, rng.randrange(args.nodes), rng.randint(1, 9))
+    print(f"\nDFID to depth {args.depth} on a {args.branching}-way branching graph (target unreachable)")
+    print(f"{'mode':<16}{'expansions':>12}{'seconds':>10}")
+    for name, run in (("dfid", lambda: searcher.dfid(branching, 0, missing, args.depth)),
+                      ("dfid_frontier", lambda: searcher.dfid_frontier(branching, 0, missing, args.depth))):
+        expansions = count_expansions(branching, run)
+        print(f"{name:<16}{expansions:>12}{best_time(run, 1):>10.2f}")
+
+    start = time.perf_counter()
+    long_chain = Graph(1_000_000)
+    for i in range(999_999):
+        long_chain.add_edge(i, i + 1, 1)
+    path, _ = searcher.dls(long_chain, 0, 999_999, 1_000_000)
+    print(f"\ndls over a 1,000,000 node chain: path of {len(path)} nodes "
+          f"in {time.perf_counter() - start:.1f}s (recursive version raises RecursionError)")
+
+
+if __name__ == "__main__":
+    main()
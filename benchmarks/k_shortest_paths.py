@@ -0,0 +1,48 @@
+#Lazy k-shortest paths: time until the first k paths come out of the generator
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BFS_UCS import Graph
+from K_Shortest_Paths import k_shortest_paths
+
+
+def grid_graph(side: int, seed: int) -> Graph:
+    """side x side grid, both edge directions, integer weights 1-10"""
+    rng = random.Random(seed)
+    graph = Graph(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                graph.add_edge(node, node + 1, rng.randint(1, 10))
+                graph.add_edge(node + 1, node, rng.randint(1, 10))
+            if row + 1 < side:
+                graph.add_edge(node, node + side, rng.randint(1, 10))
+                graph.add_edge(node + side, node, rng.randint(1, 10))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the lazy k-shortest-paths generator")
+    parser.add_argument("--side", type=int, default=30)
+    parser.add_argument("--paths", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = grid_graph(args.side, args.seed)
+    start, target = 0, args.side * args.side - 1
+    print(f"{graph.num_nodes} nodes, {start} -> {target}")
+    print(f"{'k':>4}{'cost':>8}{'ms so far':>12}")
+    begin = time.perf_counter()
+    for k, (path, total_weight) in enumerate(k_shortest_paths(graph, start, target, args.paths), 1):
+        elapsed = (time.perf_counter() - begin) * 1000
+        print(f"{k:>4}{total_weight:>8g}{elapsed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#Path_Service.py under load: throughput and latency for many concurrent clients
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CSR_Graph import CSRGraphBuilder
+from Graph_IO import load_snapshot, save_snapshot
+from Path_Service import PathClient, PathService, percentiles
+
+
+def grid(side: int, seed: int):
+    """4-neighbour grid with weights 1-9"""
+    rng = random.Random(seed)
+    builder = CSRGraphBuilder(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            for other in (node - 1 if col else None, node + 1 if col + 1 < side else None,
+                          node - side if row else None, node + side if row + 1 < side else None):
+                if other is not None:
+                    builder.add_edge(node, other, rng.randint(1, 9))
+    return builder.build()
+
+
+async def client(connect, pool, requests: int, algorithm: str, seed: int, latencies: list):
+    """One connection sending requests queries one after another, picked from pool"""
+    rng = random.Random(seed)
+    connection = await connect()
+    try:
+        for _ in range(requests):
+            start, target = rng.choice(pool)
+            begin = time.perf_counter()
+            await connection.query(algorithm, start, target)
+            latencies.append(time.perf_counter() - begin)
+    finally:
+        await connection.close()
+
+
+async def check_costs(graph, pairs):
+    """Served from a snapshot saved without heuristics, astar must still find the costs ucs does"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "grid.csrg")
+        save_snapshot(graph, path)
+        snapshot = load_snapshot(path)
+        assert snapshot.heuristics is None
+        async with PathService(snapshot, processes=0) as service:
+            for start, target in pairs:
+                _, astar_weight = await service.query("astar", start, target)
+                _, ucs_weight = await service.query("ucs", start, target)
+                if astar_weight != ucs_weight:
+                    raise AssertionError(f"astar {start}->{target} cost {astar_weight}, ucs {ucs_weight}")
+
+
+async def measure(graph, args, clients: int, pool) -> dict:
+    async with PathService(graph, processes=args.processes, max_pending=args.max_pending) as service:
+        if args.unix:
+            directory = tempfile.mkdtemp()
+            path = os.path.join(directory, "paths.sock")
+            await service.listen(path=path)
+            connect = lambda: PathClient.connect(path=path)
+        else:
+            server = await service.listen()
+            port = server.sockets[0].getsockname()[1]
+            connect = lambda: PathClient.connect(port=port)
+        latencies = []
+        begin = time.perf_counter()
+        await asyncio.gather(*(client(connect, pool, args.requests, args.algorithm, args.seed + index, latencies)
+                               for index in range(clients)))
+        seconds = time.perf_counter() - begin
+        report = service.report()
+    if args.unix:
+        os.remove(path)
+        os.rmdir(directory)
+    return {"seconds": seconds, "latency": percentiles(latencies), **report}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the path service with concurrent clients")
+    parser.add_argument("--side", type=int, default=100, help="grid side; the grid has side * side nodes")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--requests", type=int, default=20, help="queries per client")
+    parser.add_argument("--hot", type=int, default=50, help="distinct (start, target) pairs clients pick from; "
+                                                           "fewer means more identical queries to coalesce")
+    parser.add_argument("--algorithm", default="ucs", choices=["bfs", "ucs", "astar", "dfid"])
+    parser.add_argument("--processes", type=int, default=None, help="search processes (0: one thread)")
+    parser.add_argument("--max-pending", type=int, default=1024)
+    parser.add_argument("--unix", action="store_true", help="connect over a Unix socket instead of TCP")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = grid(args.side, args.seed)
+    rng = random.Random(args.seed)
+    pool = [(rng.randrange(graph.num_nodes), rng.randrange(graph.num_nodes)) for _ in range(args.hot)]
+    asyncio.run(check_costs(graph, pool[:10]))
+    print(f"{args.algorithm} on a {args.side}x{args.side} grid, {args.requests} queries per client "
+          f"from {args.hot} hot pairs, {'Unix socket' if args.unix else 'TCP'}")
+    print(f"{'clients':>8}{'req/s':>9}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'computed':>10}{'coalesced':>11}")
+    for clients in args.clients:
+        result = asyncio.run(measure(graph, args, clients, pool))
+        latency = result["latency"]
+        total = clients * args.requests
+        print(f"{clients:>8}{total / result['seconds']:>9.0f}{latency['p50'] * 1e3:>9.1f}"
+              f"{latency['p90'] * 1e3:>9.1f}{latency['p99'] * 1e3:>9.1f}"
+              f"{result['computed']:>10}{result['coalesced']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#Priority queue comparison for UCS: queue size, stale pops and wall time per QueueType
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BFS_UCS import SearchAlgorithms, SearchType
+from CSR_Graph import CSRGraphBuilder
+from Priority_Queues import QueueType
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare UCS priority queues on a dense graph")
+    parser.add_argument("--nodes", type=int, default=3_000)
+    parser.add_argument("--degree", type=int, default=100)
+    parser.add_argument("--max-weight", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    builder = CSRGraphBuilder(args.nodes)
+    for u in range(args.nodes):
+        for _ in range(args.degree):
+            builder.add_edge(u, rng.randrange(args.nodes), rng.randint(1, args.max_weight))
+    graph = builder.build()
+    # unreachable target, so every query settles the whole graph
+    queries = [(rng.randrange(args.nodes), args.nodes) for _ in range(args.queries)]
+
+    print(f"{args.nodes} nodes, {graph.num_edges} edges, integer weights 1-{args.max_weight}")
+    print(f"{'queue':<16}{'ms/query':>10}{'max size':>10}{'pushes':>10}{'stale pops':>12}")
+    searcher = SearchAlgorithms()
+    for queue_type in (None, *QueueType):
+        start = time.perf_counter()
+        max_size = pushes = stale_pops = 0
+        for s, t in queries:
+            searcher.search(SearchType.UCS, graph, s, t, queue_type=queue_type)
+            if queue_type is not None:
+                max_size += searcher.queue.max_size
+                pushes += searcher.queue.pushes
+                stale_pops += searcher.queue.stale_pops
+        elapsed = (time.perf_counter() - start) * 1000 / len(queries)
+        name = "inline heapq" if queue_type is None else queue_type.value
+        if queue_type is None:
+            print(f"{name:<16}{elapsed:>10.1f}{'-':>10}{'-':>10}{'-':>12}")
+        else:
+            print(f"{name:<16}{elapsed:>10.1f}{max_size // len(queries):>10}{pushes // len(queries):>10}"
+                  f"{stale_pops // len(queries):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#Cost of SearchStats: search time with stats off, on, and on with profiler hooks
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from array import array
+
+
+def grid(side: int, seed: int):
+    """4-neighbour grid with weights 1-9 and the Manhattan distance to the far corner as heuristic"""
+    from CSR_Graph import CSRGraphBuilder, WEIGHT_TYPECODE
+    rng = random.Random(seed)
+    builder = CSRGraphBuilder(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            for other in (node - 1 if col else None, node + 1 if col + 1 < side else None,
+                          node - side if row else None, node + side if row + 1 < side else None):
+                if other is not None:
+                    builder.add_edge(node, other, rng.randint(1, 9))
+    graph = builder.build()
+    graph.heuristics = array(WEIGHT_TYPECODE, (2 * side - 2 - node // side - node % side
+                                               for node in range(side * side)))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the overhead of search statistics and hooks")
+    parser.add_argument("--side", type=int, default=300, help="grid side; the grid has side * side nodes")
+    parser.add_argument("--depth", type=int, default=10, help="DLS depth limit (DFID goes one less)")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repo", help="import the searches from this checkout instead, e.g. a git worktree "
+                                       "of an older commit, to compare its timings with the 'off' row here")
+    args = parser.parse_args()
+    # imported here so --repo decides which checkout they come from
+    sys.path.insert(0, args.repo or os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import BFS_UCS
+    import DFS_DLS_DFID
+    import GBFS_Astar
+    try:
+        from Search_Stats import SearchStats
+    except ImportError:
+        SearchStats = None
+
+    graph = grid(args.side, args.seed)
+    corner = args.side * args.side - 1
+    missing = args.side * args.side  # not a node, so the search exhausts its space
+    cases = [
+        ("bfs", BFS_UCS.SearchAlgorithms, lambda s: s.bfs(graph, 0, corner)),
+        ("ucs", BFS_UCS.SearchAlgorithms, lambda s: s.ucs(graph, 0, corner)),
+        ("astar", GBFS_Astar.SearchAlgorithms, lambda s: s.astar(graph, 0, corner)),
+        ("gbfs", GBFS_Astar.SearchAlgorithms, lambda s: s.gbfs(graph, 0, corner)),
+        ("dfs", DFS_DLS_DFID.SearchAlgorithms, lambda s: s.dfs(graph, 0, missing)),
+        ("dls", DFS_DLS_DFID.SearchAlgorithms, lambda s: s.dls(graph, 0, missing, args.depth)),
+        ("dfid", DFS_DLS_DFID.SearchAlgorithms, lambda s: s.dfid(graph, 0, missing, args.depth - 1)),
+    ]
+
+    def hook(*_):
+        pass
+
+    print(f"{args.side}x{args.side} grid, best of {args.repeat}")
+    print(f"{'search':<8}{'expanded':>10}{'off ms':>9}{'stats ms':>10}{'hooks ms':>10}{'stats':>8}{'hooks':>8}")
+    for name, searcher_class, run in cases:
+        searchers = {"off": searcher_class()}
+        if SearchStats is not None:
+            searchers["stats"] = searcher_class(stats=SearchStats())
+            searchers["hooks"] = searcher_class(stats=SearchStats(on_expand=hook, on_relax=hook))
+        best = dict.fromkeys(searchers, float("inf"))
+        # interleave the modes so drift in machine speed hits them all alike; like timeit,
+        # keep the collector out of the timings
+        for _ in range(args.repeat):
+            for mode, searcher in searchers.items():
+                gc.collect()
+                gc.disable()
+                start = time.perf_counter()
+                run(searcher)
+                best[mode] = min(best[mode], time.perf_counter() - start)
+                gc.enable()
+        if SearchStats is None:
+            print(f"{name:<8}{'-':>10}{best['off'] * 1e3:>9.1f}")
+            continue
+        print(f"{name:<8}{searchers['stats'].stats.expanded:>10}{best['off'] * 1e3:>9.1f}"
+              f"{best['stats'] * 1e3:>10.1f}{best['hooks'] * 1e3:>10.1f}"
+              f"{best['stats'] / best['off'] - 1:>+8.1%}{best['hooks'] / best['off'] - 1:>+8.1%}")
+
+
+if __name__ == "__main__":
+    main()
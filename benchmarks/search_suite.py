@@ -0,0 +1,318 @@
+#Benchmark suite: the seven searches on seeded synthetic graphs, JSON results and regression checks
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BFS_UCS
+import DFS_DLS_DFID
+import GBFS_Astar
+from CSR_Graph import CSRGraph, CSRGraphBuilder, WEIGHT_TYPECODE
+
+SUITE_VERSION = 1
+GRAPHS = ["grid", "sparse", "dense", "scale_free", "chain"]
+ALGORITHMS = ["bfs", "ucs", "dfs", "dls", "dfid", "gbfs", "astar"]
+
+
+class CountingAdjacency:
+    """graph.graph wrapper that counts lookups; every search looks a node up once per expansion"""
+
+    def __init__(self, adjacency):
+        self.adjacency = adjacency
+        self.count = 0
+
+    def __getitem__(self, u: int):
+        self.count += 1
+        return self.adjacency[u]
+
+    def __contains__(self, u: int) -> bool:
+        return u in self.adjacency
+
+    def __len__(self) -> int:
+        return len(self.adjacency)
+
+    def __iter__(self):
+        return iter(self.adjacency)
+
+
+class CountingGraph:
+    """The wrapped graph with graph.graph swapped for a CountingAdjacency"""
+
+    def __init__(self, graph):
+        self.wrapped = graph
+        self.graph = CountingAdjacency(graph.graph)
+
+    def __getattr__(self, name: str):
+        return getattr(self.wrapped, name)
+
+
+class Workload:
+    """One generated graph with its query and the Euclidean heuristic table for its target"""
+
+    def __init__(self, kind: str, graph: CSRGraph, start: int, target: int):
+        self.kind = kind
+        self.graph = graph
+        self.start = start
+        self.target = target
+
+
+def _build(kind: str, coordinates: List[Tuple[float, float]], edges: List[Tuple[int, int]],
+           rng: random.Random, target: int, integer_weights: bool = False) -> Workload:
+    """Pack edges into a CSR graph. Weights are at least the Euclidean edge length, so the
+    straight-line distance to the target is an admissible, consistent heuristic.
+    """
+    builder = CSRGraphBuilder(len(coordinates))
+    for u, v in edges:
+        length = math.dist(coordinates[u], coordinates[v])
+        weight = rng.randint(1, 10) * length if integer_weights else length * (1.0 + rng.random())
+        builder.add_edge(u, v, weight)
+    graph = builder.build()
+    tx, ty = coordinates[target]
+    graph.heuristics = array(WEIGHT_TYPECODE, (math.hypot(x - tx, y - ty) for x, y in coordinates))
+    return Workload(kind, graph, 0, target)
+
+
+def grid_graph(num_edges: int, seed: int) -> Workload:
+    """side x side 4-neighbour grid, both directions, integer weights 1-10; corner to corner"""
+    rng = random.Random(seed)
+    side = max(2, round(math.sqrt(num_edges / 4)))
+    coordinates = [(float(col), float(row)) for row in range(side) for col in range(side)]
+    edges = []
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                edges += [(node, node + 1), (node + 1, node)]
+            if row + 1 < side:
+                edges += [(node, node + side), (node + side, node)]
+    return _build("grid", coordinates, edges, rng, side * side - 1, integer_weights=True)
+
+
+def _random_points(count: int, rng: random.Random) -> List[Tuple[float, float]]:
+    return [(rng.random() * 1000, rng.random() * 1000) for _ in range(count)]
+
+
+def random_graph(num_edges: int, seed: int, dense: bool = False) -> Workload:
+    """Uniform random directed edges: average out-degree 4 (sparse) or about sqrt(edges) / 2 (dense)"""
+    rng = random.Random(seed)
+    num_nodes = max(2, math.isqrt(4 * num_edges) if dense else num_edges // 4)
+    coordinates = _random_points(num_nodes, rng)
+    edges = [(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(num_edges)]
+    edges.sort()
+    return _build("dense" if dense else "sparse", coordinates, edges, rng, rng.randrange(num_nodes))
+
+
+def scale_free_graph(num_edges: int, seed: int, links: int = 3) -> Workload:
+    """Barabasi-Albert preferential attachment, each new node linking to `links` others both ways"""
+    rng = random.Random(seed)
+    num_nodes = max(links + 1, num_edges // (2 * links))
+    coordinates = _random_points(num_nodes, rng)
+    # every node appears here once per edge end, so a uniform pick is degree-proportional
+    ends = list(range(links))
+    edges = []
+    for node in range(links, num_nodes):
+        chosen = set()
+        while len(chosen) < links:
+            chosen.add(rng.choice(ends))
+        for other in chosen:
+            edges += [(node, other), (other, node)]
+            ends += [node, other]
+    edges.sort()
+    return _build("scale_free", coordinates, edges, rng, rng.randrange(num_nodes))
+
+
+def chain_graph(num_edges: int, seed: int) -> Workload:
+    """A single path walked both ways, from one end to the other"""
+    rng = random.Random(seed)
+    num_nodes = max(2, num_edges // 2 + 1)
+    coordinates = [(float(i), rng.random()) for i in range(num_nodes)]
+    edges = []
+    for node in range(num_nodes - 1):
+        edges += [(node, node + 1), (node + 1, node)]
+    edges.sort()
+    return _build("chain", coordinates, edges, rng, num_nodes - 1)
+
+
+GENERATORS: Dict[str, Callable[[int, int], Workload]] = {
+    "grid": grid_graph,
+    "sparse": random_graph,
+    "dense": lambda num_edges, seed: random_graph(num_edges, seed, dense=True),
+    "scale_free": scale_free_graph,
+    "chain": chain_graph,
+}
+
+
+def run_search(algorithm: str, graph, start: int, target: int, depth_limit: int, max_depth: int):
+    """One search through the module's SearchAlgorithms.search entry point"""
+    match algorithm:
+        case "bfs" | "ucs":
+            return BFS_UCS.SearchAlgorithms().search(BFS_UCS.SearchType(algorithm), graph, start, target)
+        case "dfs":
+            return DFS_DLS_DFID.SearchAlgorithms().search(DFS_DLS_DFID.SearchType.DFS, graph, start, target)
+        case "dls":
+            return DFS_DLS_DFID.SearchAlgorithms().search(DFS_DLS_DFID.SearchType.DLS, graph, start, target,
+                                                          depth_limit=depth_limit)
+        case "dfid":
+            return DFS_DLS_DFID.SearchAlgorithms().search(DFS_DLS_DFID.SearchType.DFID, graph, start, target,
+                                                          max_depth=max_depth)
+        case "gbfs" | "astar":
+            return GBFS_Astar.SearchAlgorithms().search(GBFS_Astar.SearchType(algorithm), graph, start, target)
+        case _:
+            raise ValueError(f"Unknown algorithm {algorithm}")
+
+
+def _resident_kb() -> int:
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(connection, algorithm: str, workload: Workload, depth_limit: int, max_depth: int):
+    """Child process body: a forked child starts with the graph already in memory and a fresh peak RSS"""
+    try:
+        counting = CountingGraph(workload.graph)
+        resident = _resident_kb()
+        begin = time.perf_counter()
+        path, total_weight = run_search(algorithm, counting, workload.start, workload.target,
+                                        depth_limit, max_depth)
+        seconds = time.perf_counter() - begin
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        connection.send({"status": "ok", "seconds": seconds, "peak_rss_kb": peak,
+                         "rss_growth_kb": max(0, peak - resident), "expanded": counting.graph.count,
+                         "found": bool(path), "cost": total_weight if path else None})
+    except Exception as error:
+        connection.send({"status": "error", "error": repr(error)})
+    finally:
+        connection.close()
+
+
+def measure(algorithm: str, workload: Workload, depth_limit: int, max_depth: int, timeout: float) -> dict:
+    """Run one search in its own forked process, so each gets its own peak RSS and can be timed out"""
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure, args=(sender, algorithm, workload, depth_limit, max_depth))
+    process.start()
+    sender.close()
+    if receiver.poll(timeout):
+        result = receiver.recv()
+    else:
+        process.terminate()
+        result = {"status": "timeout", "seconds": timeout}
+    process.join()
+    receiver.close()
+    return result
+
+
+def run_suite(args) -> dict:
+    results = []
+    for kind in args.graphs:
+        for size in args.sizes:
+            begin = time.perf_counter()
+            workload = GENERATORS[kind](size, args.seed)
+            graph = workload.graph
+            print(f"{kind} {graph.num_nodes} nodes / {graph.num_edges} edges "
+                  f"(generated in {time.perf_counter() - begin:.1f}s)", file=sys.stderr)
+            for algorithm in args.algorithms:
+                runs = [measure(algorithm, workload, args.depth_limit, args.max_depth, args.timeout)
+                        for _ in range(args.repeat)]
+                best = min(runs, key=lambda run: run.get("seconds", math.inf))
+                entry = {"graph": kind, "size": size, "nodes": graph.num_nodes, "edges": graph.num_edges,
+                         "algorithm": algorithm, **best}
+                results.append(entry)
+                detail = f"{best['seconds'] * 1000:.1f} ms" if "seconds" in best else best.get("error", "")
+                print(f"  {algorithm:<6} {best['status']:<8} {detail} expanded={best.get('expanded', '-')}",
+                      file=sys.stderr)
+            del workload, graph
+    return {"suite_version": SUITE_VERSION, "python": platform.python_version(), "platform": platform.platform(),
+            "seed": args.seed, "depth_limit": args.depth_limit, "max_depth": args.max_depth, "results": results}
+
+
+def _key(entry: dict) -> Tuple[str, int, str]:
+    return entry["graph"], entry["size"], entry["algorithm"]
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_seconds: float) -> List[str]:
+    """Regressions of current against baseline: slower or bigger by more than threshold, or different results.
+
+    Runs faster than min_seconds in both files are too noisy to compare on time.
+    """
+    if (baseline.get("seed"), baseline.get("depth_limit"), baseline.get("max_depth")) != \
+            (current.get("seed"), current.get("depth_limit"), current.get("max_depth")):
+        return ["baseline was run with a different seed or depth settings; results are not comparable"]
+    old = {_key(entry): entry for entry in baseline["results"]}
+    problems = []
+    for entry in current["results"]:
+        before = old.get(_key(entry))
+        if before is None:
+            continue
+        name = "{} {} {}".format(*_key(entry))
+        if before["status"] == "ok" and entry["status"] != "ok":
+            problems.append(f"{name}: {entry['status']} (baseline ok)")
+            continue
+        if entry["status"] != "ok" or before["status"] != "ok":
+            continue
+        if max(before["seconds"], entry["seconds"]) >= min_seconds and \
+                entry["seconds"] > before["seconds"] * (1 + threshold):
+            problems.append(f"{name}: {entry['seconds'] * 1000:.1f} ms vs {before['seconds'] * 1000:.1f} ms")
+        if entry["rss_growth_kb"] > before["rss_growth_kb"] * (1 + threshold) + 1024:
+            problems.append(f"{name}: RSS growth {entry['rss_growth_kb']} KiB vs {before['rss_growth_kb']} KiB")
+        if entry["expanded"] != before["expanded"] or entry["found"] != before["found"]:
+            problems.append(f"{name}: expanded {entry['expanded']} nodes (found={entry['found']}) "
+                            f"vs {before['expanded']} (found={before['found']})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BFS, UCS, DFS, DLS, DFID, GBFS and A* on synthetic graphs")
+    parser.add_argument("--graphs", nargs="+", choices=GRAPHS, default=GRAPHS)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="approximate edge counts (up to 10_000_000)")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=ALGORITHMS)
+    parser.add_argument("--depth-limit", type=int, default=12, help="DLS depth limit")
+    parser.add_argument("--max-depth", type=int, default=8, help="DFID maximum depth")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per search; the fastest is kept")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds before a run is abandoned")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against this results file")
+    parser.add_argument("--current", metavar="RESULTS", help="compare this results file instead of running")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown or growth")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="ignore timing of runs faster than this")
+    args = parser.parse_args()
+
+    if args.current:
+        with open(args.current) as handle:
+            current = json.load(handle)
+    else:
+        current = run_suite(args)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(current, handle, indent=1)
+    else:
+        json.dump(current, sys.stdout, indent=1)
+        print()
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        problems = compare(baseline, current, args.threshold, args.min_seconds)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        print(f"{len(problems)} regressions against {args.compare}", file=sys.stderr)
+        sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#Query loop throughput with and without a reusable SearchWorkspace
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BFS_UCS
+import DFS_DLS_DFID
+import GBFS_Astar
+from CSR_Graph import CSRGraphBuilder, WEIGHT_TYPECODE
+from Search_Workspace import SearchWorkspace
+
+
+def grid(side: int, seed: int):
+    """4-neighbour grid with weights 1-9; heuristics are filled in per query"""
+    rng = random.Random(seed)
+    builder = CSRGraphBuilder(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            for other in (node - 1 if col else None, node + 1 if col + 1 < side else None,
+                          node - side if row else None, node + side if row + 1 < side else None):
+                if other is not None:
+                    builder.add_edge(node, other, rng.randint(1, 9))
+    graph = builder.build()
+    graph.heuristics = array(WEIGHT_TYPECODE, bytes(8 * side * side))
+    return graph
+
+
+def queries(side: int, hops: int, count: int, seed: int):
+    """count (start, target) pairs about hops grid steps apart"""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        row, col = rng.randrange(side), rng.randrange(side)
+        down = rng.randint(0, hops)
+        pairs.append((row * side + col,
+                      min(row + down, side - 1) * side + min(col + hops - down, side - 1)))
+    return pairs
+
+
+def run(pairs, search) -> tuple:
+    """Seconds for the whole query loop and the garbage collections it triggered"""
+    gc.collect()
+    before = sum(generation["collections"] for generation in gc.get_stats())
+    start = time.perf_counter()
+    for source, target in pairs:
+        search(source, target)
+    seconds = time.perf_counter() - start
+    return seconds, sum(generation["collections"] for generation in gc.get_stats()) - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Many small queries on a big graph, with and without a workspace")
+    parser.add_argument("--side", type=int, default=500, help="grid side; the grid has side * side nodes")
+    parser.add_argument("--hops", type=int, default=20, help="grid distance between start and target")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3, help="rounds of the query loop; the fastest counts")
+    parser.add_argument("--max-depth", type=int, default=7, help="DFID maximum depth")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = grid(args.side, args.seed)
+    pairs = queries(args.side, args.hops, args.queries, args.seed)
+    workspace = SearchWorkspace(graph.num_nodes)
+    plain = {module: module.SearchAlgorithms() for module in (BFS_UCS, DFS_DLS_DFID, GBFS_Astar)}
+    reused = {module: module.SearchAlgorithms(workspace=workspace) for module in plain}
+    cases = [
+        ("bfs", lambda s: lambda u, v: s[BFS_UCS].bfs(graph, u, v)),
+        ("ucs", lambda s: lambda u, v: s[BFS_UCS].ucs(graph, u, v)),
+        ("astar", lambda s: lambda u, v: s[GBFS_Astar].astar(graph, u, v)),
+        ("dfid", lambda s: lambda u, v: s[DFS_DLS_DFID].dfid(graph, u, v, args.max_depth)),
+    ]
+
+    print(f"{args.queries} queries {args.hops} hops apart on a {args.side}x{args.side} grid")
+    print(f"{'search':<8}{'fresh q/s':>11}{'workspace q/s':>15}{'speedup':>9}{'fresh GCs':>11}{'workspace GCs':>15}")
+    for name, make in cases:
+        for searchers in (plain, reused):
+            # check both agree before timing
+            assert make(searchers)(*pairs[0]) == make(plain)(*pairs[0])
+        fresh, kept = float("inf"), float("inf")
+        for _ in range(args.repeat):
+            seconds, fresh_gcs = run(pairs, make(plain))
+            fresh = min(fresh, seconds)
+            seconds, kept_gcs = run(pairs, make(reused))
+            kept = min(kept, seconds)
+        print(f"{name:<8}{args.queries / fresh:>11.0f}{args.queries / kept:>15.0f}{fresh / kept:>8.2f}x"
+              f"{fresh_gcs:>11}{kept_gcs:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#Vectorized BFS vs deque BFS on large random graphs (needs NumPy)
+import argparse
+import os
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from BFS_UCS import SearchAlgorithms, SearchType
+from CSR_Graph import CSRGraph
+
+
+def random_csr(num_nodes: int, num_edges: int, seed: int) -> CSRGraph:
+    """Random graph built directly as CSR arrays, so generation is not the bottleneck"""
+    rng = np.random.default_rng(seed)
+    sources = np.sort(rng.integers(0, num_nodes, num_edges))
+    targets = rng.integers(0, num_nodes, num_edges).astype(np.int32)
+    weights = rng.random(num_edges) * 10
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+    packed = []
+    for typecode, data in (("q", offsets), ("i", targets), ("d", weights)):
+        buffer = array(typecode)
+        buffer.frombytes(data.tobytes())
+        packed.append(buffer)
+    return CSRGraph(num_nodes, *packed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare SearchType.BFS and SearchType.BFS_VECTOR")
+    parser.add_argument("--nodes", type=int, default=2_000_000)
+    parser.add_argument("--degree", type=float, default=5.0)
+    parser.add_argument("--queries", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = random_csr(args.nodes, int(args.nodes * args.degree), args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    searcher = SearchAlgorithms()
+    searcher.search(SearchType.BFS_VECTOR, graph, 0, 1)  # builds the cached reverse index once
+
+    print(f"{args.nodes} nodes, {graph.num_edges} edges")
+    print(f"{'query':<24}{'hops':>6}{'deque s':>10}{'vector s':>10}{'speedup':>9}")
+    for _ in range(args.queries):
+        start, target = (int(x) for x in rng.integers(0, args.nodes, 2))
+        timings = []
+        results = []
+        for search_type in (SearchType.BFS, SearchType.BFS_VECTOR):
+            begin = time.perf_counter()
+            results.append(searcher.search(search_type, graph, start, target))
+            timings.append(time.perf_counter() - begin)
+        assert results[0] == results[1]
+        hops = len(results[0][0]) - 1 if results[0][0] else -1
+        print(f"{f'{start} -> {target}':<24}{hops:>6}{timings[0]:>10.2f}{timings[1]:>10.2f}"
+              f"{timings[0] / timings[1]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()